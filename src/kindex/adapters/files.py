@@ -12,12 +12,18 @@ if TYPE_CHECKING:
 
 
 def sha256_file(filepath: str | Path) -> str:
-    """Compute SHA-256 hash of a file."""
-    h = hashlib.sha256()
+    """Compute SHA-256 hash of a file.
+
+    Uses hashlib.file_digest (3.11+), which feeds OpenSSL straight from the
+    file without a Python-level read loop.
+    """
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 16), b""):
             h.update(chunk)
-    return h.hexdigest()
+        return h.hexdigest()
 
 
 def scan_registered_files(store: "Store", verbose: bool = False) -> int:
@@ -25,10 +31,11 @@ def scan_registered_files(store: "Store", verbose: bool = False) -> int:
 
     For each node with extra.file_paths:
     - Check if files exist
-    - Compute SHA-256 hash
+    - Skip files whose (mtime_ns, size) match extra.file_stats
+    - Otherwise compute SHA-256 hash
     - Compare with stored hash (extra.file_hashes)
     - If changed, update node content with file excerpt
-    - Update stored hash
+    - Update stored hash and stat
 
     Returns count of nodes updated.
     """
@@ -42,16 +49,25 @@ def scan_registered_files(store: "Store", verbose: bool = False) -> int:
             continue
 
         hashes = extra.get("file_hashes", {})
-        changed = False
+        stats = extra.get("file_stats", {})
+        changed = restat = False
         new_content_parts = []
 
         for path_str in paths:
             path = Path(path_str)
-            if not path.exists():
+            try:
+                st = path.stat()
+            except OSError:
                 if verbose:
                     print(f"  Missing: {path_str} (referenced by {node['title']})")
                 continue
 
+            stat_key = [st.st_mtime_ns, st.st_size]
+            if stats.get(path_str) == stat_key and path_str in hashes:
+                continue  # untouched since last hashed: skip the read
+            stats[path_str] = stat_key
+            restat = True
+
             current_hash = sha256_file(path)
             stored_hash = hashes.get(path_str, "")
 
@@ -71,6 +87,7 @@ def scan_registered_files(store: "Store", verbose: bool = False) -> int:
 
         if changed:
             extra["file_hashes"] = hashes
+            extra["file_stats"] = stats
             updates = {"extra": extra}
             if new_content_parts:
                 # Append file content to node
@@ -83,6 +100,11 @@ def scan_registered_files(store: "Store", verbose: bool = False) -> int:
 
             store.update_node(node["id"], **updates)
             count += 1
+        elif restat:
+            # Touched but identical: remember the new stat so the next scan
+            # doesn't hash it again. Not counted as an update.
+            extra["file_stats"] = stats
+            store.update_node(node["id"], extra=extra)
 
     return count
 
@@ -132,6 +154,7 @@ def ingest_directory(store: "Store", directory: str | Path,
         title = path.stem.replace("-", " ").replace("_", " ").title()
 
         file_hash = sha256_file(path)
+        st = path.stat()
 
         store.add_node(
             node_id=node_id,
@@ -140,7 +163,8 @@ def ingest_directory(store: "Store", directory: str | Path,
             node_type="document",
             prov_source=str(path),
             prov_activity="file-ingest",
-            extra={"file_paths": [str(path)], "file_hashes": {str(path): file_hash}},
+            extra={"file_paths": [str(path)], "file_hashes": {str(path): file_hash},
+                   "file_stats": {str(path): [st.st_mtime_ns, st.st_size]}},
         )
         count += 1
         if verbose:
@@ -2,6 +2,7 @@
 
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -10,6 +11,15 @@ from .base import AdapterMeta, AdapterOption, IngestResult
 if TYPE_CHECKING:
     from ..store import Store
 
+try:  # optional speedup: pip install kindex[speedups]
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# gh --json output for a large repo runs to megabytes; orjson parses it
+# several times faster. Its JSONDecodeError subclasses json's.
+_jloads = _orjson.loads if _orjson is not None else json.loads
+
 
 def is_gh_available() -> bool:
     """Check if gh CLI is installed and authenticated."""
@@ -21,6 +31,33 @@ def is_gh_available() -> bool:
         return False
 
 
+def _gh_json(cmd: list[str]) -> list | None:
+    """Run a gh command and parse its JSON output; None if gh failed."""
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    if result.returncode != 0:
+        return None
+    return _jloads(result.stdout)
+
+
+def _issues_cmd(repo: str, limit: int) -> list[str]:
+    return ["gh", "issue", "list", "--repo", repo, "--json",
+            "number,title,body,state,labels,author,createdAt,url",
+            "--limit", str(limit)]
+
+
+def _prs_cmd(repo: str, limit: int) -> list[str]:
+    return ["gh", "pr", "list", "--repo", repo, "--json",
+            "number,title,body,state,labels,author,createdAt,url,mergedAt",
+            "--limit", str(limit), "--state", "all"]
+
+
+def _commits_cmd(repo: str, limit: int, since: str | None) -> list[str]:
+    url = f"repos/{repo}/commits?per_page={limit}"
+    if since:
+        url += f"&since={since}"
+    return ["gh", "api", url]
+
+
 def ingest_issues(store: "Store", repo: str, since: str | None = None,
                   limit: int = 50, verbose: bool = False) -> int:
     """Ingest GitHub issues as knowledge nodes.
@@ -36,18 +73,15 @@ def ingest_issues(store: "Store", repo: str, since: str | None = None,
         - Links to project node if exists
         - Labels become domains
     """
-    cmd = ["gh", "issue", "list", "--repo", repo, "--json",
-           "number,title,body,state,labels,author,createdAt,url",
-           "--limit", str(limit)]
-    if since:
-        # gh doesn't have --since for issues, we filter in code
-        pass
-
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-    if result.returncode != 0:
+    # gh has no --since for issues; _store_issues filters by createdAt.
+    issues = _gh_json(_issues_cmd(repo, limit))
+    if issues is None:
         return 0
+    return _store_issues(store, repo, issues, since, verbose)
+
 
-    issues = json.loads(result.stdout)
+def _store_issues(store: "Store", repo: str, issues: list,
+                  since: str | None, verbose: bool) -> int:
     count = 0
 
     for issue in issues:
@@ -95,15 +129,14 @@ def ingest_issues(store: "Store", repo: str, since: str | None = None,
 def ingest_prs(store: "Store", repo: str, since: str | None = None,
                limit: int = 30, verbose: bool = False) -> int:
     """Ingest GitHub PRs as knowledge nodes."""
-    cmd = ["gh", "pr", "list", "--repo", repo, "--json",
-           "number,title,body,state,labels,author,createdAt,url,mergedAt",
-           "--limit", str(limit), "--state", "all"]
-
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-    if result.returncode != 0:
+    prs = _gh_json(_prs_cmd(repo, limit))
+    if prs is None:
         return 0
+    return _store_prs(store, repo, prs, since, verbose)
 
-    prs = json.loads(result.stdout)
+
+def _store_prs(store: "Store", repo: str, prs: list,
+               since: str | None, verbose: bool) -> int:
     count = 0
 
     for pr in prs:
@@ -151,20 +184,13 @@ def ingest_prs(store: "Store", repo: str, since: str | None = None,
 def ingest_commits(store: "Store", repo: str, since: str | None = None,
                    limit: int = 50, verbose: bool = False) -> int:
     """Ingest recent commits as session-like nodes."""
-    cmd = ["gh", "api", f"repos/{repo}/commits",
-           "--jq", ".[].sha, .[].commit.message, .[].commit.author.name, .[].commit.author.date",
-           "-q", f".[:{limit}]"]
-
-    # Use the proper API approach
-    cmd = ["gh", "api", f"repos/{repo}/commits?per_page={limit}"]
-    if since:
-        cmd[-1] += f"&since={since}"
-
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-    if result.returncode != 0:
+    commits = _gh_json(_commits_cmd(repo, limit, since))
+    if commits is None:
         return 0
+    return _store_commits(store, repo, commits, verbose)
+
 
-    commits = json.loads(result.stdout)
+def _store_commits(store: "Store", repo: str, commits: list, verbose: bool) -> int:
     count = 0
 
     for commit in commits:
@@ -255,10 +281,21 @@ class GitHubAdapter:
         repo = kwargs.get("repo")
         if not repo:
             return IngestResult(errors=["--repo required for github adapter"])
+        # The three gh calls are network-bound and independent: run them
+        # together, then write on this thread (the store's connection is
+        # not shared across threads) in a single transaction.
+        cmds = [_issues_cmd(repo, limit), _prs_cmd(repo, limit),
+                _commits_cmd(repo, limit, since)]
+        with ThreadPoolExecutor(max_workers=len(cmds)) as ex:
+            issues, prs, commits = ex.map(_gh_json, cmds)
         created = 0
-        created += ingest_issues(store, repo, since=since, limit=limit, verbose=verbose)
-        created += ingest_prs(store, repo, since=since, limit=limit, verbose=verbose)
-        created += ingest_commits(store, repo, since=since, limit=limit, verbose=verbose)
+        with store.transaction():
+            if issues is not None:
+                created += _store_issues(store, repo, issues, since, verbose)
+            if prs is not None:
+                created += _store_prs(store, repo, prs, since, verbose)
+            if commits is not None:
+                created += _store_commits(store, repo, commits, verbose)
         return IngestResult(created=created)
 
 
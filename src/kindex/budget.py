@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+import os
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -25,9 +27,12 @@ def _this_month_start() -> str:
 
 
 class BudgetLedger:
-    """Tracks LLM spend over time. Persisted as a simple YAML file.
+    """Tracks LLM spend over time.
 
-    Format:
+    New entries are appended, one JSON object per line, to a journal beside
+    ``path`` (``budget.yaml`` -> ``budget.jsonl``), so recording never
+    rewrites history. Ledgers written by older versions as a YAML file at
+    ``path`` are still read, ahead of the journal:
         entries:
           - date: "2026-02-24"
             amount: 0.003
@@ -39,23 +44,34 @@ class BudgetLedger:
 
     def __init__(self, path: Path, limits: BudgetConfig):
         self.path = path
+        self.journal_path = path.with_suffix(".jsonl")
         self.limits = limits
         self.entries: list[dict] = []
         self._load()
 
     def _load(self) -> None:
+        self.entries = []
         if self.path.exists():
             data = yaml.safe_load(self.path.read_text()) or {}
             self.entries = data.get("entries", [])
-        else:
-            self.entries = []
-
-    def _save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(yaml.dump(
-            {"entries": self.entries},
-            default_flow_style=False, sort_keys=False,
-        ))
+        if self.journal_path.exists():
+            with self.journal_path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self.entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue  # torn tail from an interrupted append
+
+    def _append(self, entry: dict) -> None:
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        line = (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+        with self.journal_path.open("a+b") as f:
+            # Start a fresh line after a torn tail so this entry stays readable.
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
 
     def record(self, amount: float, model: str = "", purpose: str = "",
                tokens_in: int = 0, tokens_out: int = 0,
@@ -83,7 +99,7 @@ class BudgetLedger:
         if cache_read_tokens:
             entry["cache_read_tokens"] = cache_read_tokens
         self.entries.append(entry)
-        self._save()
+        self._append(entry)
 
     def _spend_since(
         self,
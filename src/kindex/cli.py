@@ -235,7 +235,7 @@ def cmd_add(args):
     # Knowledge types — run extraction pipeline
     from .extract import extract
 
-    existing = [n["title"] for n in store.all_nodes(limit=200)]
+    existing = [n["title"] for n in store.list_nodes_brief(limit=200)]
     extraction = extract(content, existing, cfg, ledger)
 
     created_ids = []
@@ -345,7 +345,7 @@ def cmd_learn(args):
             content = meta.get("content", body or "")
             if isinstance(content, str) and content.strip():
                 from .extract import extract
-                existing = [n["title"] for n in store.all_nodes(limit=200)]
+                existing = [n["title"] for n in store.list_nodes_brief(limit=200)]
                 extraction = extract(content, existing, cfg, ledger)
 
                 for concept in extraction.get("concepts", []):
@@ -696,7 +696,8 @@ def cmd_migrate(args):
     from .store import Store
     from .vault import Vault
 
-    vault = Vault(cfg).load()
+    # Bodies are only read for the nodes not already in the store.
+    vault = Vault(cfg).load(bodies=False)
     store = Store(cfg)
 
     count = 0
@@ -708,7 +709,7 @@ def cmd_migrate(args):
         nid = store.add_node(
             node_id=slug,
             title=topic.title or slug,
-            content=topic.body,
+            content=vault.read_body(topic),
             node_type="concept",
             weight=topic.weight or 0.5,
             domains=topic.domains,
@@ -734,7 +735,7 @@ def cmd_migrate(args):
         store.add_node(
             node_id=slug,
             title=skill.title or slug,
-            content=skill.body,
+            content=vault.read_body(skill),
             node_type="skill",
             domains=skill.domains,
             prov_source=str(skill.path or ""),
@@ -1451,7 +1452,7 @@ def cmd_compact_hook(args):
 
     from .extract import extract
 
-    existing = [n["title"] for n in store.all_nodes(limit=200)]
+    existing = [n["title"] for n in store.list_nodes_brief(limit=200)]
     extraction = extract(text, existing, cfg, ledger)
 
     count = 0
@@ -6500,11 +6501,12 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
-def main():
+def main(argv: list[str] | None = None):
+    """Entry point for ``kin``; ``argv`` defaults to sys.argv[1:]."""
     from .store import ProfileMismatchError
 
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.version:
         print(f"kin {__version__} (Kindex)")
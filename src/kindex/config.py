@@ -73,6 +73,8 @@ class EmbeddingConfig(BaseModel):
     max_group_chunks: int = 20   # chunks sent together for contextual embedding
     reindex_max_jobs: int = 200  # cron drain cap for queued embedding work
     reindex_max_queue: int = 100000
+    quantization: str = ""       # empty/float32, or int8 (4x smaller vectors)
+    backend: str = ""            # local provider: empty/torch, onnx, onnx-int8, openvino
 
 
 class LLMConfig(BaseModel):
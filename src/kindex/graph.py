@@ -102,7 +102,7 @@ def text_search(vault: Vault, query: str, top_k: int = 10) -> list[tuple[str, fl
 
         score = 0.0
         title = (node.title or "").lower()
-        body = (node.body or "").lower()
+        body = (vault.read_body(node) or "").lower()
         domains = " ".join(getattr(node, "domains", [])).lower()
         tags = " ".join(getattr(node, "tags", [])).lower()
         slug_text = slug.replace("-", " ").lower()
@@ -393,7 +393,7 @@ def capture_session_end(
 
     from .extract import extract
 
-    existing = [n["title"] for n in store.all_nodes(limit=200)]
+    existing = [n["title"] for n in store.list_nodes_brief(limit=200)]
     extraction = extract(session_text, existing, config, ledger)
 
     count = 0
@@ -474,14 +474,13 @@ def capture_session_end(
     # Link captured nodes to active session tag
     if created_ids:
         try:
-            from .sessions import get_active_tag, link_node_to_tag
+            from .sessions import get_active_tag, link_nodes_to_tag
             import os
 
             active_tag = get_active_tag(store, project_path=os.getcwd())
             if active_tag:
                 tag_name = (active_tag.get("extra") or {}).get("tag", active_tag["title"])
-                for nid in created_ids:
-                    link_node_to_tag(store, tag_name, nid)
+                link_nodes_to_tag(store, tag_name, created_ids)
         except Exception:
             pass  # Don't break session end capture
 
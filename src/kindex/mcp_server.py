@@ -307,7 +307,7 @@ def add(
     )
 
     # Try auto-linking
-    existing_titles = [n["title"] for n in store.all_nodes(limit=200)]
+    existing_titles = [n["title"] for n in store.list_nodes_brief(limit=200)]
     extraction = keyword_extract(text, existing_titles=existing_titles)
     link_count = 0
     for conn in extraction.get("connections", []):
@@ -682,7 +682,7 @@ def learn(text: str) -> str:
     from .extract import extract
 
     ledger = BudgetLedger(config.ledger_path, config.budget)
-    existing = [n["title"] for n in store.all_nodes(limit=200)]
+    existing = [n["title"] for n in store.list_nodes_brief(limit=200)]
 
     extraction = extract(text, existing, config, ledger)
 
@@ -17,7 +17,9 @@ import re
 from collections import defaultdict
 from datetime import datetime
 from functools import partial
-from typing import TYPE_CHECKING
+from itertools import groupby, islice
+from operator import itemgetter
+from typing import TYPE_CHECKING, Iterable
 
 from .agent_adapters import adapter_scoped_out
 
@@ -116,17 +118,26 @@ def _staleness_caveat(node: dict) -> str:
 _RRF_K_DEFAULT = 30
 
 
-def _rrf_merge(*ranked_lists: list[tuple[str, float]], k: int = _RRF_K_DEFAULT) -> list[tuple[str, float]]:
+def _rrf_merge(*ranked_lists: Iterable[str], k: int = _RRF_K_DEFAULT) -> list[tuple[str, float]]:
     """Reciprocal Rank Fusion across multiple ranked result lists.
 
-    Each input is [(node_id, score), ...] in descending score order.
+    Each input yields node_ids in descending score order, with each node_id
+    appearing at most once per list. Only rank matters to RRF, so callers
+    pass ids alone (a generator is fine).
     Returns merged [(node_id, rrf_score)] sorted by rrf_score descending.
     """
-    scores: dict[str, float] = defaultdict(float)
+    if not ranked_lists:
+        return []
+    if len(ranked_lists) == 1:
+        # RRF score falls monotonically with rank: input order is output order.
+        return [(nid, 1.0 / (k + rank + 1))
+                for rank, nid in enumerate(ranked_lists[0])]
 
+    scores: dict[str, float] = {}
+    get = scores.get
     for ranked in ranked_lists:
-        for rank, (nid, _) in enumerate(ranked):
-            scores[nid] += 1.0 / (k + rank + 1)
+        for rank, nid in enumerate(ranked):
+            scores[nid] = get(nid, 0.0) + 1.0 / (k + rank + 1)
 
     return sorted(scores.items(), key=lambda x: x[1], reverse=True)
 
@@ -348,7 +359,11 @@ def hybrid_search(
             ranked_lists.append(graph_ranked)
         if vec_ranked:
             ranked_lists.append(vec_ranked)
-        merged = _rrf_merge(*ranked_lists, k=cfg_rrf_k) if len(ranked_lists) > 1 else fts_ranked
+        if len(ranked_lists) > 1:
+            merged = _rrf_merge(*((nid for nid, _ in ranked) for ranked in ranked_lists),
+                                k=cfg_rrf_k)
+        else:
+            merged = fts_ranked
 
     # Fetch full nodes for top results. Superseded nodes never surface —
     # follow extra['superseded_by'] to the live replacement when it isn't
@@ -454,11 +469,7 @@ def format_context_block(
 
 
 def _gather_domains(results: list[dict]) -> set[str]:
-    domains: set[str] = set()
-    for r in results:
-        for d in (r.get("domains") or []):
-            domains.add(d)
-    return domains
+    return {d for r in results for d in (r.get("domains") or ())}
 
 
 def _append_operational(
@@ -658,17 +669,17 @@ def _format_summarized(
     ]
 
     # Group results by domain
-    domain_groups: dict[str, list[dict]] = defaultdict(list)
-    for r in results:
-        domains = r.get("domains") or ["general"]
-        for d in domains[:1]:  # primary domain only
-            domain_groups[d].append(r)
-
-    for domain, nodes in domain_groups.items():
-        titles = [n.get("title", n["id"]) for n in nodes[:5]]
+    # Cluster by primary domain; clusters keep first-seen (relevance) order.
+    primary = [(r.get("domains") or ["general"])[0] for r in results]
+    rank: dict[str, int] = {}
+    for d in primary:
+        rank.setdefault(d, len(rank))
+    clustered = sorted(zip(primary, results), key=lambda p: rank[p[0]])
+
+    for domain, group in groupby(clustered, key=itemgetter(0)):
         # Build a synthesized sentence about this cluster
         summaries = []
-        for n in nodes[:3]:
+        for _, n in islice(group, 3):
             content = _strip_frontmatter(n.get("content") or "")[:150]
             if content:
                 summaries.append(f"{n['title']}: {content}")
@@ -864,8 +875,4 @@ def detect_domain_from_path(store: Store, cwd: str) -> list[str]:
     """
     # Search for nodes referencing this path
     results = store.fts_search(cwd, limit=5)
-    domains: set[str] = set()
-    for r in results:
-        for d in (r.get("domains") or []):
-            domains.add(d)
-    return sorted(domains)
+    return sorted(_gather_domains(results))
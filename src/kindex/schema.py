@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-SCHEMA_VERSION = 7
+SCHEMA_VERSION = 11
 
 # Audience scopes for tenancy model
 AUDIENCES = ("private", "team", "org", "public")
@@ -88,7 +88,14 @@ CREATE TABLE IF NOT EXISTS nodes (
     updated_at TEXT NOT NULL DEFAULT (datetime('now')),
     last_accessed TEXT NOT NULL DEFAULT (datetime('now')),
     -- extra fields as JSON (preserves domain-specific data)
-    extra TEXT NOT NULL DEFAULT '{}'
+    extra TEXT NOT NULL DEFAULT '{}',
+    -- session-tag fields lifted out of extra so they can be indexed
+    session_status_g TEXT GENERATED ALWAYS AS (
+        CASE WHEN json_valid(extra) THEN json_extract(extra, '$.session_status') END
+    ) VIRTUAL,
+    project_path_g TEXT GENERATED ALWAYS AS (
+        CASE WHEN json_valid(extra) THEN json_extract(extra, '$.project_path') END
+    ) VIRTUAL
 );
 
 CREATE TABLE IF NOT EXISTS edges (
@@ -102,7 +109,8 @@ CREATE TABLE IF NOT EXISTS edges (
     UNIQUE(from_id, to_id, type)
 );
 
--- FTS5 full-text search over node content
+-- FTS5 full-text search over node content. The prefix index serves
+-- short-prefix MATCH terms from the index instead of a full term scan.
 CREATE VIRTUAL TABLE IF NOT EXISTS nodes_fts USING fts5(
     id UNINDEXED,
     title,
@@ -111,7 +119,9 @@ CREATE VIRTUAL TABLE IF NOT EXISTS nodes_fts USING fts5(
     intent,
     domains,
     content=nodes,
-    content_rowid=rowid
+    content_rowid=rowid,
+    prefix='2 3 4',
+    tokenize='porter unicode61 remove_diacritics 2'
 );
 
 -- Triggers to keep FTS in sync
@@ -125,21 +135,77 @@ CREATE TRIGGER IF NOT EXISTS nodes_ad AFTER DELETE ON nodes BEGIN
     VALUES ('delete', old.rowid, old.id, old.title, old.content, old.aka, old.intent, old.domains);
 END;
 
-CREATE TRIGGER IF NOT EXISTS nodes_au AFTER UPDATE ON nodes BEGIN
+-- Only fires when an indexed column changes: last_accessed touches and extra
+-- patches skip the FTS delete/re-insert entirely.
+CREATE TRIGGER IF NOT EXISTS nodes_au
+AFTER UPDATE OF id, title, content, aka, intent, domains ON nodes BEGIN
     INSERT INTO nodes_fts(nodes_fts, rowid, id, title, content, aka, intent, domains)
     VALUES ('delete', old.rowid, old.id, old.title, old.content, old.aka, old.intent, old.domains);
     INSERT INTO nodes_fts(rowid, id, title, content, aka, intent, domains)
     VALUES (new.rowid, new.id, new.title, new.content, new.aka, new.intent, new.domains);
 END;
 
+-- Lowercased aliases, one row per aka entry, kept in sync from nodes.aka so
+-- get_node_by_title resolves an alias with an index probe instead of
+-- decoding every node's aka JSON.
+CREATE TABLE IF NOT EXISTS node_aka (
+    alias_lc TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    PRIMARY KEY (alias_lc, node_id)
+) WITHOUT ROWID;
+
+-- INSERT OR REPLACE doesn't fire delete triggers, so clear first
+CREATE TRIGGER IF NOT EXISTS nodes_aka_ai AFTER INSERT ON nodes BEGIN
+    DELETE FROM node_aka WHERE node_id = new.id;
+    INSERT OR IGNORE INTO node_aka (alias_lc, node_id)
+    SELECT lower(value), new.id FROM json_each(
+        CASE WHEN json_valid(new.aka) THEN new.aka ELSE '[]' END)
+    WHERE type = 'text';
+END;
+
+CREATE TRIGGER IF NOT EXISTS nodes_aka_ad AFTER DELETE ON nodes BEGIN
+    DELETE FROM node_aka WHERE node_id = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS nodes_aka_au AFTER UPDATE OF id, aka ON nodes BEGIN
+    DELETE FROM node_aka WHERE node_id = old.id;
+    INSERT OR IGNORE INTO node_aka (alias_lc, node_id)
+    SELECT lower(value), new.id FROM json_each(
+        CASE WHEN json_valid(new.aka) THEN new.aka ELSE '[]' END)
+    WHERE type = 'text';
+END;
+
 -- Indexes
 CREATE INDEX IF NOT EXISTS idx_edges_from ON edges(from_id);
 CREATE INDEX IF NOT EXISTS idx_edges_to ON edges(to_id);
+CREATE INDEX IF NOT EXISTS idx_node_aka_node ON node_aka(node_id);
 CREATE INDEX IF NOT EXISTS idx_nodes_type ON nodes(type);
 CREATE INDEX IF NOT EXISTS idx_nodes_status ON nodes(status);
 CREATE INDEX IF NOT EXISTS idx_nodes_updated ON nodes(updated_at);
 CREATE INDEX IF NOT EXISTS idx_nodes_weight ON nodes(weight DESC);
 CREATE INDEX IF NOT EXISTS idx_nodes_audience ON nodes(audience);
+-- all_nodes(type=, status=) and the operational listings: both filters
+-- are equalities, so rows come out of the index already in weight order.
+CREATE INDEX IF NOT EXISTS idx_nodes_type_status_weight
+    ON nodes(type, status, weight DESC, updated_at DESC);
+-- Session tags: newest-first listing without a sort; partial keeps it small
+CREATE INDEX IF NOT EXISTS idx_nodes_session
+    ON nodes(type, updated_at DESC) WHERE type = 'session';
+-- Session tags by lifecycle status and project, newest first:
+-- get_active_tag becomes a single index probe.
+CREATE INDEX IF NOT EXISTS idx_nodes_session_status
+    ON nodes(session_status_g, project_path_g, updated_at DESC)
+    WHERE type = 'session';
+-- Case-insensitive title lookup (get_node_by_title)
+CREATE INDEX IF NOT EXISTS idx_nodes_title_lower ON nodes(lower(title));
+-- Operational lookups by extra.trigger / extra.owner (nodes_by_trigger,
+-- nodes_by_owner); the expressions must match store.py verbatim.
+CREATE INDEX IF NOT EXISTS idx_nodes_trigger
+    ON nodes((CASE WHEN json_valid(extra) THEN json_extract(extra, '$.trigger') END))
+    WHERE status = 'active';
+CREATE INDEX IF NOT EXISTS idx_nodes_owner
+    ON nodes((CASE WHEN json_valid(extra) THEN json_extract(extra, '$.owner') END))
+    WHERE status = 'active';
 
 -- Activity log for audit trail
 CREATE TABLE IF NOT EXISTS activity_log (
@@ -19,21 +19,32 @@ def _now() -> str:
     return datetime.datetime.now().isoformat(timespec="seconds")
 
 
+_TAG_STRIP_RE = re.compile(r"[^a-z0-9\s-]")
+_TAG_DASH_RE = re.compile(r"[\s_]+")
+
+
 def _normalize_tag(name: str) -> str:
     """Normalize a tag name: lowercase, hyphens for spaces, strip special chars."""
-    name = name.strip().lower()
-    name = re.sub(r"[^a-z0-9\s-]", "", name)
-    name = re.sub(r"[\s_]+", "-", name)
-    return name.strip("-")
+    name = _TAG_STRIP_RE.sub("", name.strip().lower())
+    return _TAG_DASH_RE.sub("-", name).strip("-")
+
+
+def _open_segment(extra: dict) -> dict | None:
+    """The current (open) segment, or None.
+
+    Segments are append-only and add_segment closes the open one before
+    appending, so only the last segment can be open: O(1), no scan.
+    """
+    segments = extra.get("segments")
+    if segments and not segments[-1].get("ended_at"):
+        return segments[-1]
+    return None
 
 
 def get_tag(store: Store, name: str) -> dict | None:
     """Look up a session tag by name. Returns the node dict or None."""
-    tag = store.get_session_tag_by_name(_normalize_tag(name))
-    if tag:
-        return tag
     # Also try unnormalized (in case title was stored differently)
-    return store.get_session_tag_by_name(name)
+    return store.get_session_tag_by_any_name(_normalize_tag(name), name)
 
 
 def get_active_tag(store: Store, project_path: str | None = None) -> dict | None:
@@ -141,11 +152,9 @@ def update_tag(
         if focus is not None:
             extra["current_focus"] = focus
             # Also update the current open segment's focus
-            segments = extra.get("segments", [])
-            if segments:
-                current = [s for s in segments if not s.get("ended_at")]
-                if current:
-                    current[-1]["focus"] = focus
+            current = _open_segment(extra)
+            if current:
+                current["focus"] = focus
 
         if remaining is not None:
             extra["remaining"] = remaining
@@ -154,14 +163,20 @@ def update_tag(
             extra["remaining"] = extra.get("remaining", []) + append_remaining
 
         if remove_remaining:
+            drop = set(remove_remaining)
             extra["remaining"] = [
-                r for r in extra.get("remaining", [])
-                if r not in remove_remaining
+                r for r in extra.get("remaining", []) if r not in drop
             ]
 
-    store.atomic_extra_update(tag["id"], _mutate)
-    if description is not None:
-        store.update_node(tag["id"], content=description)
+    with store.transaction():
+        if focus is None and not append_remaining and not remove_remaining:
+            # Blind write: patch in place, no read-modify-write needed
+            if remaining is not None:
+                store.patch_node_extra(tag["id"], {"remaining": remaining})
+        else:
+            store.atomic_extra_update(tag["id"], _mutate)
+        if description is not None:
+            store.update_node(tag["id"], content=description)
 
 
 def add_segment(
@@ -184,16 +199,16 @@ def add_segment(
     now = _now()
 
     def _mutate(extra: dict) -> None:
-        segments = extra.setdefault("segments", [])
-
         # Close the current open segment
-        for seg in segments:
-            if not seg.get("ended_at"):
-                seg["ended_at"] = now
-                if summary:
-                    seg["summary"] = summary
-                if decisions:
-                    seg["decisions"] = seg.get("decisions", []) + decisions
+        seg = _open_segment(extra)
+        if seg:
+            seg["ended_at"] = now
+            if summary:
+                seg["summary"] = summary
+            if decisions:
+                seg["decisions"] = seg.get("decisions", []) + decisions
+
+        segments = extra.setdefault("segments", [])
 
         # Start new segment
         segments.append(
@@ -209,7 +224,7 @@ def add_segment(
 
         extra["current_focus"] = new_focus
 
-    store.atomic_extra_update(tag["id"], _mutate)
+    store.atomic_extra_update(tag["id"], _mutate, now=now)
 
 
 def link_node_to_tag(store: Store, tag_name: str, node_id: str) -> None:
@@ -219,30 +234,48 @@ def link_node_to_tag(store: Store, tag_name: str, node_id: str) -> None:
     multiple agents race on this node: the mutation runs inside
     Store.atomic_extra_update to avoid losing concurrent links/segments.
     """
+    link_nodes_to_tag(store, tag_name, [node_id])
+
+
+def link_nodes_to_tag(store: Store, tag_name: str, node_ids: list[str]) -> None:
+    """Associate several knowledge nodes with a session tag at once.
+
+    One extra update, one batch of context_of edges, one commit. Ids that
+    don't name an existing node are still recorded on the tag but get no
+    edge.
+    """
+    node_ids = list(dict.fromkeys(node_ids))
+    if not node_ids:
+        return
     tag = get_tag(store, tag_name)
     if not tag:
         return
 
     def _mutate(extra: dict) -> None:
         linked = extra.setdefault("linked_nodes", [])
-        if node_id in linked:
+        have = set(linked)
+        new = [nid for nid in node_ids if nid not in have]
+        if not new:
             return
-        linked.append(node_id)
+        linked.extend(new)
 
         # Also update current segment's artifacts
-        for seg in extra.get("segments", []):
-            if not seg.get("ended_at"):
-                artifacts = seg.setdefault("artifacts", [])
-                if node_id not in artifacts:
-                    artifacts.append(node_id)
-
-    store.atomic_extra_update(tag["id"], _mutate)
-
-    # Create a context_of edge from the node to the session tag
-    try:
-        store.add_edge(node_id, tag["id"], edge_type="context_of", provenance="session-tag")
-    except Exception:
-        pass  # Edge may already exist
+        seg = _open_segment(extra)
+        if seg:
+            artifacts = seg.setdefault("artifacts", [])
+            have = set(artifacts)
+            artifacts.extend(nid for nid in new if nid not in have)
+
+    existing = store.get_nodes_minimal(node_ids, cols=("id",))
+    # The extra update and the edges land in one transaction (one commit)
+    with store.transaction():
+        store.atomic_extra_update(tag["id"], _mutate)
+
+        # context_of edges from each node to the session tag
+        store.add_edges_bulk(
+            [(nid, tag["id"], "context_of", "session-tag")
+             for nid in node_ids if nid in existing]
+        )
 
 
 def pause_tag(store: Store, name: str, *, summary: str = "") -> None:
@@ -251,17 +284,22 @@ def pause_tag(store: Store, name: str, *, summary: str = "") -> None:
     if not tag:
         raise ValueError(f"Tag not found: {name}")
 
+    now = _now()
+    if not summary:
+        store.patch_node_extra(
+            tag["id"], {"session_status": "paused", "paused_at": now}, now=now)
+        return
+
     def _mutate(extra: dict) -> None:
         extra["session_status"] = "paused"
-        extra["paused_at"] = _now()
+        extra["paused_at"] = now
 
-        if summary:
-            # Update current segment summary
-            for seg in extra.get("segments", []):
-                if not seg.get("ended_at"):
-                    seg["summary"] = summary
+        # Update current segment summary
+        seg = _open_segment(extra)
+        if seg:
+            seg["summary"] = summary
 
-    store.atomic_extra_update(tag["id"], _mutate)
+    store.atomic_extra_update(tag["id"], _mutate, now=now)
 
 
 def complete_tag(store: Store, name: str, *, summary: str = "") -> None:
@@ -276,14 +314,14 @@ def complete_tag(store: Store, name: str, *, summary: str = "") -> None:
         extra["session_status"] = "completed"
         extra["completed_at"] = now
 
-        # Close any open segments
-        for seg in extra.get("segments", []):
-            if not seg.get("ended_at"):
-                seg["ended_at"] = now
-                if summary:
-                    seg["summary"] = summary
+        # Close the open segment
+        seg = _open_segment(extra)
+        if seg:
+            seg["ended_at"] = now
+            if summary:
+                seg["summary"] = summary
 
-    store.atomic_extra_update(tag["id"], _mutate)
+    store.atomic_extra_update(tag["id"], _mutate, now=now)
 
 
 def format_resume_context(
@@ -353,15 +391,22 @@ def format_resume_context(
     # Linked knowledge nodes: show titles
     if linked_nodes:
         lines.append("### Related knowledge")
-        shown = 0
-        for nid in linked_nodes:
-            if shown >= 10:
-                lines.append(f"  ... and {len(linked_nodes) - shown} more")
-                break
-            node = store.get_node(nid)
-            if node:
-                lines.append(f"- {node['title']} ({node['type']})")
-                shown += 1
+        shown = pos = 0
+        # Resolve ids a slice at a time until ten titles are found; deleted
+        # nodes are skipped without binding the whole list in one query.
+        while pos < len(linked_nodes) and shown < 10:
+            batch = linked_nodes[pos:pos + 10]
+            found = store.get_nodes_minimal(batch)
+            for nid in batch:
+                pos += 1
+                node = found.get(nid)
+                if node:
+                    lines.append(f"- {node['title']} ({node['type']})")
+                    shown += 1
+                    if shown >= 10:
+                        break
+        if pos < len(linked_nodes):
+            lines.append(f"  ... and {len(linked_nodes) - shown} more")
         lines.append("")
 
     return "\n".join(lines)
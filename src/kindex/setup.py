@@ -1,16 +1,41 @@
 """System setup — install agent integrations, launchd plists, crontab entries."""
 
+import functools
 import json
 import os
 import shlex
+import shutil
 import subprocess
 from pathlib import Path
+from string import Template
 from typing import TYPE_CHECKING, Any
+from xml.sax.saxutils import escape as xml_escape
+
+try:  # optional C-accelerated JSON for agent settings files
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 if TYPE_CHECKING:
     from .config import Config
 
 
+def _load_json(path: Path) -> Any:
+    """Parse a JSON settings file (orjson when installed)."""
+    if _orjson is not None:
+        return _orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write a settings file as 2-space indented JSON plus trailing newline."""
+    if _orjson is not None:
+        path.write_bytes(_orjson.dumps(
+            data, option=_orjson.OPT_INDENT_2 | _orjson.OPT_APPEND_NEWLINE))
+        return
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
 def _kin_command_parts(kin_path: str) -> list[str]:
     """Split the fallback python -m invocation while preserving normal kin paths."""
     if " -m kindex.cli" in kin_path:
@@ -45,16 +70,29 @@ def _kin_stop_hook_command(kin_path: str, args: list[str]) -> str:
     return f"/bin/bash -lc {shlex.quote(script)}"
 
 
+def _hook_text(entry: object) -> str:
+    """The command strings of a hook entry, newline-joined.
+
+    Reads entry["command"] and entry["hooks"][i]["command"] directly instead
+    of repr()-ing the whole entry; unknown shapes fall back to str().
+    """
+    if not isinstance(entry, dict):
+        return str(entry)
+    commands = [entry.get("command")]
+    commands += [h.get("command") for h in entry.get("hooks") or () if isinstance(h, dict)]
+    return "\n".join(c for c in commands if isinstance(c, str))
+
+
 def _hook_needs_profile(entry: object) -> bool:
-    return "source ~/.profile" not in str(entry)
+    return "source ~/.profile" not in _hook_text(entry)
 
 
 def _hook_needs_stop_active_guard(entry: object) -> bool:
-    return "stop_hook_active" not in str(entry)
+    return "stop_hook_active" not in _hook_text(entry)
 
 
 def _hook_needs_attention_deadline(entry: object) -> bool:
-    return "--deadline-ms" not in str(entry)
+    return "--deadline-ms" not in _hook_text(entry)
 
 
 def install_claude_hooks(config: "Config", dry_run: bool = False) -> list[str]:
@@ -71,7 +109,7 @@ def install_claude_hooks(config: "Config", dry_run: bool = False) -> list[str]:
 
     # Read existing settings
     if settings_path.exists():
-        data = json.loads(settings_path.read_text())
+        data = _load_json(settings_path)
     else:
         data = {}
 
@@ -93,7 +131,7 @@ def install_claude_hooks(config: "Config", dry_run: bool = False) -> list[str]:
     # Check if already installed
     existing_idx = next(
         (i for i, h in enumerate(session_start)
-         if "kin prime" in str(h) or "kindex" in str(h).lower()),
+         if "kin prime" in _hook_text(h) or "kindex" in _hook_text(h).lower()),
         None,
     )
     if existing_idx is None:
@@ -115,7 +153,7 @@ def install_claude_hooks(config: "Config", dry_run: bool = False) -> list[str]:
             "timeout": 10000
         }]
     }
-    existing_idx = next((i for i, h in enumerate(pre_compact) if "compact-hook" in str(h)), None)
+    existing_idx = next((i for i, h in enumerate(pre_compact) if "compact-hook" in _hook_text(h)), None)
     if existing_idx is None:
         pre_compact.append(compact_hook)
         actions.append("Added PreCompact hook: kin compact-hook --emit-context")
@@ -135,7 +173,7 @@ def install_claude_hooks(config: "Config", dry_run: bool = False) -> list[str]:
             "timeout": 2000
         }]
     }
-    existing_idx = next((i for i, h in enumerate(prompt_submit) if "prompt-check" in str(h)), None)
+    existing_idx = next((i for i, h in enumerate(prompt_submit) if "prompt-check" in _hook_text(h)), None)
     if existing_idx is None:
         prompt_submit.append(prompt_hook)
         actions.append("Added UserPromptSubmit hook: kin prompt-check")
@@ -159,7 +197,7 @@ def install_claude_hooks(config: "Config", dry_run: bool = False) -> list[str]:
             "timeout": 5000,
         }]
     }
-    existing_idx = next((i for i, h in enumerate(pre_tool) if "attention-hook" in str(h)), None)
+    existing_idx = next((i for i, h in enumerate(pre_tool) if "attention-hook" in _hook_text(h)), None)
     if existing_idx is None:
         pre_tool.append(attention_hook)
         actions.append("Added PreToolUse hook: kin attention-hook")
@@ -208,8 +246,8 @@ def install_claude_hooks(config: "Config", dry_run: bool = False) -> list[str]:
     }
     existing_idx = next(
         (i for i, h in enumerate(stop_hooks)
-         if "stop-guard" in str(h) or "compact-hook" in str(h) or "dream" in str(h)
-         or "reinforce" in str(h)),
+         if "stop-guard" in _hook_text(h) or "compact-hook" in _hook_text(h) or "dream" in _hook_text(h)
+         or "reinforce" in _hook_text(h)),
         None,
     )
     if existing_idx is None:
@@ -224,10 +262,10 @@ def install_claude_hooks(config: "Config", dry_run: bool = False) -> list[str]:
     elif (
         _hook_needs_profile(stop_hooks[existing_idx])
         or _hook_needs_stop_active_guard(stop_hooks[existing_idx])
-        or ("dream" in str(stop_hooks[existing_idx]) and not config.reminders.dream_on_stop_enabled)
-        or ("dream" not in str(stop_hooks[existing_idx]) and config.reminders.dream_on_stop_enabled)
-        or ("stop-guard" in str(stop_hooks[existing_idx]) and not config.reminders.stop_guard_enabled)
-        or ("stop-guard" not in str(stop_hooks[existing_idx]) and config.reminders.stop_guard_enabled)
+        or ("dream" in _hook_text(stop_hooks[existing_idx]) and not config.reminders.dream_on_stop_enabled)
+        or ("dream" not in _hook_text(stop_hooks[existing_idx]) and config.reminders.dream_on_stop_enabled)
+        or ("stop-guard" in _hook_text(stop_hooks[existing_idx]) and not config.reminders.stop_guard_enabled)
+        or ("stop-guard" not in _hook_text(stop_hooks[existing_idx]) and config.reminders.stop_guard_enabled)
     ):
         stop_hooks[existing_idx] = stop_guard_entry
         action = "Updated Stop hook to source ~/.profile and avoid recursion"
@@ -241,7 +279,7 @@ def install_claude_hooks(config: "Config", dry_run: bool = False) -> list[str]:
 
     if not dry_run:
         settings_path.parent.mkdir(parents=True, exist_ok=True)
-        settings_path.write_text(json.dumps(data, indent=2) + "\n")
+        _write_json(settings_path, data)
         actions.append(f"Wrote {settings_path}")
 
     return actions
@@ -252,7 +290,7 @@ def install_codex_hooks(config: "Config", dry_run: bool = False) -> list[str]:
     hooks_path = config.codex_path / "hooks.json"
     actions = []
     if hooks_path.exists():
-        data = json.loads(hooks_path.read_text())
+        data = _load_json(hooks_path)
     else:
         data = {}
     hooks = data.setdefault("hooks", {})
@@ -274,7 +312,7 @@ def install_codex_hooks(config: "Config", dry_run: bool = False) -> list[str]:
     }
     existing_idx = next(
         (i for i, h in enumerate(session_start)
-         if "kin prime" in str(h) or "kindex" in str(h).lower()),
+         if "kin prime" in _hook_text(h) or "kindex" in _hook_text(h).lower()),
         None,
     )
     if existing_idx is None:
@@ -282,7 +320,7 @@ def install_codex_hooks(config: "Config", dry_run: bool = False) -> list[str]:
         actions.append("Added Codex SessionStart hook: kin prime --for hook")
     elif (
         _hook_needs_profile(session_start[existing_idx])
-        or "--adapter" not in str(session_start[existing_idx])
+        or "--adapter" not in _hook_text(session_start[existing_idx])
     ):
         session_start[existing_idx] = session_entry
         actions.append("Updated Codex SessionStart hook")
@@ -305,7 +343,7 @@ def install_codex_hooks(config: "Config", dry_run: bool = False) -> list[str]:
 
     existing_idx = next(
         (i for i, h in enumerate(prompt_submit)
-         if "prompt-check" in str(h) or "attention-hook" in str(h)),
+         if "prompt-check" in _hook_text(h) or "attention-hook" in _hook_text(h)),
         None,
     )
     if existing_idx is None:
@@ -313,8 +351,8 @@ def install_codex_hooks(config: "Config", dry_run: bool = False) -> list[str]:
         actions.append("Added Codex UserPromptSubmit hook: kin attention-hook")
     elif (
         _hook_needs_profile(prompt_submit[existing_idx])
-        or "prompt-check" in str(prompt_submit[existing_idx])
-        or "--adapter" not in str(prompt_submit[existing_idx])
+        or "prompt-check" in _hook_text(prompt_submit[existing_idx])
+        or "--adapter" not in _hook_text(prompt_submit[existing_idx])
         or _hook_needs_attention_deadline(prompt_submit[existing_idx])
     ):
         prompt_submit[existing_idx] = entry
@@ -335,7 +373,7 @@ def install_codex_hooks(config: "Config", dry_run: bool = False) -> list[str]:
             "statusMessage": "Checking Kindex attention",
         }]
     }
-    existing_idx = next((i for i, h in enumerate(post_tool) if "attention-hook" in str(h)), None)
+    existing_idx = next((i for i, h in enumerate(post_tool) if "attention-hook" in _hook_text(h)), None)
     if existing_idx is None:
         post_tool.append(post_entry)
         actions.append("Added Codex PostToolUse hook: kin attention-hook")
@@ -353,7 +391,7 @@ def install_codex_hooks(config: "Config", dry_run: bool = False) -> list[str]:
         return actions
 
     hooks_path.parent.mkdir(parents=True, exist_ok=True)
-    hooks_path.write_text(json.dumps(data, indent=2) + "\n")
+    _write_json(hooks_path, data)
     actions.append(f"Wrote {hooks_path}")
     return actions
 
@@ -364,19 +402,19 @@ def uninstall_codex_hooks(config: "Config", dry_run: bool = False) -> list[str]:
     if not hooks_path.exists():
         return ["No Codex hooks.json found"]
 
-    data = json.loads(hooks_path.read_text())
+    data = _load_json(hooks_path)
     hooks = data.get("hooks", {})
     prompt_submit = hooks.get("UserPromptSubmit", [])
     post_tool = hooks.get("PostToolUse", [])
     session_start = hooks.get("SessionStart", [])
     kept = [
         h for h in prompt_submit
-        if "prompt-check" not in str(h) and "attention-hook" not in str(h)
+        if "prompt-check" not in _hook_text(h) and "attention-hook" not in _hook_text(h)
     ]
-    kept_post = [h for h in post_tool if "attention-hook" not in str(h)]
+    kept_post = [h for h in post_tool if "attention-hook" not in _hook_text(h)]
     kept_session = [
         h for h in session_start
-        if "kin prime" not in str(h) and "kindex" not in str(h).lower()
+        if "kin prime" not in _hook_text(h) and "kindex" not in _hook_text(h).lower()
     ]
     if (
         len(kept) == len(prompt_submit)
@@ -404,7 +442,7 @@ def uninstall_codex_hooks(config: "Config", dry_run: bool = False) -> list[str]:
         data["hooks"] = hooks
     else:
         data.pop("hooks", None)
-    hooks_path.write_text(json.dumps(data, indent=2) + "\n")
+    _write_json(hooks_path, data)
     return [f"Removed Codex Kindex hooks from {hooks_path}"]
 
 
@@ -483,7 +521,7 @@ def install_gemini_mcp(config: "Config", dry_run: bool = False) -> list[str]:
     actions = []
 
     if settings_path.exists():
-        data = json.loads(settings_path.read_text())
+        data = _load_json(settings_path)
     else:
         data = {}
 
@@ -499,7 +537,7 @@ def install_gemini_mcp(config: "Config", dry_run: bool = False) -> list[str]:
         return actions
 
     settings_path.parent.mkdir(parents=True, exist_ok=True)
-    settings_path.write_text(json.dumps(data, indent=2) + "\n")
+    _write_json(settings_path, data)
     actions.append("Added Gemini MCP server: kindex -> kin-mcp")
     actions.append(f"Wrote {settings_path}")
     return actions
@@ -512,7 +550,7 @@ def uninstall_gemini_mcp(config: "Config", dry_run: bool = False) -> list[str]:
     if not settings_path.exists():
         return ["No Gemini settings.json found"]
 
-    data = json.loads(settings_path.read_text())
+    data = _load_json(settings_path)
     mcp_servers = data.get("mcpServers", {})
 
     if "kindex" not in mcp_servers:
@@ -527,7 +565,7 @@ def uninstall_gemini_mcp(config: "Config", dry_run: bool = False) -> list[str]:
     else:
         data.pop("mcpServers", None)
 
-    settings_path.write_text(json.dumps(data, indent=2) + "\n")
+    _write_json(settings_path, data)
     return [f"Removed Gemini MCP server from {settings_path}"]
 
 
@@ -580,7 +618,7 @@ def install_antigravity_mcp(config: "Config", dry_run: bool = False) -> list[str
             actions.append(f"Would add Antigravity MCP server to {settings_path}")
             continue
         settings_path.parent.mkdir(parents=True, exist_ok=True)
-        settings_path.write_text(json.dumps(data, indent=2) + "\n")
+        _write_json(settings_path, data)
         actions.append(f"Added {label} MCP server: kindex -> kin-mcp")
         actions.append(f"Wrote {settings_path}")
 
@@ -607,7 +645,7 @@ def uninstall_antigravity_mcp(config: "Config", dry_run: bool = False) -> list[s
             data["mcpServers"] = mcp_servers
         else:
             data.pop("mcpServers", None)
-        settings_path.write_text(json.dumps(data, indent=2) + "\n")
+        _write_json(settings_path, data)
         actions.append(f"Removed {label} MCP server from {settings_path}")
     return actions
 
@@ -687,7 +725,7 @@ def install_antigravity_hooks(config: "Config", dry_run: bool = False) -> list[s
         return actions
 
     hooks_path.parent.mkdir(parents=True, exist_ok=True)
-    hooks_path.write_text(json.dumps(data, indent=2) + "\n")
+    _write_json(hooks_path, data)
     actions.append(f"Wrote {hooks_path}")
     return actions
 
@@ -703,7 +741,7 @@ def uninstall_antigravity_hooks(config: "Config", dry_run: bool = False) -> list
     if dry_run:
         return [f"Would remove Antigravity Kindex hooks from {hooks_path}"]
     data.pop("kindex", None)
-    hooks_path.write_text(json.dumps(data, indent=2) + "\n")
+    _write_json(hooks_path, data)
     return [f"Removed Antigravity Kindex hooks from {hooks_path}"]
 
 
@@ -713,7 +751,7 @@ def install_opencode_mcp(config: "Config", dry_run: bool = False) -> list[str]:
     actions = []
 
     if settings_path.exists():
-        data = json.loads(settings_path.read_text())
+        data = _load_json(settings_path)
     else:
         data = {"$schema": "https://opencode.ai/config.json"}
 
@@ -733,7 +771,7 @@ def install_opencode_mcp(config: "Config", dry_run: bool = False) -> list[str]:
         return actions
 
     settings_path.parent.mkdir(parents=True, exist_ok=True)
-    settings_path.write_text(json.dumps(data, indent=2) + "\n")
+    _write_json(settings_path, data)
     actions.append("Added OpenCode MCP server: kindex -> kin-mcp")
     actions.append(f"Wrote {settings_path}")
     return actions
@@ -746,7 +784,7 @@ def uninstall_opencode_mcp(config: "Config", dry_run: bool = False) -> list[str]
     if not settings_path.exists():
         return ["No OpenCode opencode.json found"]
 
-    data = json.loads(settings_path.read_text())
+    data = _load_json(settings_path)
     mcp = data.get("mcp", {})
 
     if "kindex" not in mcp:
@@ -761,7 +799,7 @@ def uninstall_opencode_mcp(config: "Config", dry_run: bool = False) -> list[str]
     else:
         data.pop("mcp", None)
 
-    settings_path.write_text(json.dumps(data, indent=2) + "\n")
+    _write_json(settings_path, data)
     return [f"Removed OpenCode MCP server from {settings_path}"]
 
 
@@ -771,7 +809,7 @@ def install_cursor_mcp(config: "Config", dry_run: bool = False) -> list[str]:
     actions = []
 
     if settings_path.exists():
-        data = json.loads(settings_path.read_text())
+        data = _load_json(settings_path)
     else:
         data = {}
 
@@ -790,7 +828,7 @@ def install_cursor_mcp(config: "Config", dry_run: bool = False) -> list[str]:
         return actions
 
     settings_path.parent.mkdir(parents=True, exist_ok=True)
-    settings_path.write_text(json.dumps(data, indent=2) + "\n")
+    _write_json(settings_path, data)
     actions.append("Added Cursor MCP server: kindex -> kin-mcp")
     actions.append(f"Wrote {settings_path}")
     return actions
@@ -803,7 +841,7 @@ def uninstall_cursor_mcp(config: "Config", dry_run: bool = False) -> list[str]:
     if not settings_path.exists():
         return ["No Cursor mcp.json found"]
 
-    data = json.loads(settings_path.read_text())
+    data = _load_json(settings_path)
     mcp_servers = data.get("mcpServers", {})
 
     if "kindex" not in mcp_servers:
@@ -818,45 +856,66 @@ def uninstall_cursor_mcp(config: "Config", dry_run: bool = False) -> list[str]:
     else:
         data.pop("mcpServers", None)
 
-    settings_path.write_text(json.dumps(data, indent=2) + "\n")
+    _write_json(settings_path, data)
     return [f"Removed Cursor MCP server from {settings_path}"]
 
 
-def install_launchd(config: "Config", dry_run: bool = False) -> list[str]:
-    """Install macOS launchd plist for kin cron.
-
-    Creates ~/Library/LaunchAgents/com.kindex.cron.plist
-    Uses config.reminders.check_interval for the initial interval.
-    """
-    actions = []
-    kin_path = _find_kin_path()
-    launch_agents = Path.home() / "Library" / "LaunchAgents"
-    plist_path = launch_agents / "com.kindex.cron.plist"
-    log_dir = config.data_path / "logs"
-    interval = config.reminders.check_interval
-
-    plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
+_PLIST_TEMPLATE = Template("""\
+<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
 <plist version="1.0">
 <dict>
     <key>Label</key>
-    <string>com.kindex.cron</string>
+    <string>$label</string>
     <key>ProgramArguments</key>
     <array>
-        <string>{kin_path}</string>
-        <string>cron</string>
+$arguments
     </array>
     <key>StartInterval</key>
-    <integer>{interval}</integer>
+    <integer>$interval</integer>
     <key>StandardOutPath</key>
-    <string>{log_dir}/cron.log</string>
+    <string>$stdout_path</string>
     <key>StandardErrorPath</key>
-    <string>{log_dir}/cron-error.log</string>
+    <string>$stderr_path</string>
     <key>RunAtLoad</key>
     <true/>
 </dict>
 </plist>
-"""
+""")
+
+_CRON_LINE = Template("*/30 * * * * $kin_path cron >> $log_path 2>&1")
+
+
+def _render_plist(label: str, arguments: list[str], interval: int,
+                  stdout_path: Path, stderr_path: Path) -> str:
+    """Render a launchd agent plist; every value is XML-escaped."""
+    return _PLIST_TEMPLATE.substitute(
+        label=xml_escape(label),
+        arguments="\n".join(
+            f"        <string>{xml_escape(a)}</string>" for a in arguments),
+        interval=int(interval),
+        stdout_path=xml_escape(str(stdout_path)),
+        stderr_path=xml_escape(str(stderr_path)),
+    )
+
+
+def install_launchd(config: "Config", dry_run: bool = False) -> list[str]:
+    """Install macOS launchd plist for kin cron.
+
+    Creates ~/Library/LaunchAgents/com.kindex.cron.plist
+    Uses config.reminders.check_interval for the initial interval.
+    """
+    actions = []
+    kin_path = _find_kin_path()
+    launch_agents = Path.home() / "Library" / "LaunchAgents"
+    plist_path = launch_agents / "com.kindex.cron.plist"
+    log_dir = config.data_path / "logs"
+    interval = config.reminders.check_interval
+
+    plist_content = _render_plist(
+        "com.kindex.cron", _kin_command_parts(kin_path) + ["cron"],
+        interval, log_dir / "cron.log", log_dir / "cron-error.log",
+    )
 
     if not dry_run:
         launch_agents.mkdir(parents=True, exist_ok=True)
@@ -910,7 +969,7 @@ def install_crontab(config: "Config", dry_run: bool = False) -> list[str]:
     kin_path = _find_kin_path()
     log_path = config.data_path / "logs" / "cron.log"
 
-    cron_line = f"*/30 * * * * {kin_path} cron >> {log_path} 2>&1"
+    cron_line = _CRON_LINE.substitute(kin_path=kin_path, log_path=log_path)
 
     # Check existing crontab
     result = subprocess.run(["crontab", "-l"], capture_output=True, text=True)
@@ -947,29 +1006,10 @@ def install_reminder_daemon(config: "Config", dry_run: bool = False) -> list[str
     log_dir = config.data_path / "logs"
     interval = config.reminders.check_interval
 
-    plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.kindex.reminders</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>{kin_path}</string>
-        <string>remind</string>
-        <string>check</string>
-    </array>
-    <key>StartInterval</key>
-    <integer>{interval}</integer>
-    <key>StandardOutPath</key>
-    <string>{log_dir}/reminders.log</string>
-    <key>StandardErrorPath</key>
-    <string>{log_dir}/reminders-error.log</string>
-    <key>RunAtLoad</key>
-    <true/>
-</dict>
-</plist>
-"""
+    plist_content = _render_plist(
+        "com.kindex.reminders", _kin_command_parts(kin_path) + ["remind", "check"],
+        interval, log_dir / "reminders.log", log_dir / "reminders-error.log",
+    )
 
     if not dry_run:
         launch_agents.mkdir(parents=True, exist_ok=True)
@@ -985,11 +1025,12 @@ def install_reminder_daemon(config: "Config", dry_run: bool = False) -> list[str
     return actions
 
 
+@functools.lru_cache(maxsize=1)
 def _find_kin_path() -> str:
-    """Find the kin executable path."""
-    result = subprocess.run(["which", "kin"], capture_output=True, text=True, timeout=5)
-    if result.returncode == 0 and result.stdout.strip():
-        return result.stdout.strip()
+    """Find the kin executable path (resolved once per process)."""
+    kin = shutil.which("kin")
+    if kin:
+        return kin
     # Fallback to python -m
     import sys
     return f"{sys.executable} -m kindex.cli"
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import datetime as _dt
+import functools
 import json
+import math
 import re
 import sqlite3
+import time
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
 
 
 def _json_default(obj):
@@ -20,9 +24,40 @@ def _json_default(obj):
     raise TypeError(f"Not JSON serializable: {type(obj)}")
 
 
+try:  # optional speedup: pip install kindex[speedups]
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
 def _jdumps(obj):
+    if _orjson is not None:
+        return _orjson.dumps(
+            obj, default=_json_default, option=_orjson.OPT_NON_STR_KEYS).decode()
     return json.dumps(obj, default=_json_default)
 
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+# `except (json.JSONDecodeError, TypeError)` handlers cover both.
+_jloads = _orjson.loads if _orjson is not None else json.loads
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_str_list(raw: str) -> tuple[str, ...] | None:
+    """Decode a JSON array of strings (aka/domains/prov_who), memoized.
+
+    Keyed on the raw text, so a changed column is simply a new key. Returns
+    a tuple (callers copy it to a list) or None when the text isn't a list
+    of strings and should take the uncached path.
+    """
+    try:
+        value = _jloads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return tuple(value)
+    return None
+
 from .config import Config
 from .schema import CREATE_TABLES, SCHEMA_VERSION, edit_class_for
 
@@ -35,6 +70,59 @@ def _uuid() -> str:
     return uuid.uuid4().hex[:12]
 
 
+# bm25 column weights for nodes_fts, in declaration order:
+# id (unindexed), title, content, aka, intent, domains.
+_FTS_BM25 = "bm25(nodes_fts, 0.0, 5.0, 1.0, 3.0, 2.0, 1.0)"
+
+# CTE materialization hints are SQLite 3.35+; older versions get a plain CTE.
+_MATERIALIZED = "MATERIALIZED " if sqlite3.sqlite_version_info >= (3, 35) else ""
+
+# Generated (virtual) columns on nodes: indexable, but not node fields.
+_GENERATED_COLUMNS = ("session_status_g", "project_path_g")
+
+# Operational extra keys, extracted exactly as the idx_nodes_trigger /
+# idx_nodes_owner expression indexes in schema.py spell them (the planner
+# only uses an expression index on a verbatim match).
+_EXTRA_TRIGGER = "CASE WHEN json_valid(extra) THEN json_extract(extra, '$.trigger') END"
+_EXTRA_OWNER = "CASE WHEN json_valid(extra) THEN json_extract(extra, '$.owner') END"
+
+# extra.expires when it is a string, else NULL (malformed extra included).
+_EXTRA_EXPIRES_TEXT = (
+    "(CASE WHEN json_valid(extra) AND json_type(extra, '$.expires') = 'text' "
+    "THEN json_extract(extra, '$.expires') END)"
+)
+
+# A node n with no edge in either direction (orphans() / stats()).
+_ORPHAN_WHERE = (
+    "NOT EXISTS (SELECT 1 FROM edges e WHERE e.from_id = n.id) "
+    "AND NOT EXISTS (SELECT 1 FROM edges e WHERE e.to_id = n.id)"
+)
+
+# operational_summary results are reused for this long (seconds) as long as
+# no write has landed on the database in the meantime.
+_OP_SUMMARY_TTL = 5.0
+
+# Weight decay as one UPDATE per table ({table}/{stamp} are code-supplied).
+# days = whole days since {stamp}; unparseable stamps give NULL and are skipped.
+_DECAY_DAYS = "CAST(julianday(:now) - julianday({stamp}) AS INTEGER)"
+_DECAY_WEIGHT = f"max(0.01, weight * power(0.5, {_DECAY_DAYS} / :half_life))"
+_DECAY_SQL = f"""
+    UPDATE {{table}} SET weight = round({_DECAY_WEIGHT}, 4)
+    WHERE {_DECAY_DAYS} > 0 AND abs({_DECAY_WEIGHT} - weight) > 0.001
+"""
+
+# Columns returned by list_nodes_brief (no content / JSON blobs).
+_BRIEF_COLUMNS = "id, title, type, weight, status, audience, updated_at"
+
+# Ids bound per "IN (?, ...)" query, below SQLite's 999-variable limit on
+# versions before 3.32.
+_IN_BATCH = 500
+
+# get_node's last_accessed touches are buffered and written with the next
+# commit; this many pending touches force a flush of their own.
+_TOUCH_FLUSH_AT = 256
+
+
 class EditPolicyError(ValueError):
     """An edit was refused by the node-type edit policy."""
 
@@ -106,6 +194,46 @@ def active_lock(node: dict) -> dict | None:
     return lock
 
 
+def _decode_node(d: dict) -> dict:
+    """Decode a raw nodes row dict in place: JSON columns, tags alias."""
+    for key in _GENERATED_COLUMNS:
+        d.pop(key, None)
+    for key in ("aka", "domains", "prov_who", "extra"):
+        if key in d and isinstance(d[key], str):
+            if key != "extra":
+                # Same few short lists recur across rows; extra is
+                # nested and mutated by callers, so it's always decoded.
+                cached = _decode_str_list(d[key])
+                if cached is not None:
+                    d[key] = list(cached)
+                    continue
+            try:
+                d[key] = _jloads(d[key])
+            except (json.JSONDecodeError, TypeError):
+                pass
+    d["tags"] = d.get("domains") or []
+    return d
+
+
+@functools.lru_cache(maxsize=256)
+def _build_fts_query(query: str) -> tuple[str, str] | None:
+    """(FTS5 MATCH expression, plain phrase) for a search string, or None.
+
+    Memoized: interactive and hook searches repeat the same terms.
+    """
+    # Strip punctuation and FTS5 special chars, keep only words
+    tokens = re.findall(r'\w+', query.lower())
+    if not tokens:
+        return None
+    # Build FTS5 query: quoted phrase OR individual tokens. Tokens of two or
+    # more characters match as prefixes ("stig" finds "stigmergy"), served
+    # by the nodes_fts prefix index.
+    phrase = " ".join(tokens)
+    safe_phrase = phrase.replace('"', '""')
+    token_expr = " OR ".join(f"{t}*" if len(t) >= 2 else t for t in tokens)
+    return f'"{safe_phrase}" OR {token_expr}', phrase
+
+
 def node_expired(node: dict, today: str | None = None) -> bool:
     """True if extra['expires'] (YYYY-MM-DD) is strictly in the past.
 
@@ -127,34 +255,90 @@ class Store:
     human-readable canonical source; the store indexes them.
     """
 
-    def __init__(self, config: Config, *, sqlite_timeout: float = 5.0):
+    def __init__(self, config: Config, *, sqlite_timeout: float = 5.0,
+                 in_memory: bool = False):
         self.config = config
+        # in_memory: a private ":memory:" database on one connection, with no
+        # journal fsyncs. Gone on close(); meant for tests.
+        self._in_memory = in_memory
                 # Support both kindex.db (new) and conv.db (legacy)
         new_db = config.data_path / "kindex.db"
         old_db = config.data_path / "conv.db"
         self.db_path = old_db if old_db.exists() and not new_db.exists() else new_db
         self._conn: sqlite3.Connection | None = None
+        self._read_conn: sqlite3.Connection | None = None
         self._sqlite_timeout = max(0.0, float(sqlite_timeout))
         # Profile stamp guard: configs that carry an active_profile (added by
         # the profiles feature) bind this database to that profile name.
         self._expected_profile: str | None = getattr(config, "active_profile", None)
+        # (trigger, owner) -> (monotonic ts, write generation, summary)
+        self._op_cache: dict[tuple, tuple[float, tuple[int, int], dict]] = {}
+        self._tx_depth = 0
+        # node id -> last_accessed timestamp not yet written
+        self._touch_buffer: dict[str, str] = {}
 
     @property
     def conn(self) -> sqlite3.Connection:
         if self._conn is None:
-            self.config.data_path.mkdir(parents=True, exist_ok=True)
-            self._conn = sqlite3.connect(
-                str(self.db_path),
-                timeout=self._sqlite_timeout,
-            )
+            if self._in_memory:
+                self._conn = sqlite3.connect(":memory:", cached_statements=256)
+            else:
+                self.config.data_path.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(
+                    str(self.db_path),
+                    timeout=self._sqlite_timeout,
+                    cached_statements=256,
+                )
             self._conn.row_factory = sqlite3.Row
             self._conn.execute(f"PRAGMA busy_timeout={int(self._sqlite_timeout * 1000)}")
-            self._conn.execute("PRAGMA journal_mode=WAL")
+            if self._in_memory:
+                self._conn.execute("PRAGMA journal_mode=MEMORY")
+                self._conn.execute("PRAGMA synchronous=OFF")
+            else:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                # WAL + NORMAL: commits no longer fsync; durability across power
+                # loss is bounded to the last checkpoint, never corruption.
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            # 64 MB page cache, in-memory temp b-trees (ORDER BY / GROUP BY
+            # spills), memory-mapped reads, and an explicit checkpoint cadence.
+            self._conn.execute("PRAGMA cache_size=-65536")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA mmap_size=1073741824")
+            self._conn.execute("PRAGMA wal_autocheckpoint=1000")
             self._conn.execute("PRAGMA foreign_keys=ON")
+            try:
+                self._conn.execute("SELECT power(2, 1)")
+            except sqlite3.OperationalError:
+                # SQLite built without math functions: weight decay needs power()
+                self._conn.create_function("power", 2, math.pow, deterministic=True)
             self._init_schema()
             self._check_profile_stamp()
         return self._conn
 
+    @property
+    def read_conn(self) -> sqlite3.Connection:
+        """A query_only connection for listing and search SELECTs.
+
+        Under WAL it reads the last committed snapshot without waiting on,
+        or holding up, the writer connection. While this store has a write
+        transaction open it returns the writer instead, so a caller always
+        sees its own uncommitted changes. An in-memory store has only the
+        writer.
+        """
+        writer = self.conn  # schema init + profile check happen here
+        if writer.in_transaction or self._in_memory:
+            return writer
+        if self._read_conn is None:
+            rc = sqlite3.connect(str(self.db_path), timeout=self._sqlite_timeout)
+            rc.row_factory = sqlite3.Row
+            rc.execute(f"PRAGMA busy_timeout={int(self._sqlite_timeout * 1000)}")
+            rc.execute("PRAGMA cache_size=-65536")
+            rc.execute("PRAGMA temp_store=MEMORY")
+            rc.execute("PRAGMA mmap_size=1073741824")
+            rc.execute("PRAGMA query_only=1")
+            self._read_conn = rc
+        return self._read_conn
+
     def _check_profile_stamp(self) -> None:
         """Enforce the per-database profile stamp (meta key 'kin_profile').
 
@@ -356,6 +540,86 @@ class Store:
             except Exception:
                 pass
 
+        if current_version < 8:
+            # v8: rebuild nodes_fts with a prefix index and porter tokenizer.
+            # FTS5 options are fixed at CREATE time, so the virtual table is
+            # recreated and repopulated from the nodes content table.
+            try:
+                c.executescript("""
+                    DROP TABLE IF EXISTS nodes_fts;
+                    CREATE VIRTUAL TABLE nodes_fts USING fts5(
+                        id UNINDEXED,
+                        title,
+                        content,
+                        aka,
+                        intent,
+                        domains,
+                        content=nodes,
+                        content_rowid=rowid,
+                        prefix='2 3 4',
+                        tokenize='porter unicode61 remove_diacritics 2'
+                    );
+                    INSERT INTO nodes_fts(nodes_fts) VALUES('rebuild');
+                """)
+                c.commit()
+            except Exception:
+                pass
+
+        if current_version < 9:
+            # v9: FTS update trigger fires only when an indexed column changes
+            try:
+                c.executescript("""
+                    DROP TRIGGER IF EXISTS nodes_au;
+                    CREATE TRIGGER nodes_au
+                    AFTER UPDATE OF id, title, content, aka, intent, domains ON nodes BEGIN
+                        INSERT INTO nodes_fts(nodes_fts, rowid, id, title, content, aka, intent, domains)
+                        VALUES ('delete', old.rowid, old.id, old.title, old.content, old.aka, old.intent, old.domains);
+                        INSERT INTO nodes_fts(rowid, id, title, content, aka, intent, domains)
+                        VALUES (new.rowid, new.id, new.title, new.content, new.aka, new.intent, new.domains);
+                    END;
+                """)
+                c.commit()
+            except Exception:
+                pass
+
+        if current_version < 10:
+            # v10: generated session columns (indexed in CREATE_TABLES)
+            for col, path in (("session_status_g", "$.session_status"),
+                              ("project_path_g", "$.project_path")):
+                try:
+                    c.execute(
+                        f"ALTER TABLE nodes ADD COLUMN {col} TEXT GENERATED ALWAYS AS "
+                        f"(CASE WHEN json_valid(extra) THEN json_extract(extra, '{path}') END) "
+                        "VIRTUAL"
+                    )
+                    c.commit()
+                except Exception:
+                    pass  # column already exists
+            try:
+                c.execute("DROP INDEX IF EXISTS idx_nodes_session_status")
+                c.commit()
+            except Exception:
+                pass
+
+        if current_version < 11:
+            # v11: node_aka alias table (triggers come from CREATE_TABLES);
+            # backfill it from the existing aka JSON.
+            try:
+                c.execute(
+                    "CREATE TABLE IF NOT EXISTS node_aka ("
+                    "alias_lc TEXT NOT NULL, node_id TEXT NOT NULL, "
+                    "PRIMARY KEY (alias_lc, node_id)) WITHOUT ROWID"
+                )
+                c.execute(
+                    "INSERT OR IGNORE INTO node_aka (alias_lc, node_id) "
+                    "SELECT lower(j.value), n.id FROM nodes n, json_each("
+                    "CASE WHEN json_valid(n.aka) THEN n.aka ELSE '[]' END) j "
+                    "WHERE j.type = 'text'"
+                )
+                c.commit()
+            except Exception:
+                pass
+
         if current_version < SCHEMA_VERSION:
             c.execute(
                 "UPDATE meta SET value = ? WHERE key = 'schema_version'",
@@ -365,14 +629,81 @@ class Store:
 
     def close(self) -> None:
         if self._conn:
+            try:
+                self.flush_touches()
+            except sqlite3.Error:
+                pass  # access times are best-effort; never block a close
             self._conn.close()
             self._conn = None
+        if self._read_conn:
+            self._read_conn.close()
+            self._read_conn = None
+        self._op_cache.clear()
+        self._touch_buffer.clear()
+
+    # ── Transactions ─────────────────────────────────────────────────
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run a block of writes as one BEGIN IMMEDIATE transaction.
+
+        Store methods called inside the block join it instead of committing
+        on their own, so a multi-step operation pays for a single commit and
+        lands all-or-nothing. Nested transaction() blocks join the outermost
+        one; an implicit transaction left open by a bare conn.execute() write
+        is adopted rather than tripping "transaction within a transaction".
+        Rolls back and re-raises on any exception.
+        """
+        conn = self.conn
+        if self._tx_depth:
+            self._tx_depth += 1
+            try:
+                yield conn.cursor()
+            finally:
+                self._tx_depth -= 1
+            return
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        self._tx_depth = 1
+        try:
+            yield conn.cursor()
+            self._write_touches()
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._tx_depth = 0
+
+    def _commit(self) -> None:
+        """Commit, unless an enclosing transaction() will do it."""
+        if not self._tx_depth:
+            self._write_touches()
+            self.conn.commit()
+
+    def _write_touches(self) -> None:
+        """Write buffered last_accessed touches into the open transaction."""
+        if self._touch_buffer:
+            pending = [(ts, nid) for nid, ts in self._touch_buffer.items()]
+            self._touch_buffer.clear()
+            self.conn.executemany(
+                "UPDATE nodes SET last_accessed = ? WHERE id = ?", pending)
+
+    def flush_touches(self) -> None:
+        """Persist buffered last_accessed touches now (one transaction)."""
+        if self._touch_buffer:
+            with self.transaction():
+                pass  # transaction() writes the buffer before committing
 
     # ── Activity logging ─────────────────────────────────────────────
 
     def _log(self, action: str, target_id: str = "", target_title: str = "",
              actor: str = "", details: dict | None = None) -> None:
-        """Record an action in the activity log."""
+        """Record an action in the activity log.
+
+        Never commits: the row joins the caller's write, which commits it
+        together with the change it describes.
+        """
         try:
             self.conn.execute(
                 """INSERT INTO activity_log (action, target_id, target_title, actor, details)
@@ -380,14 +711,13 @@ class Store:
                 (action, target_id, target_title, actor,
                  _jdumps(details or {})),
             )
-            self.conn.commit()
         except Exception:
             pass  # don't let logging break operations
 
     def recent_activity(self, limit: int = 50) -> list[dict]:
         """Get recent activity log entries."""
         try:
-            rows = self.conn.execute(
+            rows = self.read_conn.execute(
                 "SELECT * FROM activity_log ORDER BY timestamp DESC LIMIT ?",
                 (limit,),
             ).fetchall()
@@ -396,7 +726,7 @@ class Store:
                 d = dict(r)
                 if isinstance(d.get("details"), str):
                     try:
-                        d["details"] = json.loads(d["details"])
+                        d["details"] = _jloads(d["details"])
                     except (json.JSONDecodeError, TypeError):
                         pass
                 result.append(d)
@@ -421,7 +751,7 @@ class Store:
                 d = dict(r)
                 if isinstance(d.get("details"), str):
                     try:
-                        d["details"] = json.loads(d["details"])
+                        d["details"] = _jloads(d["details"])
                     except (json.JSONDecodeError, TypeError):
                         pass
                 result.append(d)
@@ -431,11 +761,10 @@ class Store:
 
     def nodes_changed_since(self, since_iso: str) -> list[dict]:
         """Get nodes that were updated since a timestamp."""
-        rows = self.conn.execute(
+        return self._node_rows(self.conn.execute(
             "SELECT * FROM nodes WHERE updated_at >= ? ORDER BY updated_at DESC",
             (since_iso,),
-        ).fetchall()
-        return [self._row_to_dict(r) for r in rows]
+        ))
 
     def activity_by_actor(self, actor: str, limit: int = 50) -> list[dict]:
         """Get activity by a specific actor."""
@@ -449,7 +778,7 @@ class Store:
                 d = dict(r)
                 if isinstance(d.get("details"), str):
                     try:
-                        d["details"] = json.loads(d["details"])
+                        d["details"] = _jloads(d["details"])
                     except (json.JSONDecodeError, TypeError):
                         pass
                 result.append(d)
@@ -467,9 +796,9 @@ class Store:
                VALUES (?, ?, ?, ?)""",
             (concept_a, concept_b, reason, source),
         )
-        self.conn.commit()
         self._log("add_suggestion", f"{concept_a}->{concept_b}", "",
                   details={"reason": reason, "source": source})
+        self._commit()
         return cur.lastrowid
 
     def pending_suggestions(self, limit: int = 20) -> list[dict]:
@@ -511,9 +840,9 @@ class Store:
             "UPDATE suggestions SET status = ? WHERE id = ?",
             (status, suggestion_id),
         )
-        self.conn.commit()
         self._log("update_suggestion", str(suggestion_id), "",
                   details={"status": status})
+        self._commit()
 
     # ── Node operations ────────────────────────────────────────────────
 
@@ -545,67 +874,102 @@ class Store:
         nid = node_id or _uuid()
         now = _now()
         when = prov_when or now
-        self.conn.execute(
-            """INSERT OR REPLACE INTO nodes
-               (id, type, title, content, aka, intent,
-                prov_who, prov_when, prov_activity, prov_why, prov_source,
-                weight, domains, status, audience,
-                created_at, updated_at, last_accessed, extra)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (nid, node_type, title, content,
-             _jdumps(aka or []), intent,
-             _jdumps(prov_who or []), when, prov_activity, prov_why, prov_source,
-             weight, _jdumps(domains or []), status, audience,
-             now, now, now, _jdumps(extra or {})),
-        )
-        self.conn.commit()
-        actor = (prov_who or [""])[0] if prov_who else ""
-        self._log("add_node", nid, title, actor,
-                  {"type": node_type, "activity": prov_activity})
-
-        # Auto-create person nodes from prov_who entries
-        if prov_who and node_type != "person" and prov_activity not in ("auto-created", ""):
-            for person_name in prov_who:
-                if not person_name:
-                    continue
-                existing_person = self.get_node_by_title(person_name)
-                if existing_person is None:
-                    existing_person = self.get_node(person_name)
-                if existing_person is None:
-                    self.add_node(
-                        person_name,
-                        node_type="person",
-                        prov_activity="auto-created",
-                        prov_why=f"Referenced in prov_who of '{title}'",
-                    )
-                    existing_person = self.get_node_by_title(person_name)
-                if existing_person:
-                    self.add_edge(nid, existing_person["id"],
+        # The row, its log entry, any auto-created people and their edges,
+        # and the embedding enqueue land in one commit.
+        with self.transaction():
+            self.conn.execute(
+                """INSERT OR REPLACE INTO nodes
+                   (id, type, title, content, aka, intent,
+                    prov_who, prov_when, prov_activity, prov_why, prov_source,
+                    weight, domains, status, audience,
+                    created_at, updated_at, last_accessed, extra)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (nid, node_type, title, content,
+                 _jdumps(aka or []), intent,
+                 _jdumps(prov_who or []), when, prov_activity, prov_why, prov_source,
+                 weight, _jdumps(domains or []), status, audience,
+                 now, now, now, _jdumps(extra or {})),
+            )
+            actor = (prov_who or [""])[0] if prov_who else ""
+            self._log("add_node", nid, title, actor,
+                      {"type": node_type, "activity": prov_activity})
+
+            # Auto-create person nodes from prov_who entries
+            if prov_who and node_type != "person" and prov_activity not in ("auto-created", ""):
+                # Each distinct name is resolved once; a newly created person
+                # is linked by the id add_node returns, not a second lookup.
+                for person_name in dict.fromkeys(filter(None, prov_who)):
+                    person = self.get_node_by_title(person_name)
+                    if person is None:
+                        person = self.get_node(person_name)
+                    if person is not None:
+                        person_id = person["id"]
+                    else:
+                        person_id = self.add_node(
+                            person_name,
+                            node_type="person",
+                            prov_activity="auto-created",
+                            prov_why=f"Referenced in prov_who of '{title}'",
+                        )
+                    self.add_edge(nid, person_id,
                                   edge_type="context_of",
                                   weight=0.4,
                                   provenance="auto-linked from prov_who",
                                   bidirectional=False)
 
-        # Queue for vector embedding — deferred to the daemon so a slow
-        # embedding provider never stalls the add hot path (best-effort).
-        try:
-            from .vectors import enqueue_embedding
-            enqueue_embedding(self, nid)
-        except Exception:
-            pass  # vectors not installed — node still created
+            # Queue for vector embedding — deferred to the daemon so a slow
+            # embedding provider never stalls the add hot path (best-effort).
+            try:
+                from .vectors import enqueue_embedding
+                enqueue_embedding(self, nid)
+            except Exception:
+                pass  # vectors not installed — node still created
 
         return nid
 
     def get_node(self, node_id: str) -> dict | None:
-        """Fetch a node by ID, updating last_accessed."""
+        """Fetch a node by ID, updating last_accessed.
+
+        The touch is buffered and rides along with the next commit (or
+        flush_touches/close), so reads never open a write transaction.
+        """
         row = self.conn.execute("SELECT * FROM nodes WHERE id = ?", (node_id,)).fetchone()
         if row is None:
             return None
-        self.conn.execute(
-            "UPDATE nodes SET last_accessed = ? WHERE id = ?", (_now(), node_id))
-        self.conn.commit()
+        self.touch_nodes([node_id])
         return self._row_to_dict(row)
 
+    def touch_nodes(self, node_ids: list[str]) -> None:
+        """Buffer a last_accessed touch for nodes read outside get_node()."""
+        now = _now()
+        for node_id in node_ids:
+            self._touch_buffer[node_id] = now
+        if len(self._touch_buffer) >= _TOUCH_FLUSH_AT:
+            self.flush_touches()
+
+    def get_nodes_minimal(self, ids: list[str],
+                          cols: tuple[str, ...] = ("id", "title", "type"),
+                          ) -> dict[str, dict]:
+        """Fetch a few raw columns for many nodes in one query (non-mutating).
+
+        Returns {id: {col: value}} for the ids that exist; does not touch
+        last_accessed or decode JSON columns. Ids are bound in batches of
+        _IN_BATCH, so any number may be passed. ``cols`` are code-supplied
+        column names, never user input.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return {}
+        select = ", ".join(dict.fromkeys(("id", *cols)))
+        found: dict[str, dict] = {}
+        for start in range(0, len(ids), _IN_BATCH):
+            batch = ids[start:start + _IN_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            for r in self.conn.execute(
+                    f"SELECT {select} FROM nodes WHERE id IN ({placeholders})", batch):
+                found[r["id"]] = dict(r)
+        return found
+
     def get_node_domains(self, node_id: str) -> list[str]:
         """Read a node's domains/tags without touching last_accessed (non-mutating).
 
@@ -619,7 +983,7 @@ class Store:
         if not row or not row[0]:
             return []
         try:
-            return json.loads(row[0])
+            return _jloads(row[0])
         except (json.JSONDecodeError, TypeError):
             return []
 
@@ -630,14 +994,25 @@ class Store:
             "SELECT * FROM nodes WHERE lower(title) = lower(?)", (title,)).fetchone()
         if row:
             return self._row_to_dict(row)
-        # AKA match: search JSON array for alias
+        # AKA match via the node_aka alias index (oldest node wins)
+        row = self.conn.execute(
+            "SELECT n.* FROM node_aka a JOIN nodes n ON n.id = a.node_id "
+            "WHERE a.alias_lc = lower(?) ORDER BY n.rowid LIMIT 1",
+            (title,)).fetchone()
+        if row:
+            return self._row_to_dict(row)
+        if title.isascii():
+            return None
+        # SQLite's lower() only folds ASCII, so a non-ASCII name ("Überblick")
+        # is compared against the aliases with Python's str.lower().
         lower = title.lower()
-        rows = self.conn.execute(
-            "SELECT * FROM nodes WHERE aka != '[]' AND aka != ''").fetchall()
-        for r in rows:
-            d = self._row_to_dict(r)
-            if any(a.lower() == lower for a in (d.get("aka") or [])):
-                return d
+        for alias, node_id in self.conn.execute(
+                "SELECT a.alias_lc, a.node_id FROM node_aka a "
+                "JOIN nodes n ON n.id = a.node_id ORDER BY n.rowid"):
+            if alias.lower() == lower:
+                row = self.conn.execute(
+                    "SELECT * FROM nodes WHERE id = ?", (node_id,)).fetchone()
+                return self._row_to_dict(row)
         return None
 
     def update_node(self, node_id: str, _log_activity: bool = True,
@@ -672,10 +1047,10 @@ class Store:
         sets = ", ".join(f"{k} = ?" for k in updates)
         vals = list(updates.values()) + [node_id]
         self.conn.execute(f"UPDATE nodes SET {sets} WHERE id = ?", vals)
-        self.conn.commit()
         if _log_activity:
             self._log("update_node", node_id, "",
                       details={"fields": list(fields.keys())})
+        self._commit()
 
     def delete_node(self, node_id: str) -> None:
         # Capture title before deletion for logging
@@ -684,14 +1059,14 @@ class Store:
         self.conn.execute("DELETE FROM edges WHERE from_id = ? OR to_id = ?",
                           (node_id, node_id))
         self.conn.execute("DELETE FROM nodes WHERE id = ?", (node_id,))
-        self.conn.commit()
+        self._log("delete_node", node_id, title)
+        self._commit()
         # Drop the vector embedding too (best-effort — table may not exist)
         try:
             from .vectors import delete_embedding
             delete_embedding(self, node_id)
         except Exception:
             pass
-        self._log("delete_node", node_id, title)
 
     def all_nodes(self, node_type: str | None = None,
                   status: str | None = None,
@@ -716,14 +1091,33 @@ class Store:
                 params.append(f'%"{tag}"%')
         q += " ORDER BY weight DESC, updated_at DESC LIMIT ?"
         params.append(limit)
-        rows = self.conn.execute(q, params).fetchall()
-        return [self._row_to_dict(r) for r in rows]
+        return self._node_rows(self.read_conn.execute(q, params))
+
+    def list_nodes_brief(self, node_type: str | None = None,
+                         status: str | None = None,
+                         limit: int = 500) -> list[dict]:
+        """Like all_nodes, but only the columns a listing shows.
+
+        Returns id/title/type/weight/status/audience/updated_at per node: no
+        content or JSON blobs are read or decoded, and last_accessed is not
+        touched.
+        """
+        q = f"SELECT {_BRIEF_COLUMNS} FROM nodes WHERE 1=1"
+        params: list = []
+        if node_type:
+            q += " AND type = ?"
+            params.append(node_type)
+        if status:
+            q += " AND status = ?"
+            params.append(status)
+        q += " ORDER BY weight DESC, updated_at DESC LIMIT ?"
+        params.append(limit)
+        return [dict(r) for r in self.read_conn.execute(q, params).fetchall()]
 
     def recent_nodes(self, n: int = 20) -> list[dict]:
-        rows = self.conn.execute(
+        return self._node_rows(self.read_conn.execute(
             "SELECT * FROM nodes ORDER BY updated_at DESC LIMIT ?", (n,)
-        ).fetchall()
-        return [self._row_to_dict(r) for r in rows]
+        ))
 
     def nodes_with_expiry(self, status: str = "active",
                           limit: int = 1000) -> list[dict]:
@@ -732,12 +1126,11 @@ class Store:
         The `"expires"` pattern (quote-delimited) deliberately does not match
         `"expires_at"` lock timestamps. Callers confirm with node_expired().
         """
-        rows = self.conn.execute(
+        return self._node_rows(self.conn.execute(
             "SELECT * FROM nodes WHERE status = ? AND extra LIKE ? "
             "ORDER BY updated_at DESC LIMIT ?",
             (status, '%"expires"%', limit),
-        ).fetchall()
-        return [self._row_to_dict(r) for r in rows]
+        ))
 
     # ── Edit / supersede / atomic extra ─────────────────────────────────
 
@@ -920,13 +1313,14 @@ class Store:
                 diffs["expires"] = {"old": exp_diff["old"],
                                     "new": exp_diff["new"]}
 
-        if updates:
-            # _log_activity=False: edit_node writes its own (richer) entry
-            # below — without it every edit appears twice in the changelog.
-            self.update_node(node_id, _log_activity=False, **updates)
         if updates or exp_diff:
-            self._log("edit_node", node_id, updates.get("title", old_title),
-                      actor or "", {"diffs": diffs, "type": node_type})
+            with self.transaction():
+                if updates:
+                    # _log_activity=False: edit_node writes its own (richer)
+                    # entry below — without it every edit appears twice.
+                    self.update_node(node_id, _log_activity=False, **updates)
+                self._log("edit_node", node_id, updates.get("title", old_title),
+                          actor or "", {"diffs": diffs, "type": node_type})
             if "title" in updates or "content" in updates:
                 # Queue re-embedding — deferred to the daemon so a slow
                 # embedding provider never stalls the edit hot path
@@ -988,8 +1382,7 @@ class Store:
             new_extra["supersede_reason"] = reason
 
         conn = self.conn
-        conn.execute("BEGIN IMMEDIATE")
-        try:
+        with self.transaction():
             # Re-verify status inside the transaction: two concurrent
             # supersedes serialize on BEGIN IMMEDIATE, so the second one
             # must see the first's status flip and abort instead of
@@ -1000,7 +1393,7 @@ class Store:
             if row is None:
                 raise KeyError(f"No node with id '{node_id}'")
             try:
-                cur_extra = json.loads(row["extra"] or "{}")
+                cur_extra = _jloads(row["extra"] or "{}")
             except (json.JSONDecodeError, TypeError):
                 cur_extra = {}
             if not isinstance(cur_extra, dict):
@@ -1055,13 +1448,8 @@ class Store:
                 "WHERE node_id = ?",
                 (new_id, node_id),
             )
-            conn.commit()
-        except BaseException:
-            conn.rollback()
-            raise
-
-        self._log("supersede_node", new_id, title, actor or "",
-                  {"superseded": node_id, "reason": reason or ""})
+            self._log("supersede_node", new_id, title, actor or "",
+                      {"superseded": node_id, "reason": reason or ""})
 
         # Drop the old node's embedding so vector search stops surfacing the
         # superseded text (best-effort — table may not exist).
@@ -1082,41 +1470,69 @@ class Store:
         return self.get_node(new_id)
 
     def atomic_extra_update(
-        self, node_id: str, mutator: Callable[[dict], dict | None]
+        self, node_id: str, mutator: Callable[[dict], dict | None],
+        *, now: str | None = None,
     ) -> dict:
         """Atomically read-modify-write a node's extra JSON.
 
         BEGIN IMMEDIATE serializes concurrent writers (no lost updates across
         Store handles). The mutator may return a replacement dict or mutate
         its argument in place and return None. Returns the final extra dict.
+        A mutation that leaves extra unchanged writes nothing (no UPDATE, no
+        updated_at bump, no FTS trigger). ``now`` stamps updated_at, so callers
+        recording their own timestamps in extra can keep them identical.
         Raises KeyError on a missing node.
         """
         conn = self.conn
-        conn.execute("BEGIN IMMEDIATE")
-        try:
+        with self.transaction():
             row = conn.execute(
                 "SELECT extra FROM nodes WHERE id = ?", (node_id,)
             ).fetchone()
             if row is None:
                 raise KeyError(f"No node with id '{node_id}'")
             try:
-                extra = json.loads(row["extra"] or "{}")
+                extra = _jloads(row["extra"] or "{}")
             except (json.JSONDecodeError, TypeError):
                 extra = {}
             if not isinstance(extra, dict):
                 extra = {}
             replacement = mutator(extra)
             final = extra if replacement is None else replacement
-            conn.execute(
-                "UPDATE nodes SET extra = ?, updated_at = ? WHERE id = ?",
-                (_jdumps(final), _now(), node_id),
-            )
-            conn.commit()
-        except BaseException:
-            conn.rollback()
-            raise
+            payload = _jdumps(final)
+            if payload != row["extra"]:
+                conn.execute(
+                    "UPDATE nodes SET extra = ?, updated_at = ? WHERE id = ?",
+                    (payload, now or _now(), node_id),
+                )
         return final
 
+    def patch_node_extra(self, node_id: str, updates: dict[str, Any],
+                         *, now: str | None = None) -> bool:
+        """Set top-level extra keys in place with a single json_set UPDATE.
+
+        For blind writes that don't depend on the current extra: no Python
+        read/decode/encode round-trip, and the UPDATE is atomic on its own.
+        Malformed extra is treated as {}. ``now`` stamps updated_at, as in
+        atomic_extra_update. Returns False on a missing node.
+        """
+        if not updates:
+            return self.conn.execute(
+                "SELECT 1 FROM nodes WHERE id = ?", (node_id,)
+            ).fetchone() is not None
+        args: list = []
+        for key, value in updates.items():
+            args.append(f'$."{key}"')
+            args.append(_jdumps(value))
+        pairs = ", ".join(["?, json(?)"] * len(updates))
+        cur = self.conn.execute(
+            "UPDATE nodes SET extra = json_set("
+            "CASE WHEN json_valid(extra) AND json_type(extra) = 'object' "
+            f"THEN extra ELSE '{{}}' END, {pairs}), updated_at = ? WHERE id = ?",
+            (*args, now or _now(), node_id),
+        )
+        self._commit()
+        return cur.rowcount > 0
+
     def atomic_archive_expired(self, node_id: str, expired_at: str) -> bool:
         """Archive a node iff its fresh extra['expires'] is still past.
 
@@ -1127,21 +1543,19 @@ class Store:
         UPDATE. Returns True when the node was archived.
         """
         conn = self.conn
-        conn.execute("BEGIN IMMEDIATE")
-        try:
+        with self.transaction():
             row = conn.execute(
                 "SELECT status, extra FROM nodes WHERE id = ?", (node_id,)
             ).fetchone()
             fresh_extra: dict | None = None
             if row is not None and (row["status"] or "active") == "active":
                 try:
-                    parsed = json.loads(row["extra"] or "{}")
+                    parsed = _jloads(row["extra"] or "{}")
                 except (json.JSONDecodeError, TypeError):
                     parsed = {}
                 if isinstance(parsed, dict) and node_expired({"extra": parsed}):
                     fresh_extra = parsed
             if fresh_extra is None:
-                conn.rollback()
                 return False
             fresh_extra["expired_at"] = expired_at
             conn.execute(
@@ -1149,10 +1563,6 @@ class Store:
                 "updated_at = ? WHERE id = ?",
                 (_jdumps(fresh_extra), _now(), node_id),
             )
-            conn.commit()
-        except BaseException:
-            conn.rollback()
-            raise
         return True
 
     # ── Edge operations ────────────────────────────────────────────────
@@ -1160,21 +1570,36 @@ class Store:
     def add_edge(self, from_id: str, to_id: str, edge_type: str = "relates_to",
                  weight: float = 0.5, provenance: str = "",
                  bidirectional: bool = True) -> None:
-        """Add an edge. Bidirectional by default (enforces graph invariant)."""
-        self.conn.execute(
-            """INSERT OR REPLACE INTO edges (from_id, to_id, type, weight, provenance)
-               VALUES (?, ?, ?, ?, ?)""",
-            (from_id, to_id, edge_type, weight, provenance),
-        )
-        if bidirectional:
-            self.conn.execute(
-                """INSERT OR IGNORE INTO edges (from_id, to_id, type, weight, provenance)
+        """Add an edge. Bidirectional by default (enforces graph invariant).
+
+        The edge pair and its activity-log row land in one commit.
+        """
+        self.add_edges_bulk([(from_id, to_id, edge_type, provenance)],
+                            weight=weight, bidirectional=bidirectional)
+
+    def add_edges_bulk(self, edges: list[tuple[str, str, str, str]],
+                       weight: float = 0.5, bidirectional: bool = True) -> None:
+        """Add many (from_id, to_id, edge_type, provenance) edges in one commit.
+
+        Same semantics as add_edge per edge, batched through executemany.
+        """
+        if not edges:
+            return
+        with self.transaction():
+            self.conn.executemany(
+                """INSERT OR REPLACE INTO edges (from_id, to_id, type, weight, provenance)
                    VALUES (?, ?, ?, ?, ?)""",
-                (to_id, from_id, edge_type, weight * 0.8, provenance),
+                [(f, t, et, weight, prov) for f, t, et, prov in edges],
             )
-        self.conn.commit()
-        self._log("add_edge", f"{from_id}->{to_id}", "",
-                  details={"type": edge_type, "weight": weight})
+            if bidirectional:
+                self.conn.executemany(
+                    """INSERT OR IGNORE INTO edges (from_id, to_id, type, weight, provenance)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    [(t, f, et, weight * 0.8, prov) for f, t, et, prov in edges],
+                )
+            for f, t, et, _ in edges:
+                self._log("add_edge", f"{f}->{t}", "",
+                          details={"type": et, "weight": weight})
 
     def edges_from(self, node_id: str) -> list[dict]:
         rows = self.conn.execute(
@@ -1196,91 +1621,66 @@ class Store:
 
     def orphans(self) -> list[dict]:
         """Nodes with no edges (violates graph health invariant)."""
-        rows = self.conn.execute(
-            """SELECT * FROM nodes WHERE id NOT IN
-               (SELECT from_id FROM edges UNION SELECT to_id FROM edges)"""
-        ).fetchall()
-        return [self._row_to_dict(r) for r in rows]
+        # Two anti-join probes on idx_edges_from / idx_edges_to instead of
+        # materializing the set of every edge endpoint.
+        return self._node_rows(self.conn.execute(
+            f"SELECT n.* FROM nodes n WHERE {_ORPHAN_WHERE}"
+        ))
 
     # ── FTS5 search ────────────────────────────────────────────────────
 
     def fts_search(self, query: str, limit: int = 20) -> list[dict]:
         """Full-text search using FTS5 BM25 ranking."""
-        import re
-        # Strip punctuation and FTS5 special chars, keep only words
-        tokens = re.findall(r'\w+', query.lower())
-        if not tokens:
+        built = _build_fts_query(query)
+        if built is None:
             return []
-        # Build FTS5 query: quoted phrase OR individual tokens
-        phrase = " ".join(tokens)
-        safe_phrase = phrase.replace('"', '""')
-        token_expr = " OR ".join(tokens)
-        fts_query = f'"{safe_phrase}" OR {token_expr}'
+        fts_query, phrase = built
         try:
-            rows = self.conn.execute(
-                """SELECT n.*, rank FROM nodes_fts
-                   JOIN nodes n ON n.id = nodes_fts.id
-                   WHERE nodes_fts MATCH ? AND n.status != 'superseded'
-                   ORDER BY rank LIMIT ?""",
+            # Title and alias hits outweigh body mentions. The MATCH runs
+            # alone in a (where supported, materialized) CTE so filters on
+            # nodes can never pull the planner off the FTS index; nodes is
+            # then probed by rowid.
+            return self._node_rows(self.read_conn.execute(
+                f"""WITH m AS {_MATERIALIZED}(
+                       SELECT rowid, {_FTS_BM25} AS rank FROM nodes_fts
+                       WHERE nodes_fts MATCH ?)
+                   SELECT n.*, m.rank FROM m
+                   JOIN nodes n ON n.rowid = m.rowid
+                   WHERE n.status != 'superseded'
+                   ORDER BY m.rank LIMIT ?""",
                 (fts_query, limit),
-            ).fetchall()
+            ))
         except sqlite3.OperationalError:
             # Fallback: simple LIKE search if FTS query syntax fails
-            rows = self.conn.execute(
+            return self._node_rows(self.read_conn.execute(
                 """SELECT *, 0 as rank FROM nodes
                    WHERE (title LIKE ? OR content LIKE ?)
                      AND status != 'superseded'
                    ORDER BY weight DESC LIMIT ?""",
                 (f"%{phrase}%", f"%{phrase}%", limit),
-            ).fetchall()
-        return [self._row_to_dict(r) for r in rows]
+            ))
 
     # ── Weight decay ───────────────────────────────────────────────────
 
     def apply_weight_decay(self, node_half_life_days: int = 90,
                            edge_half_life_days: int = 30) -> int:
-        """Decay weights based on last access time. Returns count of affected nodes."""
-        now = datetime.now()
-
-        # Node decay
-        rows = self.conn.execute("SELECT id, weight, last_accessed FROM nodes").fetchall()
-        count = 0
-        for row in rows:
-            try:
-                last = datetime.fromisoformat(row["last_accessed"])
-            except (ValueError, TypeError):
-                continue
-            days_since = (now - last).days
-            if days_since <= 0:
-                continue
-            decay = 0.5 ** (days_since / node_half_life_days)
-            new_weight = max(0.01, row["weight"] * decay)
-            if abs(new_weight - row["weight"]) > 0.001:
-                self.conn.execute(
-                    "UPDATE nodes SET weight = ? WHERE id = ?",
-                    (round(new_weight, 4), row["id"]),
-                )
-                count += 1
-
-        # Edge decay
-        edge_rows = self.conn.execute("SELECT id, weight, created_at FROM edges").fetchall()
-        for row in edge_rows:
-            try:
-                created = datetime.fromisoformat(row["created_at"])
-            except (ValueError, TypeError):
-                continue
-            days_since = (now - created).days
-            if days_since <= 0:
-                continue
-            decay = 0.5 ** (days_since / edge_half_life_days)
-            new_weight = max(0.01, row["weight"] * decay)
-            if abs(new_weight - row["weight"]) > 0.001:
-                self.conn.execute(
-                    "UPDATE edges SET weight = ? WHERE id = ?",
-                    (round(new_weight, 4), row["id"]),
-                )
+        """Decay weights based on last access time. Returns count of affected nodes.
 
-        self.conn.commit()
+        Each table is decayed by one set-based UPDATE: whole days elapsed
+        (as timedelta.days), halving per half-life, floored at 0.01, and only
+        rows that move by more than 0.001 are written.
+        """
+        self.flush_touches()
+        now = datetime.now().isoformat()
+        with self.transaction() as cur:
+            count = cur.execute(
+                _DECAY_SQL.format(table="nodes", stamp="last_accessed"),
+                {"now": now, "half_life": float(node_half_life_days)},
+            ).rowcount
+            cur.execute(
+                _DECAY_SQL.format(table="edges", stamp="created_at"),
+                {"now": now, "half_life": float(edge_half_life_days)},
+            )
         return count
 
     # ── Stigmergic injection pheromone ──────────────────────────────────
@@ -1315,7 +1715,7 @@ class Store:
             if row is None:
                 return nid
             try:
-                extra = json.loads(row["extra"] or "{}")
+                extra = _jloads(row["extra"] or "{}")
             except (json.JSONDecodeError, TypeError):
                 return nid
             succ = extra.get("superseded_by") if isinstance(extra, dict) else None
@@ -1358,7 +1758,7 @@ class Store:
                 "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
                 (node_id, context, round(amount, 4), d_inc, r_inc, m_inc, now, now),
             )
-            self.conn.commit()
+            self._commit()
             return round(amount, 4)
 
         decayed = self._decayed_strength(
@@ -1374,7 +1774,7 @@ class Store:
              row["missed"] + m_inc,
              now, now, node_id, context),
         )
-        self.conn.commit()
+        self._commit()
         return new_strength
 
     def pheromone_scores(self, node_ids: set[str], context: str = "",
@@ -1442,7 +1842,7 @@ class Store:
                     (round(strength, 4), now.isoformat(timespec="seconds"),
                      row["node_id"], row["context"]),
                 )
-        self.conn.commit()
+        self._commit()
         return pruned
 
     def pheromone_stats(self, half_life_days: float = 14.0,
@@ -1485,25 +1885,23 @@ class Store:
 
         Trigger is stored in extra JSON: {"trigger": "pre-deploy"}.
         """
-        q = "SELECT * FROM nodes WHERE extra LIKE ?"
-        params: list = [f'%"trigger"%{trigger}%']
+        q = f"SELECT * FROM nodes WHERE {_EXTRA_TRIGGER} = ?"
+        params: list = [trigger]
         if node_type:
             q += " AND type = ?"
             params.append(node_type)
         q += " AND status = 'active' ORDER BY weight DESC"
-        rows = self.conn.execute(q, params).fetchall()
-        return [self._row_to_dict(r) for r in rows]
+        return self._node_rows(self.conn.execute(q, params))
 
     def nodes_by_owner(self, owner: str, node_type: str | None = None) -> list[dict]:
         """Find nodes owned by a specific person (watches, directives)."""
-        q = "SELECT * FROM nodes WHERE extra LIKE ?"
-        params: list = [f'%"owner"%"{owner}"%']
+        q = f"SELECT * FROM nodes WHERE {_EXTRA_OWNER} = ?"
+        params: list = [owner]
         if node_type:
             q += " AND type = ?"
             params.append(node_type)
         q += " AND status = 'active' ORDER BY weight DESC"
-        rows = self.conn.execute(q, params).fetchall()
-        return [self._row_to_dict(r) for r in rows]
+        return self._node_rows(self.conn.execute(q, params))
 
     def get_session_tags(
         self,
@@ -1512,49 +1910,68 @@ class Store:
         limit: int = 20,
     ) -> list[dict]:
         """Query session-tag nodes with optional status and project_path filters."""
-        q = "SELECT * FROM nodes WHERE type = 'session' AND extra LIKE ?"
-        params: list = ['%"session_status"%']
+        q = "SELECT * FROM nodes WHERE type = 'session'"
+        params: list = []
+        if status:
+            # Filter before LIMIT: a newer paused tag must not hide an
+            # older active one
+            q += " AND session_status_g = ?"
+            params.append(status)
+        else:
+            q += " AND session_status_g IS NOT NULL"
         if project_path:
-            q += " AND extra LIKE ?"
-            params.append(f'%"project_path"%"{project_path}"%')
+            q += " AND project_path_g = ?"
+            params.append(project_path)
         q += " ORDER BY updated_at DESC LIMIT ?"
         params.append(limit)
-        rows = self.conn.execute(q, params).fetchall()
-        results = [self._row_to_dict(r) for r in rows]
-        if status:
-            results = [
-                r for r in results
-                if (r.get("extra") or {}).get("session_status") == status
-            ]
-        return results
+        return self._node_rows(self.conn.execute(q, params))
 
     def get_session_tag_by_name(self, tag_name: str) -> dict | None:
         """Find a session tag by its tag name in extra JSON."""
+        return self.get_session_tag_by_any_name(tag_name)
+
+    def get_session_tag_by_any_name(self, *names: str) -> dict | None:
+        """Find a session tag matching any of several candidate names.
+
+        All candidates are probed in one query; earlier names win. Falls
+        back to a title/AKA match per name when no tag name matches.
+        """
+        names = tuple(dict.fromkeys(n for n in names if n))
+        if not names:
+            return None
+        likes = " OR ".join(["extra LIKE ?"] * len(names))
         rows = self.conn.execute(
-            "SELECT * FROM nodes WHERE type = 'session' AND extra LIKE ?",
-            (f'%"tag"%"{tag_name}"%',),
+            f"SELECT * FROM nodes WHERE type = 'session' AND ({likes})",
+            [f'%"tag"%"{n}"%' for n in names],
         ).fetchall()
+        found: dict[str, dict] = {}
         for r in rows:
             d = self._row_to_dict(r)
-            if (d.get("extra") or {}).get("tag") == tag_name:
-                return d
-        return self.get_node_by_title(tag_name)
+            tag = (d.get("extra") or {}).get("tag")
+            if tag in names:
+                found.setdefault(tag, d)
+        for n in names:
+            if n in found:
+                return found[n]
+        for n in names:
+            node = self.get_node_by_title(n)
+            if node:
+                return node
+        return None
 
     def active_watches(self) -> list[dict]:
         """Get all active watches that haven't expired."""
         now = _now()[:10]  # YYYY-MM-DD
-        rows = self.conn.execute(
-            """SELECT * FROM nodes WHERE type = 'watch' AND status = 'active'
-               ORDER BY weight DESC"""
-        ).fetchall()
-        result = []
-        for r in rows:
-            d = self._row_to_dict(r)
-            expires = (d.get("extra") or {}).get("expires", "")
-            # Include if no expiry or not yet expired
-            if not expires or expires >= now:
-                result.append(d)
-        return result
+        # Same rule as node_expired(), evaluated in SQL so expired watches
+        # are never hydrated: only a non-empty text expires before today
+        # excludes a watch.
+        return self._node_rows(self.conn.execute(
+            f"""SELECT * FROM nodes WHERE type = 'watch' AND status = 'active'
+                AND (coalesce({_EXTRA_EXPIRES_TEXT}, '') = ''
+                     OR {_EXTRA_EXPIRES_TEXT} >= ?)
+                ORDER BY weight DESC""",
+            (now,),
+        ))
 
     def active_constraints(self, trigger: str | None = None) -> list[dict]:
         """Get active constraints, optionally filtered by trigger."""
@@ -1568,9 +1985,36 @@ class Store:
             return self.nodes_by_trigger(trigger, node_type="checkpoint")
         return self.all_nodes(node_type="checkpoint", status="active")
 
+    def _write_generation(self) -> tuple[int, int]:
+        """Counter pair that changes whenever the database is written.
+
+        total_changes covers writes on this connection; data_version moves
+        when another connection commits.
+        """
+        conn = self.conn
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return conn.total_changes, data_version
+
     def operational_summary(self, trigger: str | None = None,
                             owner: str | None = None) -> dict:
-        """Summary of all active operational nodes."""
+        """Summary of all active operational nodes.
+
+        Cached for a few seconds per (trigger, owner); any write to the
+        database invalidates the cached summary.
+        """
+        key = (trigger, owner)
+        gen = self._write_generation()
+        now = time.monotonic()
+        cached = self._op_cache.get(key)
+        if cached is not None and cached[1] == gen and now - cached[0] < _OP_SUMMARY_TTL:
+            return {k: list(v) for k, v in cached[2].items()}
+
+        summary = self._operational_summary(trigger, owner)
+        self._op_cache[key] = (now, gen, summary)
+        return {k: list(v) for k, v in summary.items()}
+
+    def _operational_summary(self, trigger: str | None,
+                             owner: str | None) -> dict:
         constraints = self.active_constraints(trigger)
         checkpoints = self.active_checkpoints(trigger)
         watches = self.active_watches()
@@ -1604,7 +2048,7 @@ class Store:
             "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
             (key, value),
         )
-        self.conn.commit()
+        self._commit()
 
     # ── Skill tracking ─────────────────────────────────────────────────
 
@@ -1646,48 +2090,38 @@ class Store:
             skill_id = skill_node["id"]
 
         # Build evidence record
-        now = _now()
-
-        # Check for existing demonstrates edge
-        existing = self.conn.execute(
-            """SELECT id, provenance FROM edges
-               WHERE from_id = ? AND to_id = ? AND type = 'demonstrates'""",
-            (person_id, skill_id),
-        ).fetchone()
-
-        if existing:
-            # Append evidence to existing provenance
-            try:
-                prev = json.loads(existing["provenance"])
-                if isinstance(prev, list):
-                    prev.append({"evidence": evidence, "source": source, "recorded_at": now})
-                else:
-                    prev = [prev, {"evidence": evidence, "source": source, "recorded_at": now}]
-            except (json.JSONDecodeError, TypeError):
-                prev = [{"evidence": evidence, "source": source, "recorded_at": now}]
-            self.conn.execute(
-                "UPDATE edges SET provenance = ? WHERE id = ?",
-                (_jdumps(prev), existing["id"]),
-            )
-            self.conn.commit()
-        else:
-            # Create new demonstrates edge (unidirectional — person -> skill)
-            prov_list = [{"evidence": evidence, "source": source, "recorded_at": now}]
-            self.conn.execute(
-                """INSERT OR REPLACE INTO edges (from_id, to_id, type, weight, provenance)
-                   VALUES (?, ?, 'demonstrates', 0.5, ?)""",
-                (person_id, skill_id, _jdumps(prov_list)),
+        entry = _jdumps({"evidence": evidence, "source": source,
+                         "recorded_at": _now()})
+
+        with self.transaction():
+            # Append to an existing demonstrates edge in-engine: a non-list
+            # provenance is wrapped into a list, an unparseable one replaced.
+            cur = self.conn.execute(
+                """UPDATE edges SET provenance = json_insert(
+                       CASE WHEN NOT json_valid(provenance) THEN '[]'
+                            WHEN json_type(provenance) = 'array' THEN provenance
+                            ELSE json_array(json(provenance)) END,
+                       '$[#]', json(?))
+                   WHERE from_id = ? AND to_id = ? AND type = 'demonstrates'""",
+                (entry, person_id, skill_id),
             )
-            self.conn.commit()
+            if cur.rowcount == 0:
+                # Create new demonstrates edge (unidirectional — person -> skill)
+                self.conn.execute(
+                    """INSERT OR REPLACE INTO edges (from_id, to_id, type, weight, provenance)
+                       VALUES (?, ?, 'demonstrates', 0.5, json_array(json(?)))""",
+                    (person_id, skill_id, entry),
+                )
 
-        # Boost skill weight by 0.05, capped at 1.0
-        skill_node = self.get_node(skill_id)
-        if skill_node:
-            new_weight = min(1.0, skill_node["weight"] + 0.05)
-            self.update_node(skill_id, weight=new_weight)
+            # Boost skill weight by 0.05, capped at 1.0 (plain read: this
+            # isn't an access, so no last_accessed touch)
+            row = self.conn.execute(
+                "SELECT weight FROM nodes WHERE id = ?", (skill_id,)).fetchone()
+            if row:
+                self.update_node(skill_id, weight=min(1.0, row["weight"] + 0.05))
 
-        self._log("record_skill_evidence", skill_id, skill_title, person_id,
-                  {"evidence": evidence, "source": source})
+            self._log("record_skill_evidence", skill_id, skill_title, person_id,
+                      {"evidence": evidence, "source": source})
 
     # ── Directive mutable state ─────────────────────────────────────────
 
@@ -1706,9 +2140,10 @@ class Store:
             extra["current_state"] = state
             extra["state_updated_at"] = _now()
 
-        self.atomic_extra_update(node_id, _mutate)
-        self._log("update_state", node_id, node.get("title", ""),
-                  details={"state": state})
+        with self.transaction():
+            self.atomic_extra_update(node_id, _mutate)
+            self._log("update_state", node_id, node.get("title", ""),
+                      details={"state": state})
 
     # ── Reminders ───────────────────────────────────────────────────────
 
@@ -1740,10 +2175,10 @@ class Store:
              next_due, _jdumps(channels or []), related_node_id or "",
              tags, _jdumps(extra or {}), now, now),
         )
-        self.conn.commit()
         self._log("add_reminder", rid, title,
                   details={"priority": priority, "next_due": next_due,
                            "type": reminder_type})
+        self._commit()
         return rid
 
     def get_reminder(self, reminder_id: str) -> dict | None:
@@ -1780,13 +2215,13 @@ class Store:
             f"UPDATE reminders SET {', '.join(updates)} WHERE id = ?",
             values,
         )
-        self.conn.commit()
+        self._commit()
 
     def delete_reminder(self, reminder_id: str) -> None:
         """Delete a reminder."""
         self.conn.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
-        self.conn.commit()
         self._log("delete_reminder", reminder_id)
+        self._commit()
 
     def list_reminders(
         self,
@@ -1847,14 +2282,16 @@ class Store:
             r = self.get_reminder(reminder_id)
             if r:
                 fields["snooze_count"] = r.get("snooze_count", 0) + 1
-        self.update_reminder(reminder_id, **fields)
-        self._log("snooze_reminder", reminder_id, "",
-                  details={"snooze_until": snooze_until})
+        with self.transaction():
+            self.update_reminder(reminder_id, **fields)
+            self._log("snooze_reminder", reminder_id, "",
+                      details={"snooze_until": snooze_until})
 
     def complete_reminder(self, reminder_id: str) -> None:
         """Mark a reminder as completed."""
-        self.update_reminder(reminder_id, status="completed")
-        self._log("complete_reminder", reminder_id)
+        with self.transaction():
+            self.update_reminder(reminder_id, status="completed")
+            self._log("complete_reminder", reminder_id)
 
     def _reminder_to_dict(self, row: sqlite3.Row) -> dict:
         """Convert a reminder row to dict with JSON parsing."""
@@ -1862,7 +2299,7 @@ class Store:
         for key in ("channels", "extra"):
             if key in d and isinstance(d[key], str):
                 try:
-                    d[key] = json.loads(d[key])
+                    d[key] = _jloads(d[key])
                 except (json.JSONDecodeError, TypeError):
                     pass
         return d
@@ -1884,32 +2321,46 @@ class Store:
     # ── Stats ──────────────────────────────────────────────────────────
 
     def stats(self) -> dict:
-        node_count = self.conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
-        edge_count = self.conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
-        orphan_count = len(self.orphans())
-        type_counts = {}
-        for row in self.conn.execute("SELECT type, COUNT(*) as c FROM nodes GROUP BY type"):
-            type_counts[row["type"]] = row["c"]
+        type_counts = {row["type"]: row["c"] for row in self.conn.execute(
+            "SELECT type, COUNT(*) AS c FROM nodes GROUP BY type")}
+        # Counted in SQL: orphans are never materialized just to be len()'d
+        edge_count, orphan_count = self.conn.execute(
+            f"""SELECT (SELECT COUNT(*) FROM edges),
+                       (SELECT COUNT(*) FROM nodes n WHERE {_ORPHAN_WHERE})"""
+        ).fetchone()
         return {
-            "nodes": node_count,
+            "nodes": sum(type_counts.values()),
             "edges": edge_count,
             "orphans": orphan_count,
             "types": type_counts,
         }
 
+    def count_by_audience(self) -> dict[str, int]:
+        """Node counts per audience scope, in one grouped query."""
+        return {row["audience"]: row["c"] for row in self.read_conn.execute(
+            "SELECT audience, COUNT(*) AS c FROM nodes GROUP BY audience")}
+
     # ── Helpers ────────────────────────────────────────────────────────
 
     def _row_to_dict(self, row: sqlite3.Row) -> dict:
-        d = dict(row)
-        for key in ("aka", "domains", "prov_who", "extra"):
-            if key in d and isinstance(d[key], str):
-                try:
-                    d[key] = json.loads(d[key])
-                except (json.JSONDecodeError, TypeError):
-                    pass
-        d["tags"] = d.get("domains") or []
-        return d
+        return _decode_node(dict(row))
+
+    @staticmethod
+    def _node_rows(cur: sqlite3.Cursor) -> list[dict]:
+        """Fetch node rows from ``cur`` as decoded dicts.
+
+        Column names are read from the cursor description once per statement
+        and each row is zipped straight into its dict, skipping the
+        sqlite3.Row that _row_to_dict() would copy.
+        """
+        if cur.description is None:
+            return []
+        names = tuple(c[0] for c in cur.description)
+        cur.row_factory = lambda _cur, row: _decode_node(dict(zip(names, row)))
+        return cur.fetchall()
 
     def node_ids(self) -> list[str]:
         """All node IDs."""
-        return [r[0] for r in self.conn.execute("SELECT id FROM nodes").fetchall()]
+        cur = self.read_conn.execute("SELECT id FROM nodes")
+        cur.row_factory = None  # plain tuples; no sqlite3.Row per id
+        return [node_id for (node_id,) in cur]
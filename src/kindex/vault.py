@@ -2,45 +2,114 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import mmap
 import os
 import tempfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 
-import yaml
-
 from .config import Config, load_config
 from .models import Edge, SkillNode, TopicNode
 
 
+@functools.lru_cache(maxsize=1)
+def _yaml_codec():
+    """Return (yaml, Loader, Dumper), preferring the libyaml C classes."""
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper, CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeDumper as Dumper, SafeLoader as Loader
+    return yaml, Loader, Dumper
+
+
+def _frontmatter_end(buf) -> int:
+    """Offset of the closing ``---`` in *buf* (bytes or mmap), or -1."""
+    if buf[:3] != b"---":
+        return -1
+    return buf.find(b"---", 3)
+
+
 def parse_frontmatter(filepath: Path) -> tuple[dict, str]:
     """Extract YAML frontmatter from a markdown file.
 
     Returns (meta_dict, body_text). Handles no-frontmatter, CRLF, bad YAML.
+    The fences are located on the raw bytes, so header and body are each
+    decoded once rather than splitting the whole text.
     """
-    content = filepath.read_text(encoding="utf-8").replace("\r\n", "\n")
+    data = filepath.read_bytes()
+    end = _frontmatter_end(data)
+    if end < 0:
+        return {}, data.decode("utf-8").replace("\r\n", "\n")
+
+    yaml, loader, _ = _yaml_codec()
+    try:
+        meta = yaml.load(data[3:end].decode("utf-8").replace("\r\n", "\n"),
+                         Loader=loader)
+    except yaml.YAMLError:
+        return {}, data.decode("utf-8").replace("\r\n", "\n")
+    return meta or {}, data[end + 3:].decode("utf-8").replace("\r\n", "\n").strip()
 
-    if not content.startswith("---"):
-        return {}, content
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return {}, content
+def read_frontmatter_only(filepath: Path) -> dict:
+    """Parse just the YAML frontmatter, without reading the note body.
 
+    Same rules as parse_frontmatter(). The file is memory-mapped and only
+    the bytes up to the closing ``---`` are decoded, so large bodies are
+    never copied into Python.
+    """
+    with filepath.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size < 3:
+            return {}
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            end = _frontmatter_end(m)
+            if end < 0:
+                return {}
+            header = m[3:end].decode("utf-8")
+
+    yaml, loader, _ = _yaml_codec()
     try:
-        meta = yaml.safe_load(parts[1])
-        return meta or {}, parts[2].strip()
+        return yaml.load(header, Loader=loader) or {}
     except yaml.YAMLError:
-        return {}, content
+        return {}
 
 
 def serialize_frontmatter(meta: dict, body: str) -> str:
     """Serialize back to markdown with YAML frontmatter."""
-    yaml_str = yaml.dump(meta, default_flow_style=False, allow_unicode=True,
-                         sort_keys=False, width=120)
+    yaml, _, dumper = _yaml_codec()
+    yaml_str = yaml.dump(meta, Dumper=dumper, default_flow_style=False,
+                         allow_unicode=True, sort_keys=False, width=120)
     return f"---\n{yaml_str}---\n{body}\n"
 
 
+# Below this many files to parse or save, a thread pool costs more than it saves.
+_PARALLEL_PARSE_MIN = 64
+
+
+class _UnreadBody(str):
+    """Type of the "" placeholder body left by load(bodies=False)."""
+
+
+# Compared by identity: any body assigned after the load, even "", replaces it.
+_UNREAD_BODY = _UnreadBody()
+
+
+def _markdown_entries(directory: Path) -> list[os.DirEntry]:
+    """The ``*.md`` files in ``directory`` sorted by name ([] if it is missing)."""
+    try:
+        with os.scandir(directory) as it:
+            entries = [e for e in it if e.name.endswith(".md") and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
 class Vault:
     """A Conv knowledge graph backed by the filesystem.
 
@@ -53,6 +122,8 @@ class Vault:
         self.skills: dict[str, SkillNode] = {}
         self.forward: dict[str, list[Edge]] = defaultdict(list)
         self.reverse: dict[str, list[tuple[str, Edge]]] = defaultdict(list)
+        # path -> (mtime_ns, size, meta, body); lets reload() skip unchanged files
+        self._fm_cache: dict[Path, tuple[int, int, dict, str]] = {}
 
     @property
     def data_path(self) -> Path:
@@ -64,52 +135,102 @@ class Vault:
                   self.config.inbox_dir, self.config.tmp_dir]:
             d.mkdir(parents=True, exist_ok=True)
 
-    def load(self) -> Vault:
-        """Load all topics and skills from disk, build indexes."""
+    def load(self, bodies: bool = True) -> Vault:
+        """Load all topics and skills from disk, build indexes.
+
+        With ``bodies=False`` only each file's frontmatter is read; node bodies
+        stay empty until fetched with read_body(). Enough for the graph, which
+        only needs slugs, titles and edges.
+        """
         self.topics.clear()
         self.skills.clear()
         self.forward.clear()
         self.reverse.clear()
 
-        self._load_topics()
-        self._load_skills()
+        self._load_topics(bodies)
+        self._load_skills(bodies)
         self._build_indexes()
         return self
 
-    def _load_topics(self) -> None:
-        td = self.config.topics_dir
-        if not td.exists():
-            return
-        for f in sorted(td.glob("*.md")):
+    def read_body(self, node: TopicNode | SkillNode) -> str:
+        """A node's body, reading it from disk if load(bodies=False) skipped it.
+
+        A body assigned since the load, even an empty one, wins over the one
+        on disk.
+        """
+        if node.body is _UNREAD_BODY:
+            node.body = parse_frontmatter(node.path)[1]
+        return node.body
+
+    def _load_topics(self, bodies: bool = True) -> None:
+        for f, meta, body in self._read_all_frontmatter(self.config.topics_dir, bodies):
             slug = f.stem
-            meta, body = parse_frontmatter(f)
             node = TopicNode(slug=slug, path=f, body=body, **meta)
+            if body is _UNREAD_BODY:
+                node.body = body  # construction copies it to a plain str
             node._has_frontmatter = bool(meta)
             if not node.topic:
                 node.topic = slug
             self.topics[slug] = node
 
-    def _load_skills(self) -> None:
-        sd = self.config.skills_dir
-        if not sd.exists():
-            return
-        for f in sorted(sd.glob("*.md")):
+    def _load_skills(self, bodies: bool = True) -> None:
+        for f, meta, body in self._read_all_frontmatter(self.config.skills_dir, bodies):
             slug = f.stem
-            meta, body = parse_frontmatter(f)
             node = SkillNode(slug=slug, path=f, body=body, **meta)
+            if body is _UNREAD_BODY:
+                node.body = body  # construction copies it to a plain str
             if not node.skill:
                 node.skill = slug
             self.skills[slug] = node
 
+    def _read_all_frontmatter(self, directory: Path,
+                              bodies: bool = True) -> list[tuple[Path, dict, str]]:
+        """Frontmatter of every ``*.md`` file in ``directory``, in name order.
+
+        Unchanged files come from the cache. When enough files changed, the
+        reads and YAML parses (both release the GIL) run on a thread pool;
+        the cache and the node models are only touched on this thread.
+        Without ``bodies``, changed files are read up to their header only
+        and returned with the _UNREAD_BODY placeholder (not cached).
+        """
+        results: list[tuple[Path, dict, str] | None] = []
+        misses: list[tuple[int, Path, os.stat_result]] = []
+        for entry in _markdown_entries(directory):
+            f, st = Path(entry.path), entry.stat()
+            cached = self._fm_cache.get(f)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                results.append((f, copy.deepcopy(cached[2]), cached[3]))
+            else:
+                misses.append((len(results), f, st))
+                results.append(None)
+
+        paths = [f for _, f, _ in misses]
+        parse = parse_frontmatter if bodies else read_frontmatter_only
+        if len(paths) >= _PARALLEL_PARSE_MIN:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                parsed = list(ex.map(parse, paths))
+        else:
+            parsed = [parse(f) for f in paths]
+
+        for (i, f, st), item in zip(misses, parsed):
+            if bodies:
+                meta, body = item
+                self._fm_cache[f] = (st.st_mtime_ns, st.st_size, copy.deepcopy(meta), body)
+            else:
+                meta, body = item, _UNREAD_BODY
+            results[i] = (f, meta, body)
+        return results
+
     def _build_indexes(self) -> None:
-        for slug, node in self.topics.items():
-            for edge in node.connects_to:
-                self.forward[slug].append(edge)
-                self.reverse[edge.target].append((slug, edge))
-        for slug, node in self.skills.items():
-            for edge in node.connects_to:
-                self.forward[slug].append(edge)
-                self.reverse[edge.target].append((slug, edge))
+        forward, reverse = self.forward, self.reverse
+        for slug, node in chain(self.topics.items(), self.skills.items()):
+            edges = node.connects_to
+            if not edges:
+                continue
+            forward[slug].extend(edges)
+            for edge in edges:
+                reverse[edge.target].append((slug, edge))
 
     def get(self, slug: str) -> TopicNode | SkillNode | None:
         return self.topics.get(slug) or self.skills.get(slug)
@@ -124,9 +245,14 @@ class Vault:
         return self.reverse.get(slug, [])
 
     def _atomic_write(self, path: Path, content: str) -> None:
-        """Write to tmp, then os.replace() for crash safety."""
-        self.config.tmp_dir.mkdir(parents=True, exist_ok=True)
-        fd, tmp_path = tempfile.mkstemp(dir=self.config.tmp_dir, suffix=".md")
+        """Write to tmp, then os.replace() for crash safety.
+
+        The tmp file sits beside ``path`` (hidden, ``.tmp`` suffix so loads skip
+        it) so the replace is a same-directory rename, never a cross-device copy.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.",
+                                        suffix=".tmp")
         try:
             os.write(fd, content.encode("utf-8"))
             os.close(fd)
@@ -140,17 +266,94 @@ class Vault:
                 os.unlink(tmp_path)
             raise
 
-    def save_topic(self, node: TopicNode) -> None:
+    def _unchanged_header(self, path: Path, meta: dict) -> str | None:
+        """The file's frontmatter block, if it still holds exactly ``meta``.
+
+        Only trusted while the file matches the stat recorded when it was
+        parsed; anything else returns None and the caller re-serializes.
+        """
+        cached = self._fm_cache.get(path)
+        if not cached or cached[2] != meta:
+            return None
+        try:
+            st = path.stat()
+            if (st.st_mtime_ns, st.st_size) != cached[:2]:
+                return None
+            data = path.read_bytes()
+        except OSError:
+            return None
+        end = _frontmatter_end(data)
+        if end < 0:
+            return None
+        return data[:end + 3].decode("utf-8").replace("\r\n", "\n")
+
+    def _remember_saved(self, path: Path, meta: dict, body: str) -> None:
+        """Refresh the frontmatter cache for a file written with a reused header."""
+        st = path.stat()
+        self._fm_cache[path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(meta),
+                                body.strip())
+
+    def _save(self, node: TopicNode | SkillNode, directory: Path) -> None:
+        """Write a node, skipping yaml.dump when only the body changed."""
         if node.path is None:
-            node.path = self.config.topics_dir / f"{node.slug}.md"
-        content = serialize_frontmatter(node.frontmatter_dict(), node.body)
-        self._atomic_write(node.path, content)
+            node.path = directory / f"{node.slug}.md"
+        meta = node.frontmatter_dict()
+        body = self.read_body(node)
+        header = self._unchanged_header(node.path, meta)
+        if header is None:
+            self._atomic_write(node.path, serialize_frontmatter(meta, body))
+        else:
+            self._atomic_write(node.path, f"{header}\n{body}\n")
+            self._remember_saved(node.path, meta, body)
+
+    def save_topic(self, node: TopicNode) -> None:
+        self._save(node, self.config.topics_dir)
 
     def save_skill(self, node: SkillNode) -> None:
-        if node.path is None:
-            node.path = self.config.skills_dir / f"{node.slug}.md"
-        content = serialize_frontmatter(node.frontmatter_dict(), node.body)
-        self._atomic_write(node.path, content)
+        self._save(node, self.config.skills_dir)
+
+    def save_many(self, nodes: list[TopicNode | SkillNode]) -> None:
+        """Save a burst of topics/skills, overlapping YAML emit and disk writes.
+
+        Paths, frontmatter dicts and reusable headers are resolved on this
+        thread; with enough nodes the serialize + atomic write of each runs
+        on a thread pool. Raises the first write error after all writes have
+        been attempted.
+        """
+        jobs = []
+        for node in nodes:
+            if node.path is None:
+                base = (self.config.topics_dir if isinstance(node, TopicNode)
+                        else self.config.skills_dir)
+                node.path = base / f"{node.slug}.md"
+            meta = node.frontmatter_dict()
+            jobs.append((node.path, meta, self.read_body(node),
+                         self._unchanged_header(node.path, meta)))
+
+        def write(job: tuple[Path, dict, str, str | None]) -> Exception | None:
+            path, meta, body, header = job
+            try:
+                if header is None:
+                    self._atomic_write(path, serialize_frontmatter(meta, body))
+                else:
+                    self._atomic_write(path, f"{header}\n{body}\n")
+            except Exception as e:
+                return e
+            return None
+
+        if len(jobs) >= _PARALLEL_PARSE_MIN:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                errors = list(ex.map(write, jobs))
+        else:
+            errors = [write(job) for job in jobs]
+
+        for (path, meta, body, header), err in zip(jobs, errors):
+            if err is None and header is not None:
+                self._remember_saved(path, meta, body)
+        first = next((e for e in errors if e is not None), None)
+        if first is not None:
+            raise first
 
     def add_edge(self, source: str, target: str, weight: float, reason: str) -> None:
         node = self.get(source)
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import json
 import hashlib
+import importlib.util
 import math
 import os
 import sys
@@ -26,6 +27,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from .config import Config, EmbeddingConfig
     from .store import Store
 
@@ -41,6 +44,22 @@ PROVIDER_DEFAULTS = {
 }
 
 EMBED_QUEUE_META = "embed.queue"
+EMBED_BATCH_SIZE = 64
+# Per storage type: vec0 element type, SQL wrapper for bound vectors, and the
+# scale applied to unit vectors before packing (distances are divided back).
+_VEC_STORAGE = {
+    "float32": ("float", "?", 1.0),
+    "int8": ("int8", "vec_int8(?)", 127.0),
+}
+# Local (sentence-transformers) inference backends: backend name passed to
+# SentenceTransformer and extra model_kwargs. The int8 ONNX export uses the
+# VNNI kernels on CPUs that have them.
+_LOCAL_BACKENDS = {
+    "torch": ("torch", {}),
+    "onnx": ("onnx", {}),
+    "onnx-int8": ("onnx", {"file_name": "onnx/model_qint8_avx512_vnni.onnx"}),
+    "openvino": ("openvino", {}),
+}
 EMBEDDING_PRICE_PER_MILLION = {
     ("voyage", "voyage-context-4"): 0.12,
     ("voyage", "voyage-context-3"): 0.18,
@@ -77,9 +96,17 @@ def _embedding_options(config: Config | None) -> dict:
         "max_group_chunks": max(1, int(getattr(ec, "max_group_chunks", 20) or 20)),
         "reindex_max_jobs": max(1, int(getattr(ec, "reindex_max_jobs", 200) or 200)),
         "reindex_max_queue": max(1, int(getattr(ec, "reindex_max_queue", 100000) or 100000)),
+        "quantization": ("int8" if (getattr(ec, "quantization", "") or "").lower() == "int8"
+                         else "float32"),
+        "backend": _local_backend(getattr(ec, "backend", "")),
     }
 
 
+def _local_backend(name: str | None) -> str:
+    name = (name or "torch").lower()
+    return name if name in _LOCAL_BACKENDS else "torch"
+
+
 def contextual_embeddings_supported(config: Config | None) -> bool:
     """True when the configured provider/model can embed grouped chunks."""
     provider, model, _, _ = _resolve_embedding_config(config)
@@ -118,31 +145,49 @@ def embedding_fingerprint(config: Config | None) -> str:
             "chunk_overlap_chars": opts["chunk_overlap_chars"],
             "max_group_chunks": opts["max_group_chunks"],
         })
+    if opts["quantization"] != "float32":
+        # Only recorded when set, so existing float32 tables stay fresh.
+        payload["quantization"] = opts["quantization"]
+    if provider == "local" and opts["backend"] != "torch":
+        payload["backend"] = opts["backend"]
     return json.dumps(payload, sort_keys=True, separators=(",", ":"))
 
 
 def _check_vec() -> bool:
-    """Check if sqlite-vec extension is available."""
+    """Check if sqlite-vec extension is available.
+
+    Only looks the package up; the import itself waits for ensure_vec_table.
+    """
     global _VEC_AVAILABLE
     if _VEC_AVAILABLE is not None:
         return _VEC_AVAILABLE
     try:
-        import sqlite_vec  # noqa: F401
-        _VEC_AVAILABLE = True
-    except ImportError:
+        _VEC_AVAILABLE = importlib.util.find_spec("sqlite_vec") is not None
+    except (ImportError, ValueError):
         _VEC_AVAILABLE = False
     return _VEC_AVAILABLE
 
 
-def _get_model(model_name: str = "all-MiniLM-L6-v2"):
-    """Lazy-load the sentence transformer model."""
+def _get_model(model_name: str = "all-MiniLM-L6-v2", backend: str = "torch"):
+    """Lazy-load the sentence transformer model.
+
+    ``backend`` is a _LOCAL_BACKENDS key; onnx/openvino need
+    sentence-transformers>=3.2 with the matching runtime installed.
+    """
     global _MODEL
-    if _MODEL is not None and getattr(_MODEL, '_kindex_model_name', None) == model_name:
+    key = (model_name, backend)
+    if _MODEL is not None and getattr(_MODEL, '_kindex_model_name', None) == key:
         return _MODEL
     try:
         from sentence_transformers import SentenceTransformer
-        _MODEL = SentenceTransformer(model_name, local_files_only=True)
-        _MODEL._kindex_model_name = model_name
+        st_backend, model_kwargs = _LOCAL_BACKENDS[backend]
+        if st_backend == "torch":
+            _MODEL = SentenceTransformer(model_name, local_files_only=True)
+        else:
+            _MODEL = SentenceTransformer(model_name, backend=st_backend,
+                                         model_kwargs=model_kwargs or None,
+                                         local_files_only=True)
+        _MODEL._kindex_model_name = key
         return _MODEL
     except ImportError:
         print("Warning: sentence-transformers not installed. "
@@ -153,13 +198,28 @@ def _get_model(model_name: str = "all-MiniLM-L6-v2"):
         return None
 
 
-def _embed_local(text: str, model_name: str) -> list[float] | None:
-    """Embed text using local sentence-transformers."""
-    model = _get_model(model_name)
+def _embed_local(text: str, model_name: str, backend: str = "torch") -> np.ndarray | None:
+    """Embed text using local sentence-transformers.
+
+    Returns the model's float32 array as-is; _serialize_vec packs it
+    without a round trip through Python floats.
+    """
+    model = _get_model(model_name, backend)
     if model is None:
         return None
-    embedding = model.encode(text, normalize_embeddings=True)
-    return embedding.tolist()
+    return model.encode(text, normalize_embeddings=True, convert_to_numpy=True)
+
+
+def _embed_local_batch(texts: list[str], model_name: str, backend: str = "torch", *,
+                       show_progress: bool = False) -> list[np.ndarray] | None:
+    """Embed many texts with one batched sentence-transformers call."""
+    model = _get_model(model_name, backend)
+    if model is None:
+        return None
+    embeddings = model.encode(texts, batch_size=EMBED_BATCH_SIZE,
+                              show_progress_bar=show_progress,
+                              normalize_embeddings=True, convert_to_numpy=True)
+    return list(embeddings)
 
 
 def _embed_openai(text: str, model: str, dimensions: int, api_key_env: str) -> list[float] | None:
@@ -322,7 +382,6 @@ def _embed_voyage(
 
 
 _EMBED_DISPATCH = {
-    "local": lambda text, model, dims, key_env, input_type: _embed_local(text, model),
     "openai": lambda text, model, dims, key_env, input_type: _embed_openai(text, model, dims, key_env),
     "gemini": lambda text, model, dims, key_env, input_type: _embed_gemini(text, model, dims, key_env),
     "voyage": _embed_voyage,
@@ -339,9 +398,11 @@ def embed_text(
     config: Config | None = None,
     *,
     input_type: str = "document",
-) -> list[float] | None:
+) -> list[float] | np.ndarray | None:
     """Embed a text string into a vector using the configured provider."""
     provider, model, dims, api_key_env = _resolve_embedding_config(config)
+    if provider == "local":
+        return _embed_local(text, model, _embedding_options(config)["backend"])
     fn = _EMBED_DISPATCH.get(provider)
     if fn is None:
         print(f"Warning: unknown embedding provider '{provider}'. "
@@ -350,6 +411,25 @@ def embed_text(
     return fn(text, model, dims, api_key_env, input_type)
 
 
+def _embed_texts(
+    texts: list[str],
+    config: Config | None = None,
+    *,
+    show_progress: bool = False,
+) -> list[list[float] | np.ndarray | None]:
+    """Embed many document texts, batching where the provider allows it.
+
+    The local model encodes the whole list in one call; remote providers fall
+    back to one request per text. Entries are None where embedding failed.
+    """
+    provider, model, _, _ = _resolve_embedding_config(config)
+    if provider == "local" and texts:
+        embeddings = _embed_local_batch(texts, model, _embedding_options(config)["backend"],
+                                        show_progress=show_progress)
+        return embeddings if embeddings is not None else [None] * len(texts)
+    return [embed_text(text, config, input_type="document") for text in texts]
+
+
 def _get_embedding_dim(config: Config | None) -> int:
     """Get the embedding dimension for the configured provider."""
     _, _, dims, _ = _resolve_embedding_config(config)
@@ -435,6 +515,12 @@ def ensure_vec_table(store: Store) -> bool:
 
     dim = _get_embedding_dim(store.config)
     fingerprint = embedding_fingerprint(store.config)
+    column_type = _VEC_STORAGE[_embedding_options(store.config)["quantization"]][0]
+    # Once per connection: loading the extension and re-checking vec_meta
+    # (plus a commit) on every upsert/search dominated small calls.
+    ready = getattr(store, "_vec_table_ready", None)
+    if ready and ready[0] is store.conn and ready[1] == fingerprint:
+        return True
 
     try:
         import sqlite_vec
@@ -470,7 +556,7 @@ def ensure_vec_table(store: Store) -> bool:
         store.conn.execute(f"""
             CREATE VIRTUAL TABLE IF NOT EXISTS node_vectors USING vec0(
                 node_id TEXT PRIMARY KEY,
-                embedding float[{dim}]
+                embedding {column_type}[{dim}]
             )
         """)
         _ensure_vector_meta_table(store)
@@ -484,43 +570,42 @@ def ensure_vec_table(store: Store) -> bool:
             (fingerprint,),
         )
         store.conn.commit()
+        store._vec_table_ready = (store.conn, fingerprint)
         return True
     except Exception as e:
         print(f"Warning: Could not initialize vector table: {e}", file=sys.stderr)
         return False
 
 
+def _single_chunk_record(text: str, embedding: list[float] | np.ndarray) -> dict:
+    return {
+        "index": 0,
+        "text": text,
+        "embedding": embedding,
+        "text_hash": _hash_text(text),
+        "token_estimate": _estimate_tokens(text),
+    }
+
+
 def embed_document_chunks(text: str, config: Config | None = None) -> list[dict] | None:
     """Embed document text and return chunk records ready for storage."""
     if not text:
         return []
     strategy = embedding_strategy(config)
-    text_hash = _hash_text(text)
     if strategy != "contextual":
         embedding = embed_text(text, config, input_type="document")
         if embedding is None:
             return None
-        return [{
-            "index": 0,
-            "text": text,
-            "embedding": embedding,
-            "text_hash": text_hash,
-            "token_estimate": _estimate_tokens(text),
-        }]
+        return [_single_chunk_record(text, embedding)]
 
     provider, model, dims, api_key_env = _resolve_embedding_config(config)
     if provider != "voyage" or not _is_voyage_context_model(model):
         embedding = embed_text(text, config, input_type="document")
         if embedding is None:
             return None
-        return [{
-            "index": 0,
-            "text": text,
-            "embedding": embedding,
-            "text_hash": text_hash,
-            "token_estimate": _estimate_tokens(text),
-        }]
+        return [_single_chunk_record(text, embedding)]
 
+    text_hash = _hash_text(text)
     opts = _embedding_options(config)
     chunks = _chunk_text(
         text,
@@ -556,34 +641,62 @@ def upsert_embedding(store: Store, node_id: str, text: str) -> bool:
         return False
 
     try:
-        fingerprint = embedding_fingerprint(store.config)
-        strategy = embedding_strategy(store.config)
-        now = _now_iso()
+        _store_embedding_chunks(store, node_id, chunks)
+        return True
+    except Exception:
+        return False
+
+
+def _store_embedding_chunks(store: Store, node_id: str, chunks: list[dict]) -> None:
+    """Replace a node's stored vectors and metadata with ``chunks``."""
+    bulk_upsert_embeddings(store, [(node_id, chunks)])
+
+
+def bulk_upsert_embeddings(store: Store, records: list[tuple[str, list[dict]]]) -> int:
+    """Replace the stored vectors of many nodes in one transaction.
+
+    ``records`` pairs each node_id with its chunk records (as returned by
+    ``embed_document_chunks``). Old vectors are deleted and the new rows
+    inserted with executemany, so a full reindex pays for one commit rather
+    than one per node. Returns the number of nodes written.
+    """
+    records = [(node_id, chunks) for node_id, chunks in records if chunks]
+    if not records:
+        return 0
+    fingerprint = embedding_fingerprint(store.config)
+    strategy = embedding_strategy(store.config)
+    now = _now_iso()
+    quantization = _embedding_options(store.config)["quantization"]
+    vec_param = _VEC_STORAGE[quantization][1]
+    vec_rows = []
+    meta_rows = []
+    for node_id, chunks in records:
         count = len(chunks)
-        delete_embedding(store, node_id)
-        _ensure_vector_meta_table(store)
         for chunk in chunks:
             index = int(chunk["index"])
             vector_id = _chunk_vector_id(node_id, index, count)
-            store.conn.execute(
-                "INSERT OR REPLACE INTO node_vectors (node_id, embedding) VALUES (?, ?)",
-                (vector_id, _serialize_vec(chunk["embedding"])),
-            )
-            store.conn.execute(
-                """INSERT OR REPLACE INTO node_vector_meta
-                   (vector_id, node_id, chunk_index, chunk_count, text_hash,
-                    fingerprint, strategy, token_estimate, text_preview, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    vector_id, node_id, index, count, chunk.get("text_hash") or "",
-                    fingerprint, strategy, int(chunk.get("token_estimate") or 0),
-                    (chunk.get("text") or "")[:240], now,
-                ),
-            )
-        store.conn.commit()
-        return True
-    except Exception:
-        return False
+            vec_rows.append((vector_id, _serialize_vec(chunk["embedding"], quantization)))
+            meta_rows.append((
+                vector_id, node_id, index, count, chunk.get("text_hash") or "",
+                fingerprint, strategy, int(chunk.get("token_estimate") or 0),
+                (chunk.get("text") or "")[:240], now,
+            ))
+    _ensure_vector_meta_table(store)
+    with store.transaction() as cur:
+        _delete_vector_rows(store, [node_id for node_id, _ in records])
+        cur.executemany(
+            "INSERT OR REPLACE INTO node_vectors (node_id, embedding) "
+            f"VALUES (?, {vec_param})",
+            vec_rows,
+        )
+        cur.executemany(
+            """INSERT OR REPLACE INTO node_vector_meta
+               (vector_id, node_id, chunk_index, chunk_count, text_hash,
+                fingerprint, strategy, token_estimate, text_preview, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            meta_rows,
+        )
+    return len(records)
 
 
 def enqueue_embedding(store: Store, node_id: str, *, max_queue: int = 100000) -> bool:
@@ -688,24 +801,27 @@ def drain_embedding_queue(store: Store, config: Config | None = None, *,
     return {"status": "ok", "embedded": embedded, "pending": len(remaining)}
 
 
-def _node_embedding_fresh(store: Store, node: dict, fingerprint: str) -> bool:
-    text = _embedding_text_for_node(node)
-    if not text:
-        return True
-    text_hash = _hash_text(text)
+def _stored_embedding_state(store: Store) -> dict[str, set[tuple[str, str]]]:
+    """Map node_id -> {(text_hash, fingerprint)} over all stored vectors."""
+    state: dict[str, set[tuple[str, str]]] = {}
     try:
         rows = store.conn.execute(
-            """SELECT text_hash, fingerprint
-               FROM node_vector_meta
-               WHERE node_id = ?""",
-            (node["id"],),
+            "SELECT node_id, text_hash, fingerprint FROM node_vector_meta"
         ).fetchall()
     except Exception:
         rows = []
-    if not rows:
-        return False
-    return all(row["text_hash"] == text_hash and row["fingerprint"] == fingerprint
-               for row in rows)
+    for row in rows:
+        state.setdefault(row["node_id"], set()).add(
+            (row["text_hash"], row["fingerprint"]))
+    return state
+
+
+def _node_embedding_fresh(node: dict, stored: dict[str, set[tuple[str, str]]],
+                          fingerprint: str) -> bool:
+    text = _embedding_text_for_node(node)
+    if not text:
+        return True
+    return stored.get(node["id"]) == {(_hash_text(text), fingerprint)}
 
 
 def _normalize_project_path(path: str | None) -> str | None:
@@ -758,11 +874,12 @@ def select_reindex_nodes(
         q += " LIMIT ?"
         params.append(limit)
 
-    rows = store.conn.execute(q, params).fetchall()
-    nodes = [store._row_to_dict(row) for row in rows]
+    nodes = store._node_rows(store.conn.execute(q, params))
     if stale:
         fingerprint = embedding_fingerprint(store.config)
-        nodes = [node for node in nodes if not _node_embedding_fresh(store, node, fingerprint)]
+        stored = _stored_embedding_state(store)
+        nodes = [node for node in nodes
+                 if not _node_embedding_fresh(node, stored, fingerprint)]
     return nodes
 
 
@@ -883,45 +1000,39 @@ def delete_embedding(store: Store, node_id: str) -> bool:
     when no row existed or the vector table is unavailable.
     """
     try:
-        vector_ids = [node_id]
-        try:
-            rows = store.conn.execute(
-                "SELECT vector_id FROM node_vector_meta WHERE node_id = ?",
-                (node_id,),
-            ).fetchall()
-            vector_ids.extend(row["vector_id"] for row in rows)
-        except Exception:
-            pass
-        deleted = 0
-        for vector_id in dict.fromkeys(vector_ids):
-            cur = store.conn.execute(
-                "DELETE FROM node_vectors WHERE node_id = ?", (vector_id,)
-            )
-            deleted += cur.rowcount
-        try:
-            cur = store.conn.execute(
-                "DELETE FROM node_vector_meta WHERE node_id = ?", (node_id,)
-            )
-            deleted += cur.rowcount
-        except Exception:
-            pass
+        deleted = _delete_vector_rows(store, [node_id])
         store.conn.commit()
         return deleted > 0
     except Exception:
         return False
 
 
-def _vector_row_node(store: Store, vector_id: str) -> tuple[str, int | None]:
+def _delete_vector_rows(store: Store, node_ids: list[str]) -> int:
+    """Delete the vector and metadata rows of ``node_ids`` without committing."""
+    vector_ids = list(node_ids)
     try:
-        row = store.conn.execute(
-            "SELECT node_id, chunk_index FROM node_vector_meta WHERE vector_id = ?",
-            (vector_id,),
-        ).fetchone()
-        if row:
-            return row["node_id"], row["chunk_index"]
+        for node_id in node_ids:
+            rows = store.conn.execute(
+                "SELECT vector_id FROM node_vector_meta WHERE node_id = ?",
+                (node_id,),
+            ).fetchall()
+            vector_ids.extend(row["vector_id"] for row in rows)
     except Exception:
         pass
-    return vector_id, None
+    cur = store.conn.executemany(
+        "DELETE FROM node_vectors WHERE node_id = ?",
+        [(vector_id,) for vector_id in dict.fromkeys(vector_ids)],
+    )
+    deleted = cur.rowcount
+    try:
+        cur = store.conn.executemany(
+            "DELETE FROM node_vector_meta WHERE node_id = ?",
+            [(node_id,) for node_id in node_ids],
+        )
+        deleted += cur.rowcount
+    except Exception:
+        pass
+    return deleted
 
 
 def vector_search(store: Store, query: str, top_k: int = 10) -> list[dict]:
@@ -933,54 +1044,72 @@ def vector_search(store: Store, query: str, top_k: int = 10) -> list[dict]:
     if embedding is None:
         return []
 
+    quantization = _embedding_options(store.config)["quantization"]
+    _, vec_param, scale = _VEC_STORAGE[quantization]
     try:
-        rows = store.conn.execute(
-            """SELECT node_id, distance
-               FROM node_vectors
-               WHERE embedding MATCH ?
-               ORDER BY distance
-               LIMIT ?""",
-            (_serialize_vec(embedding), max(top_k * 8, top_k)),
-        ).fetchall()
-
-        best: dict[str, dict] = {}
-        for row in rows:
-            vector_id = row[0]
-            node_id, chunk_index = _vector_row_node(store, vector_id)
-            distance = row[1]
-            existing = best.get(node_id)
-            if existing is None or distance < existing["distance"]:
-                best[node_id] = {
-                    "distance": distance,
-                    "chunk_index": chunk_index,
-                    "vector_id": vector_id,
-                }
-
-        results = []
-        for node_id, match in sorted(best.items(), key=lambda item: item[1]["distance"]):
-            node = store.get_node(node_id)
-            # Skip superseded nodes — their embeddings are deleted on
-            # supersede now, but rows from older DBs may linger.
-            if node and node.get("status") != "superseded":
-                node["vec_distance"] = match["distance"]
-                if match["chunk_index"] is not None:
-                    node["vec_chunk_index"] = match["chunk_index"]
-                results.append(node)
-                if len(results) >= top_k:
-                    break
-        return results
+        # One statement: kNN over the vectors, then map chunk ids to their
+        # node via the metadata table and pull the node rows in the same pass.
+        rows = store._node_rows(store.conn.execute(
+            f"""WITH knn AS (
+                   SELECT node_id AS vector_id, distance
+                   FROM node_vectors
+                   WHERE embedding MATCH {vec_param}
+                   ORDER BY distance
+                   LIMIT ?
+               )
+               SELECT n.*, knn.distance AS _vec_distance,
+                      m.chunk_index AS _vec_chunk_index
+               FROM knn
+               LEFT JOIN node_vector_meta m ON m.vector_id = knn.vector_id
+               JOIN nodes n ON n.id = COALESCE(m.node_id, knn.vector_id)
+               WHERE n.status != 'superseded'
+               ORDER BY knn.distance""",
+            (_serialize_vec(embedding, quantization), max(top_k * 8, top_k)),
+        ))
+
+        # Rows arrive nearest-first, so the first row per node is its best
+        # chunk. Superseded nodes are filtered above — their embeddings are
+        # deleted on supersede now, but rows from older DBs may linger.
+        results: dict[str, dict] = {}
+        for node in rows:
+            if node["id"] in results:
+                continue
+            node["vec_distance"] = node.pop("_vec_distance") / scale
+            chunk_index = node.pop("_vec_chunk_index")
+            if chunk_index is not None:
+                node["vec_chunk_index"] = chunk_index
+            results[node["id"]] = node
+            if len(results) >= top_k:
+                break
+        store.touch_nodes(list(results))
+        return list(results.values())
     except Exception:
         return []
 
 
-def _serialize_vec(embedding: list[float]) -> bytes:
-    """Serialize a float list to bytes for sqlite-vec."""
-    import struct
-    return struct.pack(f"{len(embedding)}f", *embedding)
+def _serialize_vec(embedding: list[float] | np.ndarray,
+                   quantization: str = "float32") -> bytes:
+    """Serialize an embedding to bytes for sqlite-vec.
+
+    ``float32`` packs little-endian floats. ``int8`` scales the unit-length
+    vector to [-127, 127] so cosine ranking survives at a quarter the size.
+    """
+    import numpy as np
+    vec = np.asarray(embedding, dtype="<f4")
+    if quantization != "int8":
+        return vec.tobytes()
+    norm = float(np.linalg.norm(vec)) or 1.0
+    scale = _VEC_STORAGE["int8"][2]
+    return np.clip(np.round(vec / norm * scale), -scale, scale).astype(np.int8).tobytes()
 
 
 def index_all_nodes(store: Store, verbose: bool = False) -> int:
-    """Index all active nodes for vector similarity search."""
+    """Index active nodes for vector similarity search.
+
+    Nodes whose stored vectors already match their current text and the
+    configured embedding fingerprint are skipped; ``kin embed reindex``
+    forces a full pass.
+    """
     if not ensure_vec_table(store):
         provider = "unknown"
         try:
@@ -995,13 +1124,33 @@ def index_all_nodes(store: Store, verbose: bool = False) -> int:
                   file=sys.stderr)
         return 0
 
-    nodes = select_reindex_nodes(store, status="active")
+    nodes = select_reindex_nodes(store, status="active", stale=True)
     count = 0
-    for node in nodes:
-        text = _embedding_text_for_node(node)
-        if upsert_embedding(store, node["id"], text):
-            count += 1
-            if verbose:
-                print(f"  Embedded: {node['title']}")
+    if embedding_strategy(store.config) == "contextual":
+        # Contextual chunk groups are already batched per node by the provider.
+        for node in nodes:
+            text = _embedding_text_for_node(node)
+            if upsert_embedding(store, node["id"], text):
+                count += 1
+                if verbose:
+                    print(f"  Embedded: {node['title']}")
+        return count
+
+    pending = [(node, text) for node in nodes
+               if (text := _embedding_text_for_node(node))]
+    texts = [text for _, text in pending]
+    embeddings = _embed_texts(texts, store.config, show_progress=verbose)
+    records = []
+    for (node, text), embedding in zip(pending, embeddings):
+        if embedding is None:
+            continue
+        records.append((node["id"], [_single_chunk_record(text, embedding)]))
+        if verbose:
+            print(f"  Embedded: {node['title']}")
+    try:
+        count = bulk_upsert_embeddings(store, records)
+    except Exception as e:
+        print(f"Warning: could not store embeddings: {e}", file=sys.stderr)
+        return 0
 
     return count
@@ -0,0 +1,27 @@
+"""In-process ``kin`` runner shared by the CLI-level tests."""
+
+import io
+import subprocess
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+
+from kindex.cli import main
+
+
+def run(*args, data_dir=None):
+    """Run ``kin`` in-process, returning a CompletedProcess like subprocess.run."""
+    argv = list(args)
+    if data_dir:
+        argv.extend(["--data-dir", data_dir])
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            main(argv)
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+    return subprocess.CompletedProcess(["kin", *argv], code, out.getvalue(), err.getvalue())
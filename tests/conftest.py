@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from kindex.config import Config
+from kindex.store import Store
 from kindex.vault import Vault
 from kindex.vectors import PROVIDER_DEFAULTS as _EMBED_PROVIDER_DEFAULTS
 
@@ -59,3 +60,12 @@ def tmp_vault(tmp_path):
     v = Vault(cfg)
     v.ensure_dirs()
     return v.load()
+
+
+
+@pytest.fixture
+def memory_store(tmp_path):
+    """A Store on a private in-memory database; data_dir is still tmp_path."""
+    s = Store(Config(data_dir=str(tmp_path)), in_memory=True)
+    yield s
+    s.close()
@@ -2,31 +2,64 @@
 import hashlib
 import json
 import subprocess
-import sys
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 import pytest
 from kindex.adapters.base import Adapter, AdapterMeta, AdapterOption, IngestResult
 from kindex.config import Config
 from kindex.store import Store
 
+from _cli import run
+
 
 @pytest.fixture
-def store(tmp_path):
-    cfg = Config(data_dir=str(tmp_path))
-    s = Store(cfg)
-    yield s
-    s.close()
+def store(memory_store):
+    return memory_store
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """tmp_path laid out as a git repo with an empty hooks directory."""
+    (tmp_path / ".git" / "hooks").mkdir(parents=True)
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory):
+    """Read-only directory of notes shared by the ingest_directory tests."""
+    d = tmp_path_factory.mktemp("corpus")
+    (d / "notes.md").write_text("# My Notes\nSome content")
+    (d / "todo.txt").write_text("TODO: finish tests")
+    (d / "code.py").write_text("# Not included by default")
+    (d / ".hidden").mkdir()
+    (d / ".hidden" / "secret.md").write_text("secret")
+    return d
+
+
+def _completed(stdout="", returncode=0):
+    return subprocess.CompletedProcess([], returncode, stdout, "")
+
+
+def _patch_run(monkeypatch, module, result):
+    """Swap ``kindex.adapters.<module>``'s subprocess.run for a stub.
+
+    The stub returns ``result``, or raises it when it is an exception.
+    """
+    def fake_run(*args, **kwargs):
+        if isinstance(result, (BaseException, type)):
+            raise result
+        return result
+
+    monkeypatch.setattr(f"kindex.adapters.{module}.subprocess.run", fake_run)
 
 
 class TestGitHubAdapter:
-    def test_gh_not_available(self):
+    def test_gh_not_available(self, monkeypatch):
         from kindex.adapters.github import is_gh_available
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            assert is_gh_available() is False
+        _patch_run(monkeypatch, "github", FileNotFoundError)
+        assert is_gh_available() is False
 
-    def test_ingest_issues_mock(self, store):
+    def test_ingest_issues_mock(self, store, monkeypatch):
         """Mock gh CLI to test issue ingestion."""
         from kindex.adapters.github import ingest_issues
 
@@ -43,12 +76,8 @@ class TestGitHubAdapter:
             }
         ]
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(mock_issues)
-
-        with patch("subprocess.run", return_value=mock_result):
-            count = ingest_issues(store, "test/repo")
+        _patch_run(monkeypatch, "github", _completed(json.dumps(mock_issues)))
+        count = ingest_issues(store, "test/repo")
 
         assert count == 1
         node = store.get_node("gh-issue-test-repo-1")
@@ -56,36 +85,39 @@ class TestGitHubAdapter:
         assert "#1: Test issue" in node["title"]
         assert "github" in node.get("domains", [])
 
-    def test_ingest_prs_mock(self, store):
+    @pytest.mark.parametrize("state, merged_at, expected_status", [
+        ("MERGED", "2026-02-24T10:00:00Z", "archived"),
+        ("CLOSED", None, "archived"),
+        ("OPEN", None, "active"),
+    ])
+    def test_ingest_prs_states(self, store, monkeypatch, state, merged_at,
+                               expected_status):
+        """Merged and closed PRs are archived; open PRs stay active."""
         from kindex.adapters.github import ingest_prs
 
         mock_prs = [
             {
                 "number": 10,
-                "title": "Add feature",
+                "title": f"{state.title()} PR",
                 "body": "PR description",
-                "state": "MERGED",
+                "state": state,
                 "labels": [],
                 "author": {"login": "dev"},
                 "createdAt": "2026-02-23T10:00:00Z",
                 "url": "https://github.com/test/repo/pulls/10",
-                "mergedAt": "2026-02-24T10:00:00Z"
+                "mergedAt": merged_at,
             }
         ]
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(mock_prs)
-
-        with patch("subprocess.run", return_value=mock_result):
-            count = ingest_prs(store, "test/repo")
+        _patch_run(monkeypatch, "github", _completed(json.dumps(mock_prs)))
+        count = ingest_prs(store, "test/repo")
 
         assert count == 1
         node = store.get_node("gh-pr-test-repo-10")
         assert node is not None
-        assert node["status"] == "archived"  # merged
+        assert node["status"] == expected_status
 
-    def test_ingest_issues_skips_existing(self, store):
+    def test_ingest_issues_skips_existing(self, store, monkeypatch):
         """Already-ingested issues should be skipped."""
         from kindex.adapters.github import ingest_issues
 
@@ -96,144 +128,92 @@ class TestGitHubAdapter:
                         "state": "OPEN", "labels": [], "author": {"login": "x"},
                         "createdAt": "2026-02-24T10:00:00Z", "url": ""}]
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(mock_issues)
-
-        with patch("subprocess.run", return_value=mock_result):
-            count = ingest_issues(store, "test/repo")
+        _patch_run(monkeypatch, "github", _completed(json.dumps(mock_issues)))
+        count = ingest_issues(store, "test/repo")
 
         assert count == 0  # skipped
 
-    def test_ingest_issues_returns_zero_on_failure(self, store):
+    def test_ingest_issues_returns_zero_on_failure(self, store, monkeypatch):
         """If gh command fails, return 0."""
         from kindex.adapters.github import ingest_issues
 
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            count = ingest_issues(store, "test/repo")
+        _patch_run(monkeypatch, "github", _completed(returncode=1))
+        count = ingest_issues(store, "test/repo")
 
         assert count == 0
 
-    def test_ingest_prs_closed_is_archived(self, store):
-        """CLOSED PRs should have status=archived."""
-        from kindex.adapters.github import ingest_prs
-
-        mock_prs = [
-            {
-                "number": 5,
-                "title": "Closed PR",
-                "body": "",
-                "state": "CLOSED",
-                "labels": [],
-                "author": {"login": "dev"},
-                "createdAt": "2026-02-20T10:00:00Z",
-                "url": "https://github.com/test/repo/pulls/5",
-                "mergedAt": None
-            }
-        ]
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(mock_prs)
-
-        with patch("subprocess.run", return_value=mock_result):
-            count = ingest_prs(store, "test/repo")
-
-        assert count == 1
-        node = store.get_node("gh-pr-test-repo-5")
-        assert node["status"] == "archived"
-
-    def test_ingest_prs_open_is_active(self, store):
-        """OPEN PRs should have status=active."""
-        from kindex.adapters.github import ingest_prs
-
-        mock_prs = [
-            {
-                "number": 7,
-                "title": "Open PR",
-                "body": "WIP",
-                "state": "OPEN",
-                "labels": [{"name": "enhancement"}],
-                "author": {"login": "dev"},
-                "createdAt": "2026-02-24T10:00:00Z",
-                "url": "https://github.com/test/repo/pulls/7",
-                "mergedAt": None
-            }
-        ]
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(mock_prs)
-
-        with patch("subprocess.run", return_value=mock_result):
-            count = ingest_prs(store, "test/repo")
-
-        assert count == 1
-        node = store.get_node("gh-pr-test-repo-7")
-        assert node["status"] == "active"
+    def test_adapter_fetches_concurrently_and_stores_all(self, store, monkeypatch):
+        from kindex.adapters.github import adapter
 
-    def test_gh_available_when_authenticated(self):
+        payloads = {
+            "issue": [{"number": 1, "title": "Bug", "state": "OPEN", "labels": [],
+                       "author": {"login": "a"}, "createdAt": "2026-02-24T10:00:00Z"}],
+            "pr": [{"number": 2, "title": "Fix", "state": "MERGED", "labels": [],
+                    "author": {"login": "b"}, "createdAt": "2026-02-24T10:00:00Z",
+                    "mergedAt": "2026-02-25T10:00:00Z"}],
+            "api": [{"sha": "abcdef123456", "commit": {
+                "message": "Meaningful commit message",
+                "author": {"name": "C", "date": "2026-02-24T10:00:00Z"}}}],
+        }
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd[1])
+            return _completed(json.dumps(payloads[cmd[1]]))
+
+        monkeypatch.setattr("kindex.adapters.github.subprocess.run", fake_run)
+        result = adapter.ingest(store, repo="test/repo", limit=5)
+
+        assert result.created == 3
+        assert sorted(calls) == ["api", "issue", "pr"]
+        assert store.get_node("gh-pr-test-repo-2")["status"] == "archived"
+        assert store.get_node("gh-commit-test-repo-abcdef12") is not None
+
+    def test_gh_available_when_authenticated(self, monkeypatch):
         """When gh auth status succeeds, is_gh_available returns True."""
         from kindex.adapters.github import is_gh_available
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
+        _patch_run(monkeypatch, "github", _completed())
+        assert is_gh_available() is True
 
-        with patch("subprocess.run", return_value=mock_result):
-            assert is_gh_available() is True
-
-    def test_gh_timeout_returns_false(self):
+    def test_gh_timeout_returns_false(self, monkeypatch):
         """Timeout during gh auth check returns False."""
         from kindex.adapters.github import is_gh_available
 
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd="gh", timeout=5)):
-            assert is_gh_available() is False
+        _patch_run(monkeypatch, "github", subprocess.TimeoutExpired(cmd="gh", timeout=5))
+        assert is_gh_available() is False
 
 
 class TestGitHooksAdapter:
-    def test_install_hooks(self, tmp_path):
+    def test_install_hooks(self, git_repo):
         """Install git hooks in a mock repo."""
         from kindex.adapters.git_hooks import install_hooks
 
-        # Create a mock git repo structure
-        git_dir = tmp_path / ".git" / "hooks"
-        git_dir.mkdir(parents=True)
-
-        cfg = Config(data_dir=str(tmp_path))
-        actions = install_hooks(str(tmp_path), cfg)
+        cfg = Config(data_dir=str(git_repo))
+        actions = install_hooks(str(git_repo), cfg)
 
         assert any("post-commit" in a for a in actions)
         assert any("pre-push" in a for a in actions)
 
         # Verify hooks are executable
-        assert (git_dir / "post-commit").exists()
-        assert (git_dir / "pre-push").exists()
+        assert (git_repo / ".git" / "hooks" / "post-commit").exists()
+        assert (git_repo / ".git" / "hooks" / "pre-push").exists()
 
-    def test_install_hooks_idempotent(self, tmp_path):
+    def test_install_hooks_idempotent(self, git_repo):
         from kindex.adapters.git_hooks import install_hooks
 
-        git_dir = tmp_path / ".git" / "hooks"
-        git_dir.mkdir(parents=True)
-
-        cfg = Config(data_dir=str(tmp_path))
-        install_hooks(str(tmp_path), cfg)
-        actions2 = install_hooks(str(tmp_path), cfg)
+        cfg = Config(data_dir=str(git_repo))
+        install_hooks(str(git_repo), cfg)
+        actions2 = install_hooks(str(git_repo), cfg)
 
         assert any("already" in a for a in actions2)
 
-    def test_uninstall_hooks(self, tmp_path):
+    def test_uninstall_hooks(self, git_repo):
         from kindex.adapters.git_hooks import install_hooks, uninstall_hooks
 
-        git_dir = tmp_path / ".git" / "hooks"
-        git_dir.mkdir(parents=True)
-
-        cfg = Config(data_dir=str(tmp_path))
-        install_hooks(str(tmp_path), cfg)
-        actions = uninstall_hooks(str(tmp_path))
+        cfg = Config(data_dir=str(git_repo))
+        install_hooks(str(git_repo), cfg)
+        actions = uninstall_hooks(str(git_repo))
 
         assert any("Removed" in a for a in actions)
 
@@ -246,53 +226,45 @@ class TestGitHooksAdapter:
 
         assert any("not a git repository" in a for a in actions)
 
-    def test_ingest_recent_commits_mock(self, store):
+    def test_ingest_recent_commits_mock(self, store, monkeypatch):
         from kindex.adapters.git_hooks import ingest_recent_commits
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "abc12345|Add feature X|John Doe|2026-02-24T10:00:00-05:00\ndef67890|Fix bug in Y|Jane|2026-02-23T10:00:00-05:00\n"
-
-        with patch("subprocess.run", return_value=mock_result):
-            count = ingest_recent_commits(store, "/tmp/fake-repo")
+        _patch_run(monkeypatch, "git_hooks", _completed(
+            "abc12345|Add feature X|John Doe|2026-02-24T10:00:00-05:00\n"
+            "def67890|Fix bug in Y|Jane|2026-02-23T10:00:00-05:00\n"))
+        count = ingest_recent_commits(store, "/tmp/fake-repo")
 
         assert count == 2
         assert store.get_node("commit-abc12345") is not None
         assert store.get_node("commit-def67890") is not None
 
-    def test_ingest_commits_skips_existing(self, store):
+    def test_ingest_commits_skips_existing(self, store, monkeypatch):
         """Already-ingested commits should be skipped."""
         from kindex.adapters.git_hooks import ingest_recent_commits
 
         # Pre-create the node
         store.add_node("Add feature X", node_id="commit-abc12345")
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "abc12345|Add feature X|John Doe|2026-02-24T10:00:00-05:00\n"
-
-        with patch("subprocess.run", return_value=mock_result):
-            count = ingest_recent_commits(store, "/tmp/fake-repo")
+        _patch_run(monkeypatch, "git_hooks", _completed(
+            "abc12345|Add feature X|John Doe|2026-02-24T10:00:00-05:00\n"))
+        count = ingest_recent_commits(store, "/tmp/fake-repo")
 
         assert count == 0
 
-    def test_ingest_commits_git_not_available(self, store):
+    def test_ingest_commits_git_not_available(self, store, monkeypatch):
         """Should return 0 if git is not available."""
         from kindex.adapters.git_hooks import ingest_recent_commits
 
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            count = ingest_recent_commits(store, "/tmp/fake-repo")
+        _patch_run(monkeypatch, "git_hooks", FileNotFoundError)
+        count = ingest_recent_commits(store, "/tmp/fake-repo")
 
         assert count == 0
 
-    def test_uninstall_no_hooks(self, tmp_path):
+    def test_uninstall_no_hooks(self, git_repo):
         """Uninstall when no hooks exist should report nothing found."""
         from kindex.adapters.git_hooks import uninstall_hooks
 
-        git_dir = tmp_path / ".git" / "hooks"
-        git_dir.mkdir(parents=True)
-
-        actions = uninstall_hooks(str(tmp_path))
+        actions = uninstall_hooks(str(git_repo))
         assert any("No Kindex hooks found" in a for a in actions)
 
 
@@ -322,6 +294,16 @@ class TestFileAdapter:
 
         assert sha256_file(f1) != sha256_file(f2)
 
+    def test_sha256_matches_hashlib(self, tmp_path):
+        import hashlib
+
+        from kindex.adapters.files import sha256_file
+
+        data = bytes(range(256)) * 1000  # spans several read chunks
+        f = tmp_path / "big.bin"
+        f.write_bytes(data)
+        assert sha256_file(f) == hashlib.sha256(data).hexdigest()
+
     def test_scan_registered_files(self, store, tmp_path):
         from kindex.adapters.files import scan_registered_files
 
@@ -345,6 +327,29 @@ class TestFileAdapter:
         count3 = scan_registered_files(store)
         assert count3 == 1
 
+    def test_scan_skips_hashing_unchanged_stat(self, store, tmp_path, monkeypatch):
+        import os
+
+        from kindex.adapters import files
+
+        test_file = tmp_path / "notes.txt"
+        test_file.write_text("Initial content")
+        store.add_node("My Notes", extra={"file_paths": [str(test_file)]})
+        assert files.scan_registered_files(store) == 1
+
+        hashed = []
+        real = files.sha256_file
+        monkeypatch.setattr(files, "sha256_file", lambda p: hashed.append(p) or real(p))
+        assert files.scan_registered_files(store) == 0
+        assert hashed == []
+
+        st = test_file.stat()
+        os.utime(test_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert files.scan_registered_files(store) == 0  # touched, same bytes
+        assert len(hashed) == 1
+        assert files.scan_registered_files(store) == 0
+        assert len(hashed) == 1
+
     def test_scan_registered_files_missing_file(self, store, tmp_path):
         """Missing files should not crash the scan."""
         from kindex.adapters.files import scan_registered_files
@@ -355,15 +360,10 @@ class TestFileAdapter:
         count = scan_registered_files(store)
         assert count == 0
 
-    def test_ingest_directory(self, store, tmp_path):
+    def test_ingest_directory(self, store, corpus):
         from kindex.adapters.files import ingest_directory
 
-        # Create some test files
-        (tmp_path / "notes.md").write_text("# My Notes\nSome content")
-        (tmp_path / "todo.txt").write_text("TODO: finish tests")
-        (tmp_path / "code.py").write_text("# Not included by default")
-
-        count = ingest_directory(store, tmp_path)
+        count = ingest_directory(store, corpus)
         assert count == 2  # md and txt only
 
         # Verify node content
@@ -371,36 +371,30 @@ class TestFileAdapter:
         titles = [n["title"] for n in nodes]
         assert any("Notes" in t for t in titles)
 
-    def test_ingest_directory_custom_extensions(self, store, tmp_path):
+    def test_ingest_directory_custom_extensions(self, store, corpus):
         from kindex.adapters.files import ingest_directory
 
-        (tmp_path / "script.py").write_text("print('hello')")
-
-        count = ingest_directory(store, tmp_path, extensions=[".py"])
+        count = ingest_directory(store, corpus, extensions=[".py"])
         assert count == 1
 
-    def test_ingest_directory_skips_hidden(self, store, tmp_path):
+    def test_ingest_directory_skips_hidden(self, store, corpus):
         """Hidden/dot directories should be skipped."""
         from kindex.adapters.files import ingest_directory
 
-        hidden_dir = tmp_path / ".hidden"
-        hidden_dir.mkdir()
-        (hidden_dir / "secret.md").write_text("secret")
-        (tmp_path / "visible.md").write_text("visible")
-
-        count = ingest_directory(store, tmp_path)
-        assert count == 1  # only visible.md
+        count = ingest_directory(store, corpus)
+        assert count == 2  # notes.md and todo.txt, not .hidden/secret.md
+        paths = [p for n in store.all_nodes(node_type="document")
+                 for p in n["extra"]["file_paths"]]
+        assert not any(".hidden" in p for p in paths)
 
-    def test_ingest_directory_idempotent(self, store, tmp_path):
+    def test_ingest_directory_idempotent(self, store, corpus):
         """Running ingest twice should not create duplicate nodes."""
         from kindex.adapters.files import ingest_directory
 
-        (tmp_path / "notes.md").write_text("# Notes")
+        count1 = ingest_directory(store, corpus)
+        assert count1 == 2
 
-        count1 = ingest_directory(store, tmp_path)
-        assert count1 == 1
-
-        count2 = ingest_directory(store, tmp_path)
+        count2 = ingest_directory(store, corpus)
         assert count2 == 0  # already exists
 
     def test_ingest_directory_nonexistent(self, store, tmp_path):
@@ -410,30 +404,24 @@ class TestFileAdapter:
         count = ingest_directory(store, tmp_path / "does-not-exist")
         assert count == 0
 
-    def test_ingest_directory_stores_file_hash(self, store, tmp_path):
+    def test_ingest_directory_stores_file_hash(self, store, corpus):
         """Ingested files should have file_hashes in extra."""
         from kindex.adapters.files import ingest_directory
 
-        (tmp_path / "readme.md").write_text("Hello")
-        ingest_directory(store, tmp_path)
+        ingest_directory(store, corpus)
 
         nodes = store.all_nodes(node_type="document")
-        assert len(nodes) == 1
-        extra = nodes[0].get("extra", {})
-        assert "file_hashes" in extra
-        assert "file_paths" in extra
+        assert len(nodes) == 2
+        for node in nodes:
+            extra = node.get("extra", {})
+            assert "file_hashes" in extra
+            assert "file_paths" in extra
 
 
 class TestIngestCLI:
     def test_ingest_files(self, tmp_path):
         d = str(tmp_path)
 
-        def run(*args, data_dir=None):
-            cmd = [sys.executable, "-m", "kindex.cli", *args]
-            if data_dir:
-                cmd.extend(["--data-dir", data_dir])
-            return subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
         run("init", data_dir=d)
         r = run("ingest", "files", data_dir=d)
         assert r.returncode == 0
@@ -441,55 +429,27 @@ class TestIngestCLI:
     def test_ingest_commits(self, tmp_path):
         d = str(tmp_path)
 
-        def run(*args, data_dir=None):
-            cmd = [sys.executable, "-m", "kindex.cli", *args]
-            if data_dir:
-                cmd.extend(["--data-dir", data_dir])
-            # `ingest commits` loads the local embedding model and indexes every
-            # commit node, which can take well over 30s on a cold/loaded machine
-            # (and on CI). Give the subprocess generous headroom to avoid flakes.
-            return subprocess.run(cmd, capture_output=True, text=True, timeout=180)
-
         run("init", data_dir=d)
         r = run("ingest", "commits", data_dir=d)
         assert r.returncode == 0
 
 
 class TestGitHookCLI:
-    def test_git_hook_install(self, tmp_path):
-        # Create mock git repo
-        git_dir = tmp_path / ".git" / "hooks"
-        git_dir.mkdir(parents=True)
-
-        d = str(tmp_path)
-
-        def run(*args, data_dir=None):
-            cmd = [sys.executable, "-m", "kindex.cli", *args]
-            if data_dir:
-                cmd.extend(["--data-dir", data_dir])
-            return subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    def test_git_hook_install(self, git_repo):
+        d = str(git_repo)
 
         run("init", data_dir=d)
-        r = run("git-hook", "install", "--repo-path", str(tmp_path), data_dir=d)
+        r = run("git-hook", "install", "--repo-path", str(git_repo), data_dir=d)
         assert r.returncode == 0
-        assert (git_dir / "post-commit").exists()
+        assert (git_repo / ".git" / "hooks" / "post-commit").exists()
 
-    def test_git_hook_uninstall(self, tmp_path):
+    def test_git_hook_uninstall(self, git_repo):
         """Install then uninstall should work."""
-        git_dir = tmp_path / ".git" / "hooks"
-        git_dir.mkdir(parents=True)
-
-        d = str(tmp_path)
-
-        def run(*args, data_dir=None):
-            cmd = [sys.executable, "-m", "kindex.cli", *args]
-            if data_dir:
-                cmd.extend(["--data-dir", data_dir])
-            return subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        d = str(git_repo)
 
         run("init", data_dir=d)
-        run("git-hook", "install", "--repo-path", str(tmp_path), data_dir=d)
-        r = run("git-hook", "uninstall", "--repo-path", str(tmp_path), data_dir=d)
+        run("git-hook", "install", "--repo-path", str(git_repo), data_dir=d)
+        r = run("git-hook", "uninstall", "--repo-path", str(git_repo), data_dir=d)
         assert r.returncode == 0
 
 
@@ -1,27 +1,21 @@
 """Tests for AKA/synonym resolution."""
 
-import subprocess
-import sys
+import json
 
 import pytest
 
-from kindex.config import Config
-from kindex.store import Store
+from _cli import run
 
 
-def run(*args, data_dir=None):
-    cmd = [sys.executable, "-m", "kindex.cli", *args]
-    if data_dir:
-        cmd.extend(["--data-dir", data_dir])
-    return subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+def _node_id(data_dir, title):
+    """Id of the node titled ``title``, via ``kin list --json``."""
+    nodes = json.loads(run("list", "--json", data_dir=data_dir).stdout)
+    return next(n["id"] for n in nodes if n["title"] == title)
 
 
 @pytest.fixture
-def store(tmp_path):
-    cfg = Config(data_dir=str(tmp_path))
-    s = Store(cfg)
-    yield s
-    s.close()
+def store(memory_store):
+    return memory_store
 
 
 class TestAKAStore:
@@ -43,6 +37,12 @@ class TestAKAStore:
         assert node is not None
         assert node["id"] == "py"
 
+    def test_non_ascii_alias_case_insensitive(self, store):
+        store.add_node("Overview", node_id="ov", aka=["Überblick"])
+        assert store.get_node_by_title("überblick")["id"] == "ov"
+        assert store.get_node_by_title("ÜBERBLICK")["id"] == "ov"
+        assert store.get_node_by_title("überbl") is None
+
     def test_no_alias_returns_none(self, store):
         store.add_node("Go", node_id="go")
         assert store.get_node_by_title("golang") is None
@@ -60,9 +60,7 @@ class TestAliasCLI:
         d = str(tmp_path)
         run("init", data_dir=d)
         run("add", "Stigmergy is coordination", data_dir=d)
-        # Get node ID
-        r = run("list", data_dir=d)
-        nid = r.stdout.strip().split()[-1]
+        nid = _node_id(d, "Stigmergy is coordination")
         # Add alias
         r2 = run("alias", nid, "add", "environmental coordination", data_dir=d)
         assert r2.returncode == 0
@@ -72,8 +70,7 @@ class TestAliasCLI:
         d = str(tmp_path)
         run("init", data_dir=d)
         run("add", "Stigmergy is coordination", data_dir=d)
-        r = run("list", data_dir=d)
-        nid = r.stdout.strip().split()[-1]
+        nid = _node_id(d, "Stigmergy is coordination")
         run("alias", nid, "add", "swarm intelligence", data_dir=d)
         r2 = run("alias", nid, "list", data_dir=d)
         assert r2.returncode == 0
@@ -83,8 +80,7 @@ class TestAliasCLI:
         d = str(tmp_path)
         run("init", data_dir=d)
         run("add", "Python is great", data_dir=d)
-        r = run("list", data_dir=d)
-        nid = r.stdout.strip().split()[-1]
+        nid = _node_id(d, "Python is great")
         run("alias", nid, "add", "py3", data_dir=d)
         r2 = run("alias", nid, "remove", "py3", data_dir=d)
         assert r2.returncode == 0
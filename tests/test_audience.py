@@ -2,16 +2,10 @@
 
 import pytest
 
-from kindex.config import Config
-from kindex.store import Store
-
 
 @pytest.fixture
-def store(tmp_path):
-    cfg = Config(data_dir=str(tmp_path))
-    s = Store(cfg)
-    yield s
-    s.close()
+def store(memory_store):
+    return memory_store
 
 
 class TestAudienceField:
@@ -32,10 +26,12 @@ class TestAudienceField:
         assert node["audience"] == "public"
 
     def test_filter_by_audience(self, store):
-        store.add_node("Private A", audience="private")
-        store.add_node("Team B", audience="team")
-        store.add_node("Public C", audience="public")
-        store.add_node("Team D", audience="team")
+        with store.transaction():
+            for title, audience in [("Private A", "private"), ("Team B", "team"),
+                                    ("Public C", "public"), ("Team D", "team")]:
+                store.add_node(title, audience=audience)
+
+        assert store.count_by_audience() == {"private": 1, "team": 2, "public": 1}
 
         private = store.all_nodes(audience="private")
         assert len(private) == 1
@@ -55,13 +51,14 @@ class TestAudienceField:
 
 class TestExportBoundaries:
     def test_team_export_excludes_private(self, store):
-        store.add_node("Private", content="secret", node_id="priv", audience="private")
-        store.add_node("Team", content="work stuff", node_id="team", audience="team")
-        store.add_node("Public", content="open", node_id="pub", audience="public")
-
-        # Edges: private → team, team → public
-        store.add_edge("priv", "team", provenance="internal link")
-        store.add_edge("team", "pub", provenance="public link")
+        with store.transaction():
+            store.add_node("Private", content="secret", node_id="priv", audience="private")
+            store.add_node("Team", content="work stuff", node_id="team", audience="team")
+            store.add_node("Public", content="open", node_id="pub", audience="public")
+
+            # Edges: private → team, team → public
+            store.add_edge("priv", "team", provenance="internal link")
+            store.add_edge("team", "pub", provenance="public link")
 
         # Team export: should include team + public, exclude private
         team_nodes = store.all_nodes(audience="team")
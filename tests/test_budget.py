@@ -27,6 +27,35 @@ class TestBudgetLedger:
         ledger2 = BudgetLedger(path, BudgetConfig())
         assert ledger2.today_spend == 0.001
 
+    def test_record_appends_without_rewriting_legacy_yaml(self, tmp_path):
+        from kindex.budget import _today
+
+        path = tmp_path / "budget.yaml"
+        legacy = f"entries:\n- date: '{_today()}'\n  amount: 0.002\n"
+        path.write_text(legacy)
+
+        ledger = BudgetLedger(path, BudgetConfig())
+        ledger.record(0.001, purpose="a")
+        ledger.record(0.003, purpose="b")
+
+        assert path.read_text() == legacy
+        assert len(ledger.journal_path.read_text().splitlines()) == 2
+        reloaded = BudgetLedger(path, BudgetConfig())
+        assert [e["amount"] for e in reloaded.entries] == [0.002, 0.001, 0.003]
+        assert round(reloaded.today_spend, 6) == 0.006
+
+    def test_record_after_torn_tail_starts_a_new_line(self, tmp_path):
+        path = tmp_path / "budget.yaml"
+        ledger = BudgetLedger(path, BudgetConfig())
+        ledger.record(0.001, purpose="a")
+        ledger.record(0.002, purpose="b")
+        torn = ledger.journal_path.read_bytes()[:-10]  # interrupted append
+        ledger.journal_path.write_bytes(torn)
+
+        BudgetLedger(path, BudgetConfig()).record(0.004, purpose="c")
+        reloaded = BudgetLedger(path, BudgetConfig())
+        assert [e["amount"] for e in reloaded.entries] == [0.001, 0.004]
+
     def test_summary(self, tmp_path):
         ledger = BudgetLedger(tmp_path / "budget.yaml", BudgetConfig())
         s = ledger.summary()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import shutil
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -25,41 +26,69 @@ def cfg(tmp_path):
 
 @pytest.fixture
 def store(cfg):
-    s = Store(cfg)
+    s = Store(cfg, in_memory=True)
     yield s
     s.close()
 
 
+@pytest.fixture(scope="module")
+def populated_seed(tmp_path_factory):
+    """kindex.db with a mix of node types and weights, built once per module."""
+    seed_dir = tmp_path_factory.mktemp("seed")
+    store = Store(Config(data_dir=str(seed_dir)), in_memory=True)
+    with store.transaction():
+        store.add_node(
+            title="Alpha Concept", content="Alpha content about systems",
+            node_type="concept", node_id="aaaa1111", weight=0.8,
+            domains=["systems"],
+        )
+        store.add_node(
+            title="Beta Pattern", content="Beta content about design",
+            node_type="concept", node_id="bbbb2222", weight=0.9,
+            domains=["design"],
+        )
+        store.add_node(
+            title="Gamma Session", content="Session transcript",
+            node_type="session", node_id="cccc3333", weight=0.5,
+        )
+        store.add_node(
+            title="Delta Low Weight", content="Low weight node",
+            node_type="concept", node_id="dddd4444", weight=0.2,
+        )
+        store.add_node(
+            title="Epsilon Document", content="Epsilon doc content",
+            node_type="document", node_id="eeee5555", weight=0.7,
+            domains=["research"],
+        )
+        # Add edges for tier 2 prediction
+        store.add_edge("aaaa1111", "bbbb2222", edge_type="relates_to", weight=0.9)
+        store.add_edge("bbbb2222", "eeee5555", edge_type="informs", weight=0.7)
+
+    seed = seed_dir / "kindex.db"
+    store.conn.execute("VACUUM INTO ?", (str(seed),))
+    store.close()
+    return seed
+
+
 @pytest.fixture
-def populated_store(store):
-    """Store with a mix of node types and weights."""
-    store.add_node(
-        title="Alpha Concept", content="Alpha content about systems",
-        node_type="concept", node_id="aaaa1111", weight=0.8,
-        domains=["systems"],
-    )
-    store.add_node(
-        title="Beta Pattern", content="Beta content about design",
-        node_type="concept", node_id="bbbb2222", weight=0.9,
-        domains=["design"],
-    )
-    store.add_node(
-        title="Gamma Session", content="Session transcript",
-        node_type="session", node_id="cccc3333", weight=0.5,
-    )
-    store.add_node(
-        title="Delta Low Weight", content="Low weight node",
-        node_type="concept", node_id="dddd4444", weight=0.2,
-    )
-    store.add_node(
-        title="Epsilon Document", content="Epsilon doc content",
-        node_type="document", node_id="eeee5555", weight=0.7,
-        domains=["research"],
-    )
-    # Add edges for tier 2 prediction
-    store.add_edge("aaaa1111", "bbbb2222", edge_type="relates_to", weight=0.9)
-    store.add_edge("bbbb2222", "eeee5555", edge_type="informs", weight=0.7)
-    return store
+def populated_store(cfg, populated_seed):
+    """Store on a private copy of the seeded database."""
+    cfg.data_path.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(populated_seed, cfg.data_path / "kindex.db")
+    s = Store(cfg)
+    yield s
+    s.close()
+
+
+@pytest.fixture(scope="class")
+def codebook_all(populated_seed, tmp_path_factory):
+    """(text, index) for the seeded store's full codebook, built once per class."""
+    data_dir = tmp_path_factory.mktemp("codebook")
+    shutil.copyfile(populated_seed, data_dir / "kindex.db")
+    s = Store(Config(data_dir=str(data_dir)))
+    text, _ = generate_codebook(s, min_weight=0.0)
+    s.close()
+    return text, build_codebook_index(text)
 
 
 # ── Codebook generation ───────────────────────────────────────────────
@@ -142,10 +171,9 @@ class TestCodebookIndex:
         for entry_num in index.values():
             assert entry_num.startswith("#")
 
-    def test_lookup_by_truncated_id(self, populated_store):
+    def test_lookup_by_truncated_id(self, codebook_all):
         """Can look up entry number by truncated node ID."""
-        text, _ = generate_codebook(populated_store, min_weight=0.0)
-        index = build_codebook_index(text)
+        _, index = codebook_all
         assert "aaaa1111" in index
         assert "bbbb2222" in index
 
@@ -195,19 +223,17 @@ class TestTier2Prediction:
 
 
 class TestTier2Formatting:
-    def test_includes_titles(self, populated_store):
+    def test_includes_titles(self, populated_store, codebook_all):
         """Format includes node titles."""
-        text, _ = generate_codebook(populated_store, min_weight=0.0)
-        index = build_codebook_index(text)
+        _, index = codebook_all
         nodes = [populated_store.get_node("aaaa1111")]
         nodes[0]["edges_out"] = []
         result = format_tier2(nodes, index)
         assert "Alpha Concept" in result
 
-    def test_sorted_by_id(self, populated_store):
+    def test_sorted_by_id(self, populated_store, codebook_all):
         """Entries are sorted by node ID."""
-        text, _ = generate_codebook(populated_store, min_weight=0.0)
-        index = build_codebook_index(text)
+        _, index = codebook_all
         n1 = populated_store.get_node("aaaa1111")
         n2 = populated_store.get_node("bbbb2222")
         n1["edges_out"] = []
@@ -217,10 +243,9 @@ class TestTier2Formatting:
         pos_b = result.find("Beta")
         assert pos_a < pos_b  # sorted by ID, a before b
 
-    def test_respects_token_budget(self, populated_store):
+    def test_respects_token_budget(self, populated_store, codebook_all):
         """Stops adding entries when token budget exceeded."""
-        text, _ = generate_codebook(populated_store, min_weight=0.0)
-        index = build_codebook_index(text)
+        _, index = codebook_all
         nodes = []
         for nid in ["aaaa1111", "bbbb2222", "eeee5555"]:
             n = populated_store.get_node(nid)
@@ -231,10 +256,9 @@ class TestTier2Formatting:
         # Should be truncated — not all nodes included
         assert len(result) < 2000
 
-    def test_includes_codebook_refs(self, populated_store):
+    def test_includes_codebook_refs(self, populated_store, codebook_all):
         """Format includes codebook entry references."""
-        text, _ = generate_codebook(populated_store, min_weight=0.0)
-        index = build_codebook_index(text)
+        _, index = codebook_all
         n = populated_store.get_node("aaaa1111")
         n["edges_out"] = populated_store.edges_from("aaaa1111")
         result = format_tier2([n], index)
@@ -1,23 +1,19 @@
 """Tests for Kindex (kin) CLI commands."""
 
-import subprocess
-import sys
+import os
+import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from _cli import run
 
-def run(*args):
-    return subprocess.run(
-        [sys.executable, "-m", "kindex.cli", *args],
-        capture_output=True, text=True, timeout=30,
-    )
 
-
-@pytest.fixture
-def data_dir(tmp_path):
-    """Set up a temp data dir with some data for CLI tests."""
-    d = str(tmp_path)
+@pytest.fixture(scope="module")
+def seed_data_dir(tmp_path_factory):
+    """A data dir initialised with some data, built once per module."""
+    d = str(tmp_path_factory.mktemp("seed"))
     # Init
     r = run("init", "--data-dir", d)
     assert r.returncode == 0
@@ -25,7 +21,15 @@ def data_dir(tmp_path):
     # Add some nodes
     run("add", "Stigmergy is coordination through environmental traces", "--data-dir", d)
     run("add", "Python is an expert-level skill", "--type", "skill", "--data-dir", d)
-    return d
+    return Path(d)
+
+
+@pytest.fixture
+def data_dir(tmp_path, seed_data_dir):
+    """A private copy of the seeded data dir for CLI tests."""
+    d = tmp_path / "data"
+    shutil.copytree(seed_data_dir, d)
+    return str(d)
 
 
 class TestVersion:
@@ -231,19 +235,22 @@ class TestMigrate:
         r2 = run("search", "test topic", "--data-dir", d)
         assert "Test Topic" in r2.stdout or "test" in r2.stdout.lower()
 
+        from kindex.config import Config
+        from kindex.store import Store
+        store = Store(Config(data_dir=d))
+        assert "Content." in store.get_node("test-topic")["content"]
+        store.close()
+
 
 # ── collab: lock/unlock + coord join/attach/inject ────────────────────
 
 
 def run_as(agent, *args):
     """Run kin as a specific agent identity (KIN_AGENT_ID)."""
-    import os
-    env = {**os.environ, "KIN_AGENT_ID": agent}
-    env.pop("KIN_PROFILE", None)
-    return subprocess.run(
-        [sys.executable, "-m", "kindex.cli", *args],
-        capture_output=True, text=True, timeout=30, env=env,
-    )
+    env = {k: v for k, v in os.environ.items() if k != "KIN_PROFILE"}
+    env["KIN_AGENT_ID"] = agent
+    with patch.dict(os.environ, env, clear=True):
+        return run(*args)
 
 
 class TestLockCLI:
@@ -1,5 +1,7 @@
 """Tests for five-tier context retrieval system."""
 
+import shutil
+
 import pytest
 
 from kindex.config import Config
@@ -13,31 +15,43 @@ from kindex.retrieve import (
 from kindex.store import Store
 
 
-@pytest.fixture
-def populated_store(tmp_path):
-    cfg = Config(data_dir=str(tmp_path))
-    s = Store(cfg)
-    s.add_node("Stigmergy", content="Coordination through environmental traces",
-               node_id="stig", domains=["systems", "coordination"], weight=1.0)
-    s.add_node("Emergence Architecture", content="Stigmergic task coordination for distributed systems",
-               node_id="emerge", domains=["systems", "engineering"], weight=0.9)
-    s.add_node("Patent Filing", content="ASD mesh patent for organizational health monitoring",
-               node_id="patent", domains=["ip", "research"], weight=1.0)
-    s.add_node("Database Design", content="Schema normalization and indexes for graph storage",
-               node_id="db", domains=["engineering"], weight=0.5)
-
-    s.add_edge("stig", "emerge", weight=0.9, provenance="same principles")
-    s.add_edge("patent", "stig", weight=1.0, provenance="ASD uses stigmergy")
-    s.add_edge("patent", "emerge", weight=0.8, provenance="both coordination")
+@pytest.fixture(scope="module")
+def populated_seed(tmp_path_factory):
+    """kindex.db with the shared nodes and edges, built once per module."""
+    seed_dir = tmp_path_factory.mktemp("seed")
+    s = Store(Config(data_dir=str(seed_dir)), in_memory=True)
+    with s.transaction():
+        s.add_node("Stigmergy", content="Coordination through environmental traces",
+                   node_id="stig", domains=["systems", "coordination"], weight=1.0)
+        s.add_node("Emergence Architecture", content="Stigmergic task coordination for distributed systems",
+                   node_id="emerge", domains=["systems", "engineering"], weight=0.9)
+        s.add_node("Patent Filing", content="ASD mesh patent for organizational health monitoring",
+                   node_id="patent", domains=["ip", "research"], weight=1.0)
+        s.add_node("Database Design", content="Schema normalization and indexes for graph storage",
+                   node_id="db", domains=["engineering"], weight=0.5)
+
+        s.add_edge("stig", "emerge", weight=0.9, provenance="same principles")
+        s.add_edge("patent", "stig", weight=1.0, provenance="ASD uses stigmergy")
+        s.add_edge("patent", "emerge", weight=0.8, provenance="both coordination")
+
+    seed = seed_dir / "kindex.db"
+    s.conn.execute("VACUUM INTO ?", (str(seed),))
+    s.close()
+    return seed
 
+
+@pytest.fixture
+def populated_store(tmp_path, populated_seed):
+    """Store on a private copy of the seeded database."""
+    shutil.copyfile(populated_seed, tmp_path / "kindex.db")
+    s = Store(Config(data_dir=str(tmp_path)))
     yield s
     s.close()
 
 
 class TestOperationalScoping:
     def test_format_context_block_scopes_operational_by_adapter(self, tmp_path):
-        cfg = Config(data_dir=str(tmp_path))
-        store = Store(cfg)
+        store = Store(Config(data_dir=str(tmp_path)), in_memory=True)
         store.add_node("Stigmergy", content="Coordination through environmental traces",
                        node_id="stig", domains=["systems"], weight=1.0)
         # An Antigravity-scoped constraint — an operational node that _append_operational
@@ -132,6 +146,11 @@ class TestSummarizedTier:
         abridged = format_context_block(populated_store, results, query="stigmergy", level="abridged")
         assert len(block) <= len(abridged)
 
+    def test_domain_clusters_keep_relevance_order(self, populated_store):
+        results = [populated_store.get_node(n) for n in ("patent", "db", "stig")]
+        block = format_context_block(populated_store, results, query="x", level="summarized")
+        assert block.index("**ip:**") < block.index("**engineering:**") < block.index("**systems:**")
+
 
 class TestExecutiveTier:
     def test_very_short(self, populated_store):
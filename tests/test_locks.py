@@ -193,6 +193,17 @@ class TestAtomicExtraUpdate:
             store.atomic_extra_update(nid, boom)
         assert store.get_node(nid)["extra"] == {"a": 1}
 
+    def test_noop_mutation_skips_write(self, store):
+        nid = store.add_node("N", extra={"a": 1})
+        store.conn.execute(
+            "UPDATE nodes SET updated_at = '2000-01-01T00:00:00' WHERE id = ?", (nid,))
+        store.conn.commit()
+        final = store.atomic_extra_update(nid, lambda e: e.setdefault("a", 5) and None)
+        assert final == {"a": 1}
+        row = store.conn.execute(
+            "SELECT updated_at FROM nodes WHERE id = ?", (nid,)).fetchone()
+        assert row["updated_at"] == "2000-01-01T00:00:00"
+
     def test_interleaving_two_store_handles(self, tmp_path):
         """BEGIN IMMEDIATE serializes writers: no lost updates."""
         cfg_a = Config(data_dir=str(tmp_path))
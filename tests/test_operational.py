@@ -50,6 +50,27 @@ class TestConstraintNodes:
         assert "Run tests before deploy" in titles
         assert "Check migrations" in titles
 
+    def test_trigger_and_owner_match_exactly(self, store):
+        store.add_node("Deploy gate", node_type="constraint",
+                       extra={"trigger": "pre-deploy", "owner": "jeremy"})
+        store.add_node("Mentions trigger", node_type="constraint",
+                       extra={"trigger": "pre-commit", "note": "deploy"})
+        store.add_node("Broken extra", node_type="constraint")
+        store.conn.execute(
+            "UPDATE nodes SET extra = 'not json' WHERE title = 'Broken extra'")
+        store.conn.commit()
+
+        assert [n["title"] for n in store.nodes_by_trigger("pre-deploy")] == ["Deploy gate"]
+        assert store.nodes_by_trigger("deploy") == []
+        assert store.nodes_by_owner("jer") == []
+        assert [n["title"] for n in store.nodes_by_owner("jeremy")] == ["Deploy gate"]
+
+        plan = " ".join(r["detail"] for r in store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM nodes WHERE "
+            "CASE WHEN json_valid(extra) THEN json_extract(extra, '$.owner') END = ? "
+            "AND status = 'active'", ("jeremy",)))
+        assert "idx_nodes_owner" in plan
+
     def test_active_constraints(self, store):
         store.add_node("Active rule", node_type="constraint", status="active")
         store.add_node("Old rule", node_type="constraint", status="archived")
@@ -121,6 +142,20 @@ class TestWatchNodes:
         assert "No expiry watch" in titles
         assert "Expired watch" not in titles
 
+    def test_active_watches_agree_with_node_expired(self, store):
+        from kindex.store import _now, node_expired
+
+        today = _now()[:10]
+        for title, extra in [("today", {"expires": today}),
+                             ("blank", {"expires": ""}),
+                             ("null", {"expires": None}),
+                             ("number", {"expires": 20200101}),
+                             ("past", {"expires": "2020-01-01"})]:
+            store.add_node(title, node_type="watch", extra=extra)
+        titles = {w["title"] for w in store.active_watches()}
+        assert titles == {"today", "blank", "null", "number"}
+        assert not any(node_expired(w) for w in store.active_watches())
+
     def test_filter_by_owner(self, store):
         store.add_node("Jeremy's watch", node_type="watch",
                        extra={"owner": "jeremy"})
@@ -166,6 +201,21 @@ class TestOperationalSummary:
         assert len(ops["constraints"]) == 1
         assert ops["constraints"][0]["title"] == "Deploy check"
 
+    def test_summary_cached_until_write(self, store):
+        store.add_node("Constraint A", node_type="constraint")
+        first = store.operational_summary()
+        calls = []
+        orig = store._operational_summary
+        store._operational_summary = lambda *a: calls.append(a) or orig(*a)
+
+        assert store.operational_summary() == first
+        assert calls == []
+
+        store.add_node("Constraint B", node_type="constraint")
+        ops = store.operational_summary()
+        assert len(ops["constraints"]) == 2
+        assert len(calls) == 1
+
 
 class TestOperationalCLI:
     def test_add_constraint(self, tmp_path):
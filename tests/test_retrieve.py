@@ -3,7 +3,7 @@
 import pytest
 
 from kindex.config import Config
-from kindex.retrieve import format_context_block, hybrid_search
+from kindex.retrieve import _rrf_merge, format_context_block, hybrid_search
 from kindex.store import Store
 
 
@@ -46,6 +46,18 @@ class TestHybridSearch:
         assert results == []
 
 
+class TestRRFMerge:
+    def test_single_list_keeps_order(self):
+        merged = _rrf_merge(["a", "b", "c"], k=30)
+        assert [nid for nid, _ in merged] == ["a", "b", "c"]
+        assert merged[0][1] == pytest.approx(1.0 / 31)
+
+    def test_two_lists_sum_reciprocal_ranks(self):
+        merged = _rrf_merge(["a", "b"], iter(["b", "c"]), k=30)
+        assert merged[0] == ("b", pytest.approx(1.0 / 32 + 1.0 / 31))
+        assert {nid for nid, _ in merged} == {"a", "b", "c"}
+
+
 class TestContextBlock:
     def test_format(self, populated_store):
         results = hybrid_search(populated_store, "stigmergy", top_k=3)
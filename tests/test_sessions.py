@@ -190,6 +190,8 @@ class TestPauseAndComplete:
         tag = get_tag(store, "pause-test")
         assert tag["extra"]["session_status"] == "paused"
         assert tag["extra"]["paused_at"] is not None
+        assert tag["extra"]["tag"] == "pause-test"
+        assert get_tag(store, "pause-test")["id"] == tag["id"]
 
     def test_pause_with_summary(self, store):
         from kindex.sessions import start_tag, pause_tag, get_tag
@@ -218,6 +220,25 @@ class TestPauseAndComplete:
         assert seg["ended_at"] is not None
         assert seg["summary"] == "All done"
 
+    def test_transition_shares_one_timestamp(self, store, monkeypatch):
+        from kindex import sessions, store as store_mod
+        from kindex.sessions import start_tag, pause_tag, complete_tag, get_tag
+
+        start_tag(store, "one-clock", focus="Working")
+        ticks = iter(f"2026-01-01T00:00:{i:02d}" for i in range(60))
+        monkeypatch.setattr(sessions, "_now", lambda: next(ticks))
+        monkeypatch.setattr(store_mod, "_now", lambda: next(ticks))
+
+        pause_tag(store, "one-clock")
+        tag = get_tag(store, "one-clock")
+        assert tag["extra"]["paused_at"] == tag["updated_at"]
+
+        complete_tag(store, "one-clock", summary="done")
+        tag = get_tag(store, "one-clock")
+        stamp = tag["extra"]["completed_at"]
+        assert tag["extra"]["segments"][0]["ended_at"] == stamp
+        assert tag["updated_at"] == stamp
+
     def test_complete_nonexistent_raises(self, store):
         from kindex.sessions import complete_tag
 
@@ -250,11 +271,44 @@ class TestGetTag:
         active = get_active_tag(store, project_path="/tmp/proj")
         assert active is None
 
+    def test_get_active_tag_skips_newer_paused(self, store):
+        from kindex.sessions import start_tag, pause_tag, get_active_tag
+
+        older = start_tag(store, "older-active", project_path="/tmp/proj")
+        start_tag(store, "newer-paused", project_path="/tmp/proj")
+        pause_tag(store, "newer-paused")
+        store.conn.execute(
+            "UPDATE nodes SET updated_at = '2000-01-01T00:00:00' WHERE id = ?", (older,))
+        store.conn.commit()
+        active = get_active_tag(store, project_path="/tmp/proj")
+        assert active is not None and active["id"] == older
+
+    def test_active_tag_lookup_uses_status_index(self, store):
+        rows = store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM nodes WHERE type = 'session' "
+            "AND session_status_g = ? AND project_path_g = ? "
+            "ORDER BY updated_at DESC LIMIT 1",
+            ("active", "/tmp/proj"),
+        ).fetchall()
+        detail = " ".join(r["detail"] for r in rows)
+        assert "idx_nodes_session_status" in detail
+        assert "TEMP B-TREE" not in detail
+
     def test_get_nonexistent_returns_none(self, store):
         from kindex.sessions import get_tag
 
         assert get_tag(store, "does-not-exist") is None
 
+    def test_get_by_unnormalized_or_raw_name(self, store):
+        from kindex.sessions import start_tag, get_tag
+
+        start_tag(store, "find-me")
+        assert get_tag(store, "Find Me")["extra"]["tag"] == "find-me"
+
+        raw = store.add_node("Legacy Tag", node_type="session",
+                             extra={"tag": "Legacy Tag", "session_status": "active"})
+        assert get_tag(store, "Legacy Tag")["id"] == raw
+
 
 class TestListTags:
     def test_list_all(self, store):
@@ -319,6 +373,20 @@ class TestResumeContext:
         ctx = format_resume_context(store, "linked-resume")
         assert "Important Concept" in ctx
 
+    def test_resume_linked_nodes_keep_order_and_cap(self, store):
+        from kindex.sessions import start_tag, link_node_to_tag, format_resume_context
+
+        start_tag(store, "many-linked", focus="Exploring")
+        ids = [store.add_node(f"Linked {i:02d}") for i in range(12)]
+        for nid in ids:
+            link_node_to_tag(store, "many-linked", nid)
+        store.delete_node(ids[0])
+        ctx = format_resume_context(store, "many-linked")
+        assert "Linked 00" not in ctx
+        assert ctx.index("Linked 01") < ctx.index("Linked 10")
+        assert "Linked 11" not in ctx
+        assert "... and 2 more" in ctx
+
     def test_resume_nonexistent_tag(self, store):
         from kindex.sessions import format_resume_context
 
@@ -355,6 +423,17 @@ class TestLinkNode:
         tag = get_tag(store, "artifact-test")
         assert nid in tag["extra"]["segments"][0]["artifacts"]
 
+    def test_link_node_goes_to_latest_segment_only(self, store):
+        from kindex.sessions import start_tag, add_segment, link_node_to_tag, get_tag
+
+        start_tag(store, "seg-artifacts", focus="First")
+        add_segment(store, "seg-artifacts", new_focus="Second")
+        nid = store.add_node("Later Artifact", node_type="concept")
+        link_node_to_tag(store, "seg-artifacts", nid)
+        segments = get_tag(store, "seg-artifacts")["extra"]["segments"]
+        assert segments[0]["artifacts"] == []
+        assert segments[1]["artifacts"] == [nid]
+
     def test_link_duplicate_is_idempotent(self, store):
         from kindex.sessions import start_tag, link_node_to_tag, get_tag
 
@@ -365,6 +444,18 @@ class TestLinkNode:
         tag = get_tag(store, "dup-link")
         assert tag["extra"]["linked_nodes"].count(nid) == 1
 
+    def test_link_many_nodes_at_once(self, store):
+        from kindex.sessions import start_tag, link_nodes_to_tag, get_tag
+
+        start_tag(store, "bulk-link", focus="Wrapping up")
+        ids = [store.add_node(f"Captured {i}") for i in range(3)]
+        link_nodes_to_tag(store, "bulk-link", ids + [ids[0], "no-such-node"])
+        tag = get_tag(store, "bulk-link")
+        assert tag["extra"]["linked_nodes"] == ids + ["no-such-node"]
+        assert tag["extra"]["segments"][0]["artifacts"] == ids + ["no-such-node"]
+        assert {e["from_id"] for e in store.edges_to(tag["id"])
+                if e["type"] == "context_of"} == set(ids)
+
 
 class TestTagCLI:
     def test_tag_start(self, tmp_path):
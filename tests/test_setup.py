@@ -640,3 +640,67 @@ class TestSetupCron:
         actions = uninstall_launchd(dry_run=True)
         # It either finds the plist and says "Would remove" or doesn't find it
         assert len(actions) > 0
+
+    def test_render_plist_escapes_and_splits_arguments(self, tmp_path):
+        """Plist values are XML-escaped and each argument is its own string."""
+        import plistlib
+        from kindex.setup import _kin_command_parts, _render_plist
+
+        log_dir = tmp_path / "R&D <logs>"
+        content = _render_plist(
+            "com.kindex.cron",
+            _kin_command_parts("/usr/bin/python3 -m kindex.cli") + ["cron"],
+            300, log_dir / "cron.log", log_dir / "cron-error.log",
+        )
+        plist = plistlib.loads(content.encode())
+        assert plist["Label"] == "com.kindex.cron"
+        assert plist["ProgramArguments"] == [
+            "/usr/bin/python3", "-m", "kindex.cli", "cron"]
+        assert plist["StartInterval"] == 300
+        assert plist["StandardOutPath"] == str(log_dir / "cron.log")
+
+    def test_find_kin_path_resolved_once(self, monkeypatch):
+        """_find_kin_path uses shutil.which and caches the result."""
+        from kindex import setup
+
+        calls = []
+        monkeypatch.setattr(setup.shutil, "which",
+                            lambda name: calls.append(name) or "/opt/bin/kin")
+        setup._find_kin_path.cache_clear()
+        try:
+            assert setup._find_kin_path() == "/opt/bin/kin"
+            assert setup._find_kin_path() == "/opt/bin/kin"
+            assert calls == ["kin"]
+        finally:
+            setup._find_kin_path.cache_clear()
+
+
+class TestSettingsJson:
+    def test_write_then_load_roundtrip(self, tmp_path):
+        from kindex.setup import _load_json, _write_json
+
+        path = tmp_path / "settings.json"
+        data = {"hooks": {"SessionStart": [{"hooks": [{"command": "kin prime"}]}]}}
+        _write_json(path, data)
+        text = path.read_text()
+        assert text.endswith("}\n")
+        assert text.startswith('{\n  "hooks"')
+        assert _load_json(path) == data
+
+
+class TestHookText:
+    def test_reads_nested_and_flat_commands(self):
+        from kindex.setup import _hook_text
+
+        entry = {"matcher": "kindex-notes", "hooks": [
+            {"type": "command", "command": "kin prime --for hook"},
+            {"type": "command", "command": "echo done"},
+        ]}
+        assert _hook_text(entry) == "kin prime --for hook\necho done"
+        assert _hook_text({"command": "kin compact-hook"}) == "kin compact-hook"
+
+    def test_matcher_text_is_not_a_command(self):
+        from kindex.setup import _hook_text
+
+        entry = {"matcher": "kindex", "hooks": [{"command": "echo hi"}]}
+        assert "kindex" not in _hook_text(entry)
@@ -1,8 +1,11 @@
 """Tests for SQLite store."""
 
+import json
+
 import pytest
 
 from kindex.config import Config
+from kindex.schema import SCHEMA_VERSION
 from kindex.store import Store
 
 
@@ -65,6 +68,16 @@ class TestNodeOperations:
         assert len(store.all_nodes()) == 3
         assert len(store.all_nodes(node_type="concept")) == 2
 
+    def test_list_nodes_brief(self, store):
+        store.add_node("Heavy", node_id="h", content="x" * 1000, weight=0.9,
+                       extra={"big": list(range(50))})
+        store.add_node("Light", node_id="l", node_type="skill", weight=0.2)
+        brief = store.list_nodes_brief()
+        assert [n["id"] for n in brief] == ["h", "l"]
+        assert set(brief[0]) == {"id", "title", "type", "weight", "status",
+                                 "audience", "updated_at"}
+        assert [n["id"] for n in store.list_nodes_brief(node_type="skill")] == ["l"]
+
     def test_recent_nodes(self, store):
         store.add_node("Old")
         store.add_node("New")
@@ -79,6 +92,246 @@ class TestNodeOperations:
         assert "a1" in ids
         assert "b2" in ids
 
+    def test_session_and_title_lookups_use_indexes(self, store):
+        def plan(sql, params):
+            rows = store.conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+            return " ".join(r["detail"] for r in rows)
+
+        sessions = plan("SELECT * FROM nodes WHERE type = 'session' AND extra LIKE ? "
+                        "ORDER BY updated_at DESC LIMIT ?", ("%x%", 5))
+        assert "idx_nodes_session" in sessions
+        assert "TEMP B-TREE" not in sessions
+        assert "idx_nodes_title_lower" in plan(
+            "SELECT * FROM nodes WHERE lower(title) = lower(?)", ("x",))
+
+    def test_typed_status_listing_needs_no_sort(self, store):
+        plan = " ".join(r["detail"] for r in store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM nodes WHERE type = ? AND status = ? "
+            "ORDER BY weight DESC, updated_at DESC LIMIT ?", ("constraint", "active", 5)))
+        assert "idx_nodes_type_status_weight" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_patch_node_extra(self, store):
+        nid = store.add_node("P", extra={"keep": [1, 2], "status": "old"})
+        assert store.patch_node_extra(nid, {"status": "new", "meta": {"n": 1}, "gone": None})
+        assert store.get_node(nid)["extra"] == {
+            "keep": [1, 2], "status": "new", "meta": {"n": 1}, "gone": None}
+        assert not store.patch_node_extra("missing", {"status": "x"})
+
+    def test_json_columns_round_trip(self, store):
+        from datetime import datetime
+        from pathlib import Path
+
+        extra = {"when": datetime(2026, 1, 2, 3, 4, 5), "path": Path("/tmp/x"),
+                 "name": "café", 3: "int key"}
+        nid = store.add_node("J", aka=["jé"], extra=extra)
+        node = store.get_node(nid)
+        assert node["aka"] == ["jé"]
+        assert node["extra"] == {"when": "2026-01-02T03:04:05", "path": "/tmp/x",
+                                 "name": "café", "3": "int key"}
+
+    def test_decoded_lists_are_not_shared(self, store):
+        store.add_node("A", node_id="a", aka=["alpha"], domains=["x"])
+        store.add_node("B", node_id="b", aka=["alpha"], domains=["x"])
+        a, b = store.get_node("a"), store.get_node("b")
+        a["aka"].append("mutated")
+        a["domains"].append("y")
+        assert b["aka"] == ["alpha"] and b["domains"] == ["x"]
+        assert store.get_node("a")["aka"] == ["alpha"]
+
+    def test_node_rows_match_row_to_dict(self, store):
+        store.add_node("A", node_id="a", aka=["alpha"], domains=["x"],
+                       extra={"k": [1]})
+        store.add_node("B", node_id="b")
+        store.conn.execute("UPDATE nodes SET extra = 'not json' WHERE id = 'b'")
+        sql = "SELECT * FROM nodes ORDER BY id"
+        expected = [store._row_to_dict(r) for r in store.conn.execute(sql)]
+        assert store._node_rows(store.conn.execute(sql)) == expected
+        assert expected[0]["tags"] == ["x"] and expected[1]["extra"] == "not json"
+        assert store._node_rows(store.conn.execute("UPDATE nodes SET weight = 1")) == []
+
+    def test_get_nodes_minimal_binds_ids_in_batches(self, store):
+        import sqlite3
+
+        ids = [store.add_node(f"N{i}", node_id=f"n{i}") for i in range(3)]
+        # The pre-3.32 default limit on bound parameters.
+        store.conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        found = store.get_nodes_minimal([f"x{i}" for i in range(1200)] + ids)
+        assert sorted(found) == ids
+        assert found["n1"] == {"id": "n1", "title": "N1", "type": "concept"}
+
+    def test_in_memory_store_writes_no_files(self, tmp_path):
+        s = Store(Config(data_dir=str(tmp_path)), in_memory=True)
+        s.add_node("A", node_id="a")
+        assert s.read_conn is s.conn
+        assert [n["id"] for n in s.all_nodes()] == ["a"]
+        s.close()
+        assert not s.db_path.exists()
+
+    def test_get_node_touch_is_buffered(self, store, tmp_path):
+        def accessed(nid):
+            return store.conn.execute(
+                "SELECT last_accessed FROM nodes WHERE id = ?", (nid,)).fetchone()[0]
+
+        store.add_node("A", node_id="a")
+        store.add_node("B", node_id="b")
+        store.conn.execute("UPDATE nodes SET last_accessed = '2020-01-01T00:00:00'")
+        store.conn.commit()
+
+        store.get_node("a")
+        assert not store.conn.in_transaction
+        assert accessed("a") == "2020-01-01T00:00:00"
+
+        store.update_node("b", content="write")  # touch rides along
+        assert accessed("a") > "2020"
+
+        store.get_node("b")
+        store.close()
+        s = Store(Config(data_dir=str(tmp_path)))
+        assert s.conn.execute(
+            "SELECT last_accessed FROM nodes WHERE id = 'b'").fetchone()[0] > "2020"
+        s.close()
+
+    def test_read_conn_is_query_only_and_sees_own_writes(self, store):
+        import sqlite3
+
+        store.add_node("Committed", node_id="c")
+        assert store.read_conn is not store.conn
+        assert store.read_conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            store.read_conn.execute("DELETE FROM nodes")
+
+        with store.transaction():
+            store.add_node("Pending", node_id="p")
+            assert store.read_conn is store.conn
+            assert {n["id"] for n in store.all_nodes()} == {"c", "p"}
+        assert {n["id"] for n in store.list_nodes_brief()} == {"c", "p"}
+
+    def test_connection_pragmas(self, store):
+        def pragma(name):
+            return store.conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("temp_store") == 2  # MEMORY
+        assert pragma("cache_size") == -65536
+        assert pragma("foreign_keys") == 1
+
+
+class TestTransaction:
+    def test_commits_once_at_exit(self, store):
+        with store.transaction():
+            a = store.add_node("A")
+            b = store.add_node("B")
+            store.add_edge(a, b)
+            assert store.conn.in_transaction
+        assert not store.conn.in_transaction
+        assert len(store.edges_from(a)) == 1
+
+    def test_rolls_back_everything_on_error(self, store):
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.add_node("A", node_id="a")
+                store.atomic_extra_update("a", lambda e: e.update({"x": 1}) or None)
+                raise RuntimeError("abort")
+        assert store.get_node("a") is None
+
+    def test_add_node_with_people_commits_once(self, store):
+        store.conn  # open + migrate outside the trace
+        stmts = []
+        store.conn.set_trace_callback(stmts.append)
+        nid = store.add_node("Design review", prov_who=["alice", "bob"],
+                             prov_activity="meeting")
+        store.conn.set_trace_callback(None)
+        assert [s for s in stmts if s.split()[0] in ("BEGIN", "COMMIT")] == [
+            "BEGIN IMMEDIATE", "COMMIT"]
+        people = {store.get_node(e["to_id"])["title"] for e in store.edges_from(nid)}
+        assert people == {"alice", "bob"}
+
+    def test_auto_person_resolved_once_per_name(self, store, monkeypatch):
+        calls = []
+        real = Store.get_node_by_title
+        monkeypatch.setattr(Store, "get_node_by_title",
+                            lambda self, t: calls.append(t) or real(self, t))
+        nid = store.add_node("Standup", prov_who=["carol", "carol", ""],
+                             prov_activity="meeting")
+        assert calls == ["carol"]
+        people = store.all_nodes(node_type="person")
+        assert [p["title"] for p in people] == ["carol"]
+        assert [e["to_id"] for e in store.edges_from(nid)] == [people[0]["id"]]
+
+    def test_weight_decay_in_one_transaction(self, store):
+        a = store.add_node("Old", node_id="old")
+        b = store.add_node("Fresh", node_id="fresh")
+        store.add_edge(a, b, weight=0.8)
+        store.conn.execute(
+            "UPDATE nodes SET last_accessed = '2020-01-01T00:00:00' WHERE id = 'old'")
+        store.conn.execute("UPDATE edges SET created_at = '2020-01-01T00:00:00'")
+        store.conn.commit()
+
+        assert store.apply_weight_decay() == 1
+        assert not store.conn.in_transaction
+        assert store.get_node("old")["weight"] == 0.01
+        assert store.get_node("fresh")["weight"] == 0.5
+        assert all(e["weight"] == 0.01 for e in store.edges_from(a))
+
+    def test_weight_decay_matches_half_life(self, store):
+        from datetime import datetime, timedelta
+
+        now = datetime.now()
+        for days in (0, 1, 45, 90, 180, 3000):
+            store.add_node(f"N{days}", node_id=f"n{days}", weight=0.8)
+            store.conn.execute(
+                "UPDATE nodes SET last_accessed = ? WHERE id = ?",
+                ((now - timedelta(days=days, hours=1)).isoformat(timespec="seconds"),
+                 f"n{days}"))
+        store.add_node("Bad stamp", node_id="bad", weight=0.8)
+        store.conn.execute("UPDATE nodes SET last_accessed = 'never' WHERE id = 'bad'")
+        store.conn.commit()
+
+        assert store.apply_weight_decay(node_half_life_days=90) == 5
+        weights = {r["id"]: r["weight"] for r in store.conn.execute(
+            "SELECT id, weight FROM nodes")}
+        assert weights["n0"] == 0.8
+        assert weights["n1"] == round(0.8 * 0.5 ** (1 / 90), 4)
+        assert weights["n45"] == round(0.8 * 0.5 ** 0.5, 4)
+        assert weights["n90"] == 0.4
+        assert weights["n180"] == 0.2
+        assert weights["n3000"] == 0.01
+        assert weights["bad"] == 0.8
+
+    def test_adopts_pending_implicit_transaction(self, store):
+        store.add_node("A", node_id="a")
+        store.conn.execute("UPDATE nodes SET weight = 0.9 WHERE id = 'a'")
+        assert store.conn.in_transaction
+        store.add_node("B", node_id="b")
+        assert not store.conn.in_transaction
+        assert store.get_node("a")["weight"] == 0.9
+
+    def test_logged_writes_commit_with_their_log_row(self, store):
+        store.add_node("A", node_id="a")
+        stmts = []
+        store.conn.set_trace_callback(stmts.append)
+        store.update_node("a", content="changed")
+        sid = store.add_suggestion("a", "b")
+        store.update_suggestion(sid, "accepted")
+        store.update_directive_state("a", {"phase": 2})
+        store.delete_node("a")
+        store.conn.set_trace_callback(None)
+
+        assert not store.conn.in_transaction
+        assert sum(s == "COMMIT" for s in stmts) == 5
+        assert {r["action"] for r in store.recent_activity(5)} == {
+            "delete_node", "update_state", "update_suggestion",
+            "add_suggestion", "update_node"}
+
+    def test_nested_joins_outer(self, store):
+        with store.transaction():
+            with store.transaction():
+                store.add_node("A", node_id="a")
+            assert store.conn.in_transaction
+        assert store.get_node("a") is not None
+
 
 class TestEdgeOperations:
     def test_add_edge_bidirectional(self, store):
@@ -88,6 +341,28 @@ class TestEdgeOperations:
         assert len(store.edges_from("a")) == 1
         assert len(store.edges_to("a")) == 1  # bidirectional creates reverse
 
+    def test_add_edge_commits_once(self, store):
+        store.add_node("A", node_id="a")
+        store.add_node("B", node_id="b")
+        stmts = []
+        store.conn.set_trace_callback(stmts.append)
+        store.add_edge("a", "b", provenance="test")
+        store.conn.set_trace_callback(None)
+        assert [s for s in stmts if s.split()[0] in ("BEGIN", "COMMIT")] == [
+            "BEGIN IMMEDIATE", "COMMIT"]
+        assert store.recent_activity(1)[0]["action"] == "add_edge"
+
+    def test_add_edges_bulk(self, store):
+        for nid in ("a", "b", "c"):
+            store.add_node(nid.upper(), node_id=nid)
+        store.add_edges_bulk([("a", "b", "implements", "p1"),
+                              ("a", "c", "relates_to", "p2")], weight=0.6)
+        assert {(e["to_id"], e["type"]) for e in store.edges_from("a")} == {
+            ("b", "implements"), ("c", "relates_to")}
+        back = store.edges_from("b")
+        assert back[0]["to_id"] == "a"
+        assert back[0]["weight"] == pytest.approx(0.48)
+
     def test_edges_from(self, store):
         store.add_node("X", node_id="x")
         store.add_node("Y", node_id="y")
@@ -106,6 +381,40 @@ class TestEdgeOperations:
         assert len(orphans) == 1
         assert orphans[0]["id"] == "lonely"
 
+    def test_orphans_one_directional_edge(self, store):
+        for nid in ("src", "dst", "lonely"):
+            store.add_node(nid.title(), node_id=nid)
+        store.add_edge("src", "dst", bidirectional=False)
+        assert [n["id"] for n in store.orphans()] == ["lonely"]
+
+
+class TestSkillEvidence:
+    def test_evidence_appends_to_one_edge(self, store):
+        store.record_skill_evidence("dana", "SQL", "tuned a query", source="pr-1")
+        store.record_skill_evidence("dana", "SQL", "wrote a migration")
+        person = store.get_node_by_title("dana")
+        skill = store.get_node_by_title("SQL")
+        edges = [e for e in store.edges_from(person["id"]) if e["type"] == "demonstrates"]
+        assert len(edges) == 1
+        prov = json.loads(edges[0]["provenance"])
+        assert [p["evidence"] for p in prov] == ["tuned a query", "wrote a migration"]
+        assert prov[0]["source"] == "pr-1"
+        assert skill["weight"] == pytest.approx(0.6)
+
+    def test_evidence_does_not_touch_skill(self, store):
+        store.add_node("Go", node_id="go", node_type="skill")
+        store.record_skill_evidence("fay", "Go", "shipped a service")
+        assert "go" not in store._touch_buffer
+
+    def test_evidence_wraps_legacy_provenance(self, store):
+        store.add_node("Erin", node_id="erin", node_type="person")
+        store.add_node("Rust", node_id="rust", node_type="skill")
+        store.add_edge("erin", "rust", edge_type="demonstrates",
+                       provenance='{"evidence": "old"}', bidirectional=False)
+        store.record_skill_evidence("erin", "Rust", "new")
+        prov = json.loads(store.edges_from("erin")[0]["provenance"])
+        assert [p["evidence"] for p in prov] == ["old", "new"]
+
 
 class TestFTS:
     def test_fts_search(self, store):
@@ -116,11 +425,172 @@ class TestFTS:
         assert len(results) >= 1
         assert results[0]["id"] == "stig"
 
+    def test_writes_only_append_to_fts(self, store):
+        store.conn  # schema/migrations run before tracing starts
+        statements = []
+        store.conn.set_trace_callback(statements.append)
+        store.add_node("ASD Patent", node_id="asd", aka=["Adaptive Sound Design"])
+        store.update_node("asd", content="Patent filing")
+        store.conn.set_trace_callback(None)
+
+        assert statements
+        assert not [s for s in statements if "optimize" in s or "rebuild" in s]
+        assert [r["id"] for r in store.fts_search("Adaptive Sound")] == ["asd"]
+
+    def test_fts_search_without_materialized_cte(self, store, monkeypatch):
+        from kindex import store as store_mod
+
+        monkeypatch.setattr(store_mod, "_MATERIALIZED", "")
+        store.add_node("Stigmergy Coordination", content="Agents", node_id="stig")
+        store.add_node("Notes", content="mentions stigmergy once", node_id="note")
+        results = store.fts_search("stigmergy")
+        assert [r["id"] for r in results] == ["stig", "note"]
+        assert results[0]["rank"] < 0  # BM25 rank, not the LIKE fallback's 0
+
     def test_fts_no_results(self, store):
         store.add_node("Something", content="content")
         results = store.fts_search("zzzznonexistent")
         assert results == []
 
+    def test_fts_title_hit_outranks_body_mention(self, store):
+        store.add_node("Notes", content="A long note that mentions pheromone once "
+                       "among many other words about scheduling and planning",
+                       node_id="body")
+        store.add_node("Pheromone", content="Trail strength", node_id="title")
+        assert [r["id"] for r in store.fts_search("pheromone")] == ["title", "body"]
+
+    def test_fts_limit_applies_after_superseded_filter(self, store):
+        for i in range(3):
+            store.add_node("Pheromone trail", node_id=f"old{i}", status="superseded")
+        store.add_node("Pheromone", content="Trail strength", node_id="live")
+        assert [r["id"] for r in store.fts_search("pheromone", limit=1)] == ["live"]
+
+    def test_build_fts_query(self):
+        from kindex.store import _build_fts_query
+
+        assert _build_fts_query("Graph-DB: tuning!") == (
+            '"graph db tuning" OR graph* OR db* OR tuning*', "graph db tuning")
+        assert _build_fts_query("a b")[0] == '"a b" OR a OR b'
+        assert _build_fts_query("?!") is None
+        assert _build_fts_query("Graph-DB: tuning!") is _build_fts_query("Graph-DB: tuning!")
+
+    def test_fts_stems_terms(self, store):
+        store.add_node("Indexing Strategies", content="How we index nodes", node_id="idx")
+        results = store.fts_search("indexes")
+        assert [r["id"] for r in results] == ["idx"]
+
+    def test_fts_matches_prefixes(self, store):
+        store.add_node("Stigmergy Coordination", content="Agents", node_id="stig")
+        store.add_node("Database Design", content="Schema", node_id="db")
+        assert [r["id"] for r in store.fts_search("stig")] == ["stig"]
+        assert [r["id"] for r in store.fts_search("stigmergy")] == ["stig"]
+
+    def test_v7_fts_table_migrated(self, tmp_path):
+        cfg = Config(data_dir=str(tmp_path))
+        s = Store(cfg)
+        s.add_node("Stigmergy", content="Indirect coordination", node_id="stig")
+        s.conn.executescript("""
+            DROP TABLE nodes_fts;
+            CREATE VIRTUAL TABLE nodes_fts USING fts5(
+                id UNINDEXED, title, content, aka, intent, domains,
+                content=nodes, content_rowid=rowid
+            );
+            INSERT INTO nodes_fts(nodes_fts) VALUES('rebuild');
+            UPDATE meta SET value = '7' WHERE key = 'schema_version';
+        """)
+        s.close()
+
+        s = Store(cfg)
+        sql = s.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'nodes_fts'"
+        ).fetchone()[0]
+        assert "prefix='2 3 4'" in sql
+        assert [r["id"] for r in s.fts_search("stigmergy")] == ["stig"]
+        assert s.get_meta("schema_version") == str(SCHEMA_VERSION)
+        s.close()
+
+    def test_v8_update_trigger_migrated(self, tmp_path):
+        cfg = Config(data_dir=str(tmp_path))
+        s = Store(cfg)
+        s.conn.executescript("""
+            DROP TRIGGER nodes_au;
+            CREATE TRIGGER nodes_au AFTER UPDATE ON nodes BEGIN
+                SELECT 1;
+            END;
+            UPDATE meta SET value = '8' WHERE key = 'schema_version';
+        """)
+        s.close()
+
+        s = Store(cfg)
+        sql = s.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'nodes_au'"
+        ).fetchone()[0]
+        assert "UPDATE OF id, title, content" in sql
+        nid = s.add_node("Old title")
+        s.update_node(nid, title="Renamed")
+        assert [r["id"] for r in s.fts_search("renamed")] == [nid]
+        s.close()
+
+    def test_v9_session_columns_migrated(self, tmp_path):
+        from kindex.sessions import get_active_tag, start_tag
+
+        cfg = Config(data_dir=str(tmp_path))
+        s = Store(cfg)
+        start_tag(s, "migrated", project_path="/tmp/proj")
+        s.conn.executescript("""
+            DROP INDEX idx_nodes_session_status;
+            ALTER TABLE nodes DROP COLUMN session_status_g;
+            ALTER TABLE nodes DROP COLUMN project_path_g;
+            UPDATE meta SET value = '9' WHERE key = 'schema_version';
+        """)
+        s.close()
+
+        s = Store(cfg)
+        assert get_active_tag(s, project_path="/tmp/proj")["title"] == "migrated"
+        assert "session_status_g" not in s.get_node_by_title("migrated")
+        s.close()
+
+    def test_aka_lookup_tracks_inserts_updates_deletes(self, store):
+        nid = store.add_node("Knowledge Graph", aka=["KG", "Graph DB"])
+        assert store.get_node_by_title("kg")["id"] == nid
+        assert store.get_node_by_title("GRAPH db")["id"] == nid
+
+        store.update_node(nid, aka=["kgraph"])
+        assert store.get_node_by_title("kg") is None
+        assert store.get_node_by_title("KGraph")["id"] == nid
+
+        store.add_node("Replaced", node_id=nid, aka=["other"])  # INSERT OR REPLACE
+        assert store.get_node_by_title("kgraph") is None
+        assert store.get_node_by_title("other")["id"] == nid
+
+        store.delete_node(nid)
+        assert store.get_node_by_title("other") is None
+
+    def test_v10_aka_table_backfilled(self, tmp_path):
+        cfg = Config(data_dir=str(tmp_path))
+        s = Store(cfg)
+        nid = s.add_node("Knowledge Graph", aka=["KG"])
+        s.conn.executescript("""
+            DROP TRIGGER nodes_aka_ai;
+            DROP TRIGGER nodes_aka_ad;
+            DROP TRIGGER nodes_aka_au;
+            DROP TABLE node_aka;
+            UPDATE meta SET value = '10' WHERE key = 'schema_version';
+        """)
+        s.close()
+
+        s = Store(cfg)
+        assert s.get_node_by_title("kg")["id"] == nid
+        s.close()
+
+    def test_fts_tracks_indexed_updates_only(self, store):
+        nid = store.add_node("Alpha", content="first body")
+        store.get_node(nid)  # last_accessed touch: no FTS churn
+        store.update_node(nid, content="second body")
+        assert [r["id"] for r in store.fts_search("second")] == [nid]
+        assert store.fts_search("first") == []
+        assert [r["id"] for r in store.fts_search("alpha")] == [nid]
+
 
 class TestTagFiltering:
     def test_all_nodes_filter_single_tag(self, store):
@@ -185,3 +655,11 @@ class TestStats:
         s = store.stats()
         assert s["nodes"] == 2
         assert s["edges"] >= 1
+
+    def test_stats_counts_orphans_and_types(self, store):
+        store.add_node("A", node_id="a")
+        store.add_node("B", node_id="b", node_type="skill")
+        store.add_node("Lonely", node_id="lonely", node_type="skill")
+        store.add_edge("a", "b")
+        assert store.stats() == {"nodes": 3, "edges": 2, "orphans": 1,
+                                 "types": {"concept": 1, "skill": 2}}
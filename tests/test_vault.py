@@ -1,7 +1,11 @@
 """Tests for vault loading, parsing, and writing."""
 
+import pytest
+
 from kindex.models import Edge, SkillNode, TopicNode
-from kindex.vault import Vault, parse_frontmatter
+from kindex.vault import (
+    Vault, parse_frontmatter, read_frontmatter_only, serialize_frontmatter,
+)
 
 
 class TestParseFrontmatter:
@@ -18,6 +22,9 @@ class TestParseFrontmatter:
         meta, body = parse_frontmatter(f)
         assert meta == {}
 
+        f.write_bytes(b"---\r\ntopic: open\r\nBody.")
+        assert parse_frontmatter(f) == ({}, "---\ntopic: open\nBody.")
+
     def test_crlf(self, tmp_path):
         f = tmp_path / "t.md"
         f.write_bytes(b"---\r\ntopic: bar\r\n---\r\nBody\r\n")
@@ -25,6 +32,25 @@ class TestParseFrontmatter:
         assert meta["topic"] == "bar"
         assert "\r" not in body
 
+    def test_round_trip_and_bad_yaml(self, tmp_path):
+        meta = {"topic": "café", "weight": 0.5, "connects_to": [{"target": "b"}]}
+        f = tmp_path / "t.md"
+        f.write_text(serialize_frontmatter(meta, "Body."), encoding="utf-8")
+        assert parse_frontmatter(f) == (meta, "Body.")
+
+        f.write_text("---\ntopic: [unclosed\n---\nBody.")
+        assert parse_frontmatter(f)[0] == {}
+
+    def test_frontmatter_only_matches_full_parse(self, tmp_path):
+        f = tmp_path / "t.md"
+        for text in ["---\ntopic: a\ntags: [x]\n---\nBody --- more.",
+                     "---\r\ntopic: b\r\n---\r\nBody",
+                     "---\ntopic: [unclosed\n---\nBody.",
+                     "---\ntopic: never closed\n",
+                     "# No frontmatter", "", "---"]:
+            f.write_bytes(text.encode("utf-8"))
+            assert read_frontmatter_only(f) == parse_frontmatter(f)[0]
+
 
 class TestVaultLoad:
     def test_loads_topics(self, sample_vault):
@@ -59,6 +85,15 @@ class TestVaultLoad:
         beta = sample_vault.get("beta")
         assert beta.custom_field == "preserved value"
 
+    def test_load_without_bodies_reads_them_on_demand(self, sample_config):
+        vault = Vault(sample_config).load(bodies=False)
+        full = Vault(sample_config).load()
+        assert vault.all_slugs() == full.all_slugs()
+        assert vault.topics["beta"].custom_field == "preserved value"
+        assert vault.topics["alpha"].body == ""
+        assert vault.read_body(vault.topics["alpha"]) == full.topics["alpha"].body != ""
+        assert vault.read_body(full.topics["alpha"]) == full.topics["alpha"].body
+
 
 class TestVaultWrite:
     def test_save_topic(self, tmp_vault):
@@ -81,6 +116,19 @@ class TestVaultWrite:
         assert "go" in reloaded.skills
         assert reloaded.skills["go"].level == "proficient"
 
+    def test_atomic_write_stays_in_target_dir(self, tmp_vault, monkeypatch):
+        import tempfile
+
+        dirs = []
+        real = tempfile.mkstemp
+        monkeypatch.setattr(tempfile, "mkstemp",
+                            lambda **kw: dirs.append(kw["dir"]) or real(**kw))
+        node = TopicNode(topic="t", slug="t", title="T", body="Body.")
+        tmp_vault.save_topic(node)
+
+        assert dirs == [tmp_vault.config.topics_dir]
+        assert [p.name for p in tmp_vault.config.topics_dir.iterdir()] == ["t.md"]
+
     def test_add_edge(self, tmp_vault):
         a = TopicNode(topic="a", slug="a", title="A", body="# A\n")
         b = TopicNode(topic="b", slug="b", title="B", body="# B\n")
@@ -94,3 +142,115 @@ class TestVaultWrite:
         reloaded = Vault(tmp_vault.config).load()
         edges = reloaded.edges_from("a")
         assert any(e.target == "b" for e in edges)
+
+    def test_reload_reparses_only_changed_files(self, tmp_vault, monkeypatch):
+        from kindex import vault as vault_mod
+
+        for slug in ("a", "b"):
+            tmp_vault.save_topic(TopicNode(topic=slug, slug=slug, title=slug.upper(),
+                                           tags=["x"], body="Body."))
+        tmp_vault.load()
+        parsed = []
+        real = vault_mod.parse_frontmatter
+        monkeypatch.setattr(vault_mod, "parse_frontmatter",
+                            lambda f: parsed.append(f.stem) or real(f))
+
+        tmp_vault.topics["a"].tags.append("mutated")
+        tmp_vault.load()
+        assert parsed == []
+        assert tmp_vault.topics["a"].tags == ["x"]
+
+        tmp_vault.save_topic(TopicNode(topic="b", slug="b", title="Changed",
+                                       body="Longer body."))
+        tmp_vault.load()
+        assert parsed == ["b"]
+        assert tmp_vault.topics["b"].title == "Changed"
+
+    def test_parallel_load_keeps_name_order(self, tmp_vault, monkeypatch):
+        from kindex import vault as vault_mod
+
+        monkeypatch.setattr(vault_mod, "_PARALLEL_PARSE_MIN", 2)
+        for i in range(10):
+            tmp_vault.save_topic(TopicNode(topic=f"t{i}", slug=f"t{i}",
+                                           title=f"T{i}", body="Body."))
+        (tmp_vault.config.topics_dir / "t3.md").write_text("no frontmatter")
+
+        tmp_vault.load()
+        assert list(tmp_vault.topics) == [f"t{i}" for i in range(10)]
+        assert tmp_vault.topics["t7"].title == "T7"
+        assert not tmp_vault.topics["t3"].has_frontmatter
+
+    def test_save_many_matches_individual_saves(self, tmp_vault, monkeypatch):
+        from kindex import vault as vault_mod
+
+        monkeypatch.setattr(vault_mod, "_PARALLEL_PARSE_MIN", 2)
+        nodes = [TopicNode(topic=f"t{i}", slug=f"t{i}", title=f"T{i}",
+                           body=f"Body {i}.") for i in range(5)]
+        nodes.append(SkillNode(skill="s", slug="s", title="S", body="Skill."))
+        tmp_vault.save_many(nodes)
+
+        reloaded = Vault(tmp_vault.config).load()
+        assert sorted(reloaded.topics) == [f"t{i}" for i in range(5)]
+        assert reloaded.topics["t4"].body.strip() == "Body 4."
+        assert reloaded.skills["s"].title == "S"
+
+    @pytest.mark.parametrize("parallel_min", [2, 1000])
+    def test_save_many_attempts_every_write(self, tmp_vault, monkeypatch, parallel_min):
+        from kindex import vault as vault_mod
+
+        monkeypatch.setattr(vault_mod, "_PARALLEL_PARSE_MIN", parallel_min)
+        blocker = tmp_vault.config.topics_dir / "blocker"
+        blocker.write_text("not a directory")
+        bad = TopicNode(topic="bad", slug="bad", title="Bad", body="x",
+                        path=blocker / "bad.md")
+        good = TopicNode(topic="good", slug="good", title="Good", body="Kept.")
+        with pytest.raises(OSError):
+            tmp_vault.save_many([bad, good])
+        assert (tmp_vault.config.topics_dir / "good.md").exists()
+
+    def test_body_only_save_reuses_frontmatter(self, tmp_vault, monkeypatch):
+        from kindex import vault as vault_mod
+
+        tmp_vault.save_topic(TopicNode(topic="a", slug="a", title="A",
+                                       tags=["x"], body="Old."))
+        tmp_vault.load()
+        serialized = []
+        real = vault_mod.serialize_frontmatter
+        monkeypatch.setattr(vault_mod, "serialize_frontmatter",
+                            lambda *a: serialized.append(a) or real(*a))
+
+        node = tmp_vault.topics["a"]
+        node.body = "New body."
+        tmp_vault.save_topic(node)
+        node.body = "Newer body."
+        tmp_vault.save_topic(node)
+        assert serialized == []
+        assert Vault(tmp_vault.config).load().topics["a"].body == "Newer body."
+
+        node.title = "Retitled"
+        tmp_vault.save_topic(node)
+        assert len(serialized) == 1
+        reloaded = Vault(tmp_vault.config).load().topics["a"]
+        assert (reloaded.title, reloaded.tags, reloaded.body) == ("Retitled", ["x"], "Newer body.")
+
+    def test_save_after_frontmatter_only_load_keeps_body(self, tmp_vault):
+        for slug in ("a", "b"):
+            tmp_vault.save_topic(TopicNode(topic=slug, slug=slug, title=slug.upper(),
+                                           body=f"Body {slug}."))
+        lazy = Vault(tmp_vault.config).load(bodies=False)
+        lazy.topics["a"].title = "Retitled"
+        lazy.save_topic(lazy.topics["a"])
+        lazy.topics["b"].title = "Also retitled"
+        lazy.save_many([lazy.topics["b"]])
+
+        reloaded = Vault(tmp_vault.config).load()
+        assert reloaded.topics["a"].body.strip() == "Body a."
+        assert reloaded.topics["b"].body.strip() == "Body b."
+        assert reloaded.topics["a"].title == "Retitled"
+
+    def test_body_cleared_after_frontmatter_only_load_stays_cleared(self, tmp_vault):
+        tmp_vault.save_topic(TopicNode(topic="a", slug="a", title="A", body="Body a."))
+        lazy = Vault(tmp_vault.config).load(bodies=False)
+        lazy.topics["a"].body = ""
+        lazy.save_topic(lazy.topics["a"])
+        assert Vault(tmp_vault.config).load().topics["a"].body.strip() == ""
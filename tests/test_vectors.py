@@ -4,6 +4,8 @@ import json
 from types import SimpleNamespace
 from unittest.mock import patch
 
+import numpy as np
+
 from kindex import vectors
 from kindex.vectors import (
     _check_vec, _chunk_text, _embed_voyage, _resolve_embedding_config,
@@ -150,7 +152,7 @@ class TestEmbedTextDispatch:
         config = Config(embedding=EmbeddingConfig(provider="local"))
         with patch("kindex.vectors._embed_local", return_value=[0.1, 0.2]) as mock_embed:
             result = embed_text("test", config=config)
-        mock_embed.assert_called_once_with("test", "all-MiniLM-L6-v2")
+        mock_embed.assert_called_once_with("test", "all-MiniLM-L6-v2", "torch")
         assert result == [0.1, 0.2]
 
     def test_voyage_context_model_uses_contextualized_endpoint(self):
@@ -261,6 +263,39 @@ class TestEmbedTextDispatch:
             "input_type": "query",
         }
 
+    def test_vector_search_resolves_chunks_and_nodes_in_one_query(self, tmp_path, monkeypatch):
+        store = Store(Config(data_dir=str(tmp_path)))
+        try:
+            store.add_node("Alpha", node_id="a")
+            store.add_node("Beta", node_id="b")
+            store.add_node("Old", node_id="old", status="superseded")
+            # Stand-in for vec0: a plain table whose MATCH always succeeds.
+            store.conn.create_function("match", 2, lambda *_: 1)
+            store.conn.execute(
+                "CREATE TABLE node_vectors (node_id TEXT, embedding BLOB, distance REAL)")
+            vectors._ensure_vector_meta_table(store)
+            store.conn.executemany(
+                "INSERT INTO node_vectors VALUES (?, x'', ?)",
+                [("b#0001", 0.1), ("old", 0.2), ("b#0000", 0.3), ("a", 0.4)])
+            store.conn.executemany(
+                "INSERT INTO node_vector_meta (vector_id, node_id, chunk_index, chunk_count) "
+                "VALUES (?, 'b', ?, 2)", [("b#0000", 0), ("b#0001", 1)])
+            store.conn.commit()
+            monkeypatch.setattr(vectors, "ensure_vec_table", lambda store: True)
+            monkeypatch.setattr(vectors, "embed_text", lambda *a, **k: [0.0])
+
+            stmts = []
+            store.conn.set_trace_callback(stmts.append)
+            results = vector_search(store, "q", top_k=5)
+            store.conn.set_trace_callback(None)
+
+            assert [(r["id"], r["vec_distance"]) for r in results] == [("b", 0.1), ("a", 0.4)]
+            assert results[0]["vec_chunk_index"] == 1
+            assert "vec_chunk_index" not in results[1]
+            assert len([s for s in stmts if s.lstrip().startswith(("WITH", "SELECT"))]) == 1
+        finally:
+            store.close()
+
     def test_chunk_text_uses_overlap(self):
         assert _chunk_text("abcdefghij", chunk_chars=4, overlap_chars=1) == [
             "abcd", "defg", "ghij",
@@ -329,6 +364,131 @@ class TestEmbedTextDispatch:
         finally:
             store.close()
 
+    def test_index_all_nodes_encodes_local_texts_in_one_batch(self, tmp_path, monkeypatch):
+        store = Store(Config(data_dir=str(tmp_path),
+                             embedding=EmbeddingConfig(provider="local")))
+        try:
+            store.conn.execute(
+                "CREATE TABLE node_vectors (node_id TEXT PRIMARY KEY, embedding BLOB)"
+            )
+            vectors._ensure_vector_meta_table(store)
+            store.add_node("Alpha", content="one")
+            store.add_node("Beta", content="two")
+            calls = []
+
+            class FakeModel:
+                def encode(self, texts, **kwargs):
+                    calls.append((list(texts), kwargs))
+                    return np.full((len(texts), 2), 0.5, dtype=np.float32)
+
+            monkeypatch.setattr(vectors, "ensure_vec_table", lambda store: True)
+            monkeypatch.setattr(vectors, "_get_model", lambda name, backend="torch": FakeModel())
+
+            assert vectors.index_all_nodes(store) == 2
+            assert len(calls) == 1
+            assert sorted(calls[0][0]) == ["Alpha one", "Beta two"]
+            assert calls[0][1]["batch_size"] == vectors.EMBED_BATCH_SIZE
+            assert store.conn.execute(
+                "SELECT COUNT(*) FROM node_vector_meta").fetchone()[0] == 2
+        finally:
+            store.close()
+
+    def test_index_all_nodes_skips_fresh_embeddings(self, tmp_path, monkeypatch):
+        store = Store(Config(data_dir=str(tmp_path),
+                             embedding=EmbeddingConfig(provider="local")))
+        try:
+            store.conn.execute(
+                "CREATE TABLE node_vectors (node_id TEXT PRIMARY KEY, embedding BLOB)"
+            )
+            vectors._ensure_vector_meta_table(store)
+            store.add_node("Alpha", content="one", node_id="a")
+            store.add_node("Beta", content="two", node_id="b")
+            embedded = []
+            monkeypatch.setattr(vectors, "ensure_vec_table", lambda store: True)
+            monkeypatch.setattr(vectors, "_embed_texts", lambda texts, config, **kw: (
+                embedded.extend(texts) or [[0.5] for _ in texts]))
+
+            assert vectors.index_all_nodes(store) == 2
+            assert vectors.index_all_nodes(store) == 0
+            store.update_node("b", content="changed")
+            assert vectors.index_all_nodes(store) == 1
+            assert embedded[-1] == "Beta changed"
+        finally:
+            store.close()
+
+    def test_bulk_upsert_replaces_chunks_in_one_commit(self, tmp_path):
+        store = Store(Config(data_dir=str(tmp_path)))
+        try:
+            store.conn.execute(
+                "CREATE TABLE node_vectors (node_id TEXT PRIMARY KEY, embedding BLOB)"
+            )
+            store.conn.commit()
+            chunk = lambda i: {"index": i, "text": "t", "embedding": [0.1],
+                               "text_hash": "h", "token_estimate": 1}
+            vectors.bulk_upsert_embeddings(store, [("a", [chunk(0), chunk(1)])])
+
+            stmts = []
+            store.conn.set_trace_callback(stmts.append)
+            written = vectors.bulk_upsert_embeddings(
+                store, [("a", [chunk(0)]), ("b", [chunk(0)]), ("c", [])])
+            store.conn.set_trace_callback(None)
+
+            assert written == 2
+            assert [s for s in stmts if s.split()[0] in ("BEGIN", "COMMIT")] == [
+                "BEGIN IMMEDIATE", "COMMIT"]
+            assert [r["node_id"] for r in store.conn.execute(
+                "SELECT node_id FROM node_vectors ORDER BY node_id")] == ["a", "b"]
+            assert [r["vector_id"] for r in store.conn.execute(
+                "SELECT vector_id FROM node_vector_meta ORDER BY vector_id")] == ["a", "b"]
+        finally:
+            store.close()
+
+    def test_serialize_vec_packs_float32_for_lists_and_arrays(self):
+        import struct
+
+        values = [0.25, -1.5, 3.0]
+        expected = struct.pack("<3f", *values)
+        assert vectors._serialize_vec(values) == expected
+        assert vectors._serialize_vec(np.array(values, dtype=np.float32)) == expected
+        assert vectors._serialize_vec(np.array(values, dtype=np.float64)) == expected
+
+    def test_int8_quantization_is_opt_in(self):
+        plain = Config(embedding=EmbeddingConfig(provider="local"))
+        quantized = Config(embedding=EmbeddingConfig(provider="local", quantization="int8"))
+
+        assert "quantization" not in json.loads(vectors.embedding_fingerprint(plain))
+        assert json.loads(vectors.embedding_fingerprint(quantized))["quantization"] == "int8"
+
+        packed = vectors._serialize_vec([3.0, -4.0, 0.0], "int8")
+        assert np.frombuffer(packed, dtype=np.int8).tolist() == [76, -102, 0]
+
+    def test_local_onnx_backend_loads_quantized_export(self, monkeypatch):
+        import sys
+        import types
+
+        loaded = []
+
+        class FakeST:
+            def __init__(self, name, **kwargs):
+                loaded.append((name, kwargs))
+
+            def encode(self, text, **kwargs):
+                return np.ones(2, dtype=np.float32)
+
+        monkeypatch.setitem(sys.modules, "sentence_transformers",
+                            types.SimpleNamespace(SentenceTransformer=FakeST))
+        monkeypatch.setattr(vectors, "_MODEL", None)
+        config = Config(embedding=EmbeddingConfig(provider="local", backend="onnx-int8"))
+
+        embed_text("a", config=config)
+        embed_text("b", config=config)
+        assert len(loaded) == 1
+        assert loaded[0][1]["backend"] == "onnx"
+        assert loaded[0][1]["model_kwargs"]["file_name"].endswith("qint8_avx512_vnni.onnx")
+        assert json.loads(vectors.embedding_fingerprint(config))["backend"] == "onnx-int8"
+        assert "backend" not in json.loads(vectors.embedding_fingerprint(
+            Config(embedding=EmbeddingConfig(provider="local"))))
+
     def test_reindex_selection_estimate_and_enqueue(self, tmp_path):
         store = Store(Config(data_dir=str(tmp_path)))
         try: